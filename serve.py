@@ -1,3 +1,4 @@
+import concurrent.futures
 import json
 import logging
 import traceback
@@ -26,7 +27,13 @@ class CustomJson:
     @staticmethod
     def dumps(obj, **kwargs):
         """Dumps an object into a JSON string representing it."""
-        return json.dumps(obj, default=tibiapy.abc.Serializable._try_dict)
+        return json.dumps(tibiapy.abc.Serializable._to_dict_value(obj))
+
+    @staticmethod
+    def response(obj):
+        """Creates a JSON response for an object, encoding it directly into bytes, using orjson if available."""
+        return web.Response(body=tibiapy.abc.Serializable._dumps_bytes(obj, fast=True),
+                            content_type="application/json")
 
     @staticmethod
     def loads(s, **kwargs):
@@ -62,13 +69,13 @@ async def get_current_auctions(request: web.Request):
     filters.order = try_enum(tibiapy.AuctionOrder, request.query.get("order"))
     filters.item = request.query.get("item")
     auctions = await app["tibiapy"].fetch_current_auctions(page, filters)
-    return web.json_response(auctions, dumps=CustomJson.dumps)
+    return CustomJson.response(auctions)
 
 
 @routes.get('/auctions/history')
 async def get_auction_history(request: web.Request):
     boosted = await app["tibiapy"].fetch_auction_history()
-    return web.json_response(boosted, dumps=CustomJson.dumps)
+    return CustomJson.response(boosted)
 
 
 @routes.get('/auctions/{auction_id}')
@@ -80,13 +87,13 @@ async def get_auction(request: web.Request):
     skip_details = int(request.query.get("skip_details", 0))
     boosted = await app["tibiapy"].fetch_auction(int(auction_id), fetch_items=fetch_items, fetch_mounts=fetch_mounts,
                                                  fetch_outfits=fetch_outfits, skip_details=skip_details)
-    return web.json_response(boosted, dumps=CustomJson.dumps)
+    return CustomJson.response(boosted)
 
 
 @routes.get('/boostedcreature/')
 async def get_boosted_creature(request: web.Request):
     boosted = await app["tibiapy"].fetch_boosted_creature()
-    return web.json_response(boosted, dumps=CustomJson.dumps)
+    return CustomJson.response(boosted)
 
 
 @routes.get('/events/')
@@ -99,7 +106,7 @@ async def get_event_schedule(request: web.Request):
     if month:
         month = int(month)
     calendar = await app["tibiapy"].fetch_event_schedule(month, year)
-    return web.json_response(calendar, dumps=CustomJson.dumps)
+    return CustomJson.response(calendar)
 
 
 @routes.get('/cmposts/{start_date}/{end_date}/')
@@ -110,31 +117,31 @@ async def get_cm_post_archive(request: web.Request):
     start_date = datetime.datetime.strptime(start_date_str, "%Y-%m-%d")
     end_date = datetime.datetime.strptime(end_date_str, "%Y-%m-%d")
     cm_post_archive = await app["tibiapy"].fetch_cm_post_archive(start_date, end_date, page)
-    return web.json_response(cm_post_archive, dumps=CustomJson.dumps)
+    return CustomJson.response(cm_post_archive)
 
 
 @routes.get('/forums/community/')
 async def get_community_boards(request: web.Request):
     boards = await app["tibiapy"].fetch_forum_community_boards()
-    return web.json_response(boards, dumps=CustomJson.dumps)
+    return CustomJson.response(boards)
 
 
 @routes.get('/forums/support/')
 async def get_support_boards(request: web.Request):
     boards = await app["tibiapy"].fetch_forum_support_boards()
-    return web.json_response(boards, dumps=CustomJson.dumps)
+    return CustomJson.response(boards)
 
 
 @routes.get('/forums/world/')
 async def get_world_boards(request: web.Request):
     boards = await app["tibiapy"].fetch_forum_world_boards()
-    return web.json_response(boards, dumps=CustomJson.dumps)
+    return CustomJson.response(boards)
 
 
 @routes.get('/forums/trade/')
 async def get_trade_boards(request: web.Request):
     boards = await app["tibiapy"].fetch_forum_trade_boards()
-    return web.json_response(boards, dumps=CustomJson.dumps)
+    return CustomJson.response(boards)
 
 
 @routes.get('/forums/thread/{thread_id}')
@@ -142,21 +149,21 @@ async def get_forum_thread(request: web.Request):
     thread_id = request.match_info['thread_id']
     page = int(request.query.get("page", 1))
     thread = await app["tibiapy"].fetch_forum_thread(int(thread_id), page)
-    return web.json_response(thread, dumps=CustomJson.dumps)
+    return CustomJson.response(thread)
 
 
 @routes.get('/forums/post/{post_id}')
 async def get_forum_post(request: web.Request):
     post_id = request.match_info['post_id']
     post = await app["tibiapy"].fetch_forum_post(int(post_id))
-    return web.json_response(post, dumps=CustomJson.dumps)
+    return CustomJson.response(post)
 
 
 @routes.get('/forums/announcement/{announcement_id}/')
 async def get_forum_announcement(request: web.Request):
     announcement_id = request.match_info['announcement_id']
     announcement = await app["tibiapy"].fetch_forum_announcement(int(announcement_id))
-    return web.json_response(announcement, dumps=CustomJson.dumps)
+    return CustomJson.response(announcement)
 
 
 @routes.get('/forums/announcement/{announcement_id}/html/')
@@ -172,35 +179,35 @@ async def get_board_threads(request: web.Request):
     page = int(request.query.get("page", 1))
     age = int(request.query.get("age", 30))
     board = await app["tibiapy"].fetch_forum_board(int(board_id), page, age)
-    return web.json_response(board, dumps=CustomJson.dumps)
+    return CustomJson.response(board)
 
 
 @routes.get('/characters/{name}/')
 async def get_character(request: web.Request):
     name = request.match_info['name']
     char = await app["tibiapy"].fetch_character(name)
-    return web.json_response(char, dumps=CustomJson.dumps)
+    return CustomJson.response(char)
 
 
 @routes.get('/guilds/{name}/')
 async def get_guild(request: web.Request):
     name = request.match_info['name']
     guild = await app["tibiapy"].fetch_guild(name)
-    return web.json_response(guild, dumps=CustomJson.dumps)
+    return CustomJson.response(guild)
 
 
 @routes.get('/guilds/{name}/wars/')
 async def get_guild_wars(request: web.Request):
     name = request.match_info['name']
     guild_wars = await app["tibiapy"].fetch_guild_wars(name)
-    return web.json_response(guild_wars, dumps=CustomJson.dumps)
+    return CustomJson.response(guild_wars)
 
 
 @routes.get('/worlds/{name}/guilds/')
 async def get_world_guilds(request: web.Request):
     name = request.match_info['name']
     guild_list = await app["tibiapy"].fetch_world_guilds(name)
-    return web.json_response(guild_list, dumps=CustomJson.dumps)
+    return CustomJson.response(guild_list)
 
 
 @routes.get(r'/highscores/{world}/')
@@ -210,7 +217,7 @@ async def get_highscores(request: web.Request):
     vocations = try_enum(tibiapy.VocationFilter, int(request.query.get("vocation", 0)), tibiapy.VocationFilter.ALL)
     page = int(request.query.get("page", 1))
     highscores = await app["tibiapy"].fetch_highscores_page(world, category, vocations, page)
-    return web.json_response(highscores, dumps=CustomJson.dumps)
+    return CustomJson.response(highscores)
 
 
 @routes.get('/houses/{world}/{town}/')
@@ -221,7 +228,7 @@ async def get_houses(request: web.Request):
     status = try_enum(tibiapy.HouseStatus, request.query.get("status"))
     house_type = try_enum(tibiapy.HouseType, request.query.get("type"), tibiapy.HouseType.HOUSE)
     house_list = await app["tibiapy"].fetch_world_houses(world, town, house_type, status, order)
-    return web.json_response(house_list, dumps=CustomJson.dumps)
+    return CustomJson.response(house_list)
 
 
 @routes.get('/house/{world}/{house_id}/')
@@ -229,27 +236,27 @@ async def get_house(request: web.Request):
     world = request.match_info['world']
     house_id = request.match_info['house_id']
     house = await app["tibiapy"].fetch_house(int(house_id), world)
-    return web.json_response(house, dumps=CustomJson.dumps)
+    return CustomJson.response(house)
 
 
 @routes.get('/killstatistics/{world}/')
 async def get_kill_statistics(request: web.Request):
     world = request.match_info['world']
     kill_statistics = await app["tibiapy"].fetch_kill_statistics(world)
-    return web.json_response(kill_statistics, dumps=CustomJson.dumps)
+    return CustomJson.response(kill_statistics)
 
 
 @routes.get('/worlds/')
 async def get_worlds(request: web.Request):
     worlds = await app["tibiapy"].fetch_world_list()
-    return web.json_response(worlds, dumps=CustomJson.dumps)
+    return CustomJson.response(worlds)
 
 
 @routes.get('/worlds/{name}/')
 async def get_world(request: web.Request):
     name = request.match_info['name']
     world = await app["tibiapy"].fetch_world(name)
-    return web.json_response(world, dumps=CustomJson.dumps)
+    return CustomJson.response(world)
 
 
 @routes.get('/news/recent/')
@@ -261,14 +268,14 @@ async def get_recent_news(request: web.Request):
     else:
         days = 30
     news = await app["tibiapy"].fetch_recent_news(days)
-    return web.json_response(news, dumps=CustomJson.dumps)
+    return CustomJson.response(news)
 
 
 @routes.get('/news/{news_id}/')
 async def get_news(request: web.Request):
     news_id = request.match_info['news_id']
     news = await app["tibiapy"].fetch_news(int(news_id))
-    return web.json_response(news, dumps=CustomJson.dumps)
+    return CustomJson.response(news)
 
 
 @routes.get('/news/{news_id}/html/')
@@ -282,7 +289,7 @@ async def get_news_html(request: web.Request):
 async def get_tournaments(request: web.Request):
     tournament_id = request.match_info['tournament_id']
     tournament = await app["tibiapy"].fetch_tournament(int(tournament_id))
-    return web.json_response(tournament, dumps=CustomJson.dumps)
+    return CustomJson.response(tournament)
 
 
 @routes.get('/tournaments/{tournament_id}/leaderboards/{world}/{page}/')
@@ -291,7 +298,7 @@ async def get_tournaments_leaderboard(request: web.Request):
     world = request.match_info['world']
     page = request.match_info['page']
     tournament = await app["tibiapy"].fetch_tournament_leaderboard(int(tournament_id), world, int(page))
-    return web.json_response(tournament, dumps=CustomJson.dumps)
+    return CustomJson.response(tournament)
 
 
 def json_error(status_code: int, exception: Exception, tb=None) -> web.Response:
@@ -325,13 +332,21 @@ async def error_middleware(app, handler):
 
 
 async def init_client(app):
-    app["tibiapy"] = tibiapy.Client()
+    app["parse_executor"] = concurrent.futures.ProcessPoolExecutor()
+    app["tibiapy"] = tibiapy.Client(parse_executor=app["parse_executor"])
+
+
+async def close_client(app):
+    await app["tibiapy"].session.close()
+    app["parse_executor"].shutdown()
+
 
 if __name__ == "__main__":
     normalize_paths = normalize_path_middleware()
     app = web.Application(middlewares=[error_middleware, normalize_paths])
     app.add_routes(routes)
     app.on_startup.append(init_client)
+    app.on_cleanup.append(close_client)
     print("Registered routes:")
     for route in routes:  # type: RouteDef
         print('\t[%s] %s' % (route.method, route.path))
@@ -47,6 +47,9 @@ extras_require = {
     'docs': [
         'sphinx',
     ],
+    'fast-json': [
+        'orjson',
+    ],
     'test': [
         'asynctest',
         'aioresponses',
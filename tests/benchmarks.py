@@ -0,0 +1,200 @@
+"""Benchmarks the parsers against the resources used by the tests.
+
+Usage: ``python -m tests.benchmarks [--repeat N] [--filter TEXT] [--save] [--baseline PATH] [--tolerance RATIO]``
+
+Every parser is run against its resources, reporting the latency percentiles and the peak memory allocated while
+parsing. If a baseline file exists, the results are compared against it, and the script exits with status 1 if any
+parser regressed. Baselines depend on the machine they were made on, so they should be saved locally with ``--save``.
+
+With ``--serialization``, the size and speed of storing parsed entries as binary snapshots is compared against
+storing them as JSON lines instead.
+"""
+import argparse
+import functools
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from tests.tests_bazaar import FILE_AUCTION_FINISHED, FILE_BAZAAR_CURRENT, FILE_BAZAAR_HISTORY
+from tests.tests_character import FILE_CHARACTER_DEATHS_COMPLEX, FILE_CHARACTER_RESOURCE, \
+    FILE_CHARACTER_TRUNCATED_DEATHS
+from tests.tests_events import FILE_EVENT_CALENDAR
+from tests.tests_forums import FILE_BOARD_THREAD_LIST, FILE_CM_POST_ARCHIVE_PAGES, FILE_THREAD
+from tests.tests_guild import FILE_GUILD_FULL, FILE_GUILD_LIST, FILE_GUILD_WAR_ACTIVE_HISTORY
+from tests.tests_highscores import FILE_HIGHSCORES_EXPERIENCE, FILE_HIGHSCORES_FULL, FILE_HIGHSCORES_LOYALTY
+from tests.tests_house import FILE_HOUSE_FULL, FILE_HOUSE_LIST
+from tests.tests_kill_statistics import FILE_KILL_STATISTICS_FULL
+from tests.tests_news import FILE_NEWS_ARTICLE, FILE_NEWS_LIST
+from tests.tests_tibiapy import MY_PATH, TestCommons
+from tests.tests_tournament import FILE_TOURNAMENT_ARCHIVE, FILE_TOURNAMENT_LEADERBOARD_ENDED, \
+    FILE_TOURNAMENT_SIGN_UP
+from tests.tests_world import FILE_WORLD_FULL, FILE_WORLD_LIST
+from tibiapy import AuctionDetails, Character, CharacterBazaar, CMPostArchive, EventSchedule, ForumBoard, \
+    ForumThread, Guild, GuildWars, Highscores, House, KillStatistics, ListedGuild, ListedHouse, ListedNews, News, \
+    SnapshotReader, SnapshotWriter, Tournament, TournamentLeaderboard, World, WorldOverview
+
+DEFAULT_BASELINE = os.path.join(MY_PATH, "benchmarks_baseline.json")
+
+BENCHMARKS = [
+    ("AuctionDetails.from_content", AuctionDetails.from_content, [FILE_AUCTION_FINISHED]),
+    ("Character.from_content", Character.from_content,
+     [FILE_CHARACTER_RESOURCE, FILE_CHARACTER_DEATHS_COMPLEX, FILE_CHARACTER_TRUNCATED_DEATHS]),
+    ("CharacterBazaar.from_content", CharacterBazaar.from_content, [FILE_BAZAAR_CURRENT, FILE_BAZAAR_HISTORY]),
+    ("CMPostArchive.from_content", CMPostArchive.from_content, [FILE_CM_POST_ARCHIVE_PAGES]),
+    ("EventSchedule.from_content", EventSchedule.from_content, [FILE_EVENT_CALENDAR]),
+    ("ForumBoard.from_content", ForumBoard.from_content, [FILE_BOARD_THREAD_LIST]),
+    ("ForumThread.from_content", ForumThread.from_content, [FILE_THREAD]),
+    ("Guild.from_content", Guild.from_content, [FILE_GUILD_FULL]),
+    ("GuildWars.from_content", GuildWars.from_content, [FILE_GUILD_WAR_ACTIVE_HISTORY]),
+    ("Highscores.from_content", Highscores.from_content,
+     [FILE_HIGHSCORES_FULL, FILE_HIGHSCORES_EXPERIENCE, FILE_HIGHSCORES_LOYALTY]),
+    ("Highscores.from_content(fast=False)", functools.partial(Highscores.from_content, fast=False),
+     [FILE_HIGHSCORES_FULL, FILE_HIGHSCORES_EXPERIENCE, FILE_HIGHSCORES_LOYALTY]),
+    ("House.from_content", House.from_content, [FILE_HOUSE_FULL]),
+    ("KillStatistics.from_content", KillStatistics.from_content, [FILE_KILL_STATISTICS_FULL]),
+    ("ListedGuild.list_from_content", ListedGuild.list_from_content, [FILE_GUILD_LIST]),
+    ("ListedHouse.list_from_content", ListedHouse.list_from_content, [FILE_HOUSE_LIST]),
+    ("ListedNews.list_from_content", ListedNews.list_from_content, [FILE_NEWS_LIST]),
+    ("News.from_content", News.from_content, [FILE_NEWS_ARTICLE]),
+    ("Tournament.from_content", Tournament.from_content, [FILE_TOURNAMENT_SIGN_UP, FILE_TOURNAMENT_ARCHIVE]),
+    ("TournamentLeaderboard.from_content", TournamentLeaderboard.from_content, [FILE_TOURNAMENT_LEADERBOARD_ENDED]),
+    ("World.from_content", World.from_content, [FILE_WORLD_FULL]),
+    ("WorldOverview.from_content", WorldOverview.from_content, [FILE_WORLD_LIST]),
+]
+
+SERIALIZATION_BENCHMARKS = [
+    ("HighscoresEntry", Highscores.from_content, FILE_HIGHSCORES_FULL, lambda highscores: highscores.entries),
+    ("ListedAuction", CharacterBazaar.from_content, FILE_BAZAAR_HISTORY, lambda bazaar: bazaar.entries),
+    ("OnlineCharacter", World.from_content, FILE_WORLD_FULL, lambda world: world.online_players),
+    ("RaceEntry", KillStatistics.from_content, FILE_KILL_STATISTICS_FULL, lambda stats: list(stats.entries.values())),
+]
+
+
+def percentile(values, percent):
+    """Gets the nearest-rank percentile of a sorted list of values."""
+    index = max(0, min(len(values) - 1, int(round(percent / 100 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def measure(parser, content, repeat):
+    """Measures the latency percentiles, in milliseconds, and peak memory allocated, in KiB, of a parser."""
+    parser(content)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser(content)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    tracemalloc.start()
+    try:
+        parser(content)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "p50": percentile(timings, 50),
+        "p90": percentile(timings, 90),
+        "p99": percentile(timings, 99),
+        "peak_kib": peak / 1024,
+    }
+
+
+def dump_json_lines(entries):
+    return b"\n".join(entry.to_json().encode() for entry in entries)
+
+
+def load_json_lines(content, cls):
+    return [cls.from_json(line) for line in content.split(b"\n")]
+
+
+def dump_snapshot(entries):
+    fp = io.BytesIO()
+    SnapshotWriter(fp).write_all(entries)
+    return fp.getvalue()
+
+
+def load_snapshot(content):
+    return list(SnapshotReader(io.BytesIO(content)))
+
+
+def run_serialization_benchmarks(args):
+    """Compares the size and the writing and reading times of JSON lines and binary snapshots."""
+    print(f"{'Entries':<18}{'Format':<10}{'Count':>7}{'Size KiB':>10}{'Ratio':>8}{'Write ms':>10}{'Read ms':>10}")
+    for name, parser, resource, get_entries in SERIALIZATION_BENCHMARKS:
+        if args.filter.lower() not in name.lower():
+            continue
+        entries = get_entries(parser(TestCommons.load_resource(resource)))
+        cls = type(entries[0])
+        json_content = dump_json_lines(entries)
+        snapshot_content = dump_snapshot(entries)
+        for label, content, dump, load in [
+            ("JSON", json_content, dump_json_lines, functools.partial(load_json_lines, cls=cls)),
+            ("Snapshot", snapshot_content, dump_snapshot, load_snapshot),
+        ]:
+            write = measure(dump, entries, args.repeat)
+            read = measure(load, content, args.repeat)
+            print(f"{name:<18}{label:<10}{len(entries):>7}{len(content) / 1024:>10.1f}"
+                  f"{len(json_content) / len(content):>7.2f}x{write['p50']:>10.2f}{read['p50']:>10.2f}")
+    return 0
+
+
+def find_regressions(result, baseline, tolerance):
+    """Gets the metrics of a result that are worse than their baseline by more than the tolerance."""
+    return [metric for metric in ("p50", "peak_kib")
+            if metric in baseline and result[metric] > baseline[metric] * (1 + tolerance)]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Benchmarks the parsers against the test resources.")
+    arg_parser.add_argument("--repeat", type=int, default=20, help="Number of timed runs per resource.")
+    arg_parser.add_argument("--filter", default="", help="Only run parsers whose name contains this text.")
+    arg_parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Path to the baseline file.")
+    arg_parser.add_argument("--save", action="store_true", help="Save the results as the new baseline.")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25,
+                            help="Allowed ratio over the baseline before flagging a regression.")
+    arg_parser.add_argument("--serialization", action="store_true",
+                            help="Compare binary snapshots against JSON instead of benchmarking the parsers.")
+    args = arg_parser.parse_args(argv)
+    if args.serialization:
+        return run_serialization_benchmarks(args)
+
+    baseline = {}
+    if not args.save and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    print(f"{'Parser':<38}{'Resource':<42}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'Peak KiB':>10}  Baseline")
+    for name, parser, resources in BENCHMARKS:
+        if args.filter.lower() not in name.lower():
+            continue
+        for resource in resources:
+            key = f"{name}|{resource}"
+            result = measure(parser, TestCommons.load_resource(resource), args.repeat)
+            results[key] = result
+            comparison = ""
+            if key in baseline:
+                comparison = f"{result['p50'] / baseline[key]['p50']:.2f}x"
+                regressed = find_regressions(result, baseline[key], args.tolerance)
+                if regressed:
+                    regressions.append(key)
+                    comparison += f" REGRESSION ({', '.join(regressed)})"
+            print(f"{name:<38}{resource:<42}{result['p50']:>9.2f}{result['p90']:>9.2f}{result['p99']:>9.2f}"
+                  f"{result['peak_kib']:>10.0f}  {comparison}")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) found.")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
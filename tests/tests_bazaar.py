@@ -1,13 +1,15 @@
 import datetime
 import unittest
+from unittest import mock
 
 from tests.tests_tibiapy import TestCommons
-from tibiapy import AuctionDetails, AuctionOrder, AuctionOrderBy, AuctionSearchType, AuctionStatus, BattlEyeTypeFilter, \
-    BidType, \
-    CharacterBazaar, \
-    InvalidContent, PvpTypeFilter, \
+from tibiapy import AuctionDetails, AuctionOrder, AuctionOrderBy, AuctionQuery, AuctionSearchType, AuctionStatus, \
+    BattlEyeTypeFilter, BidType, \
+    CharacterBazaar, DisplayItem, \
+    InvalidContent, ItemSummary, PvpTypeFilter, \
     Sex, SkillFilter, \
     Vocation, VocationAuctionFilter
+from tibiapy.utils import parse_tibiacom_content
 
 FILE_BAZAAR_CURRENT_EMPTY = "bazaar/tibiacom_history_empty.txt"
 FILE_BAZAAR_CURRENT = "bazaar/tibiacom_current.txt"
@@ -256,6 +258,23 @@ class TestBazaar(TestCommons, unittest.TestCase):
         self.assertEqual(BidType.MINIMUM, auction.bid_type)
         self.assertEqual(AuctionStatus.FINISHED, auction.status)
 
+    def test_auction_details_from_content_finished_sections(self):
+        """Testing parsing only some sections of an auction"""
+        content = self.load_resource(FILE_AUCTION_FINISHED)
+        full_auction = AuctionDetails.from_content(content)
+        auction = AuctionDetails.from_content(content, sections=["General", "Mounts"])
+
+        self.assertEqual("Vireloz", auction.name)
+        self.assertEqual(AuctionStatus.FINISHED, auction.status)
+        self.assertEqual(full_auction.hit_points, auction.hit_points)
+        self.assertEqual(full_auction.available_charm_points, auction.available_charm_points)
+        self.assertEqual(full_auction.skills_map["Distance Fighting"].level,
+                         auction.skills_map["Distance Fighting"].level)
+        self.assertEqual(full_auction.mounts.to_json(), auction.mounts.to_json())
+        self.assertIsNone(auction.items)
+        self.assertIsNone(auction.outfits)
+        self.assertEqual([], auction.blessings)
+
     def test_auction_details_from_content_not_found(self):
         auction = AuctionDetails.from_content(self.load_resource(FILE_AUCTION_NOT_FOUND))
 
@@ -265,4 +284,113 @@ class TestBazaar(TestCommons, unittest.TestCase):
         """Testing parsing an unrelated tibia.com section"""
         content = self.load_resource(self.FILE_UNRELATED_SECTION)
         with self.assertRaises(InvalidContent):
-            AuctionDetails.from_content(content)
\ No newline at end of file
+            AuctionDetails.from_content(content)
+
+    def test_bazaar_lxml_matches_html5lib(self):
+        """Testing that parsing with lxml produces the same results html5lib does"""
+        def parse_html5lib(content, **kwargs):
+            kwargs.pop("builder", None)
+            return parse_tibiacom_content(content, builder="html5lib", **kwargs)
+
+        for resource, parser in [(FILE_BAZAAR_CURRENT, CharacterBazaar.from_content),
+                                 (FILE_BAZAAR_CURRENT_ALL_FILTERS, CharacterBazaar.from_content),
+                                 (FILE_BAZAAR_HISTORY, CharacterBazaar.from_content),
+                                 (FILE_AUCTION_FINISHED, AuctionDetails.from_content)]:
+            with self.subTest(resource=resource):
+                content = self.load_resource(resource)
+                with mock.patch("tibiapy.bazaar.parse_tibiacom_content", parse_html5lib):
+                    expected = parser(content)
+
+                self.assertEqual(expected.to_json(), parser(content).to_json())
+
+    def test_paginated_summary_index_updates(self):
+        """Testing that summary lookups see entries added or replaced after the first lookup"""
+        auction = AuctionDetails.from_content(self.load_resource(FILE_AUCTION_FINISHED))
+        items = auction.items
+
+        self.assertIsNone(items.get_by_name("golden backpack"))
+        self.assertEqual(7, len(items.search("backpack")))
+
+        items.entries.extend([DisplayItem(name="golden backpack", item_id=1), DisplayItem(name="Cigar", item_id=141)])
+
+        self.assertEqual(1, items.get_by_name("Golden Backpack").item_id)
+        self.assertEqual("cigar", items.get_by_id(141).name)
+        self.assertEqual(8, len(items.search("backpack")))
+        self.assertEqual([e for e in items.entries if "pack" in e.name.lower()], items.search("PACK"))
+
+        items.entries[-2] = DisplayItem(name="silver backpack", item_id=2)
+        items.entries[-1] = DisplayItem(name="pipe", item_id=3)
+        self.assertIsNone(items.get_by_name("golden backpack"))
+        self.assertEqual("pipe", items.get_by_id(3).name)
+
+        items.entries[0] = DisplayItem(name="Magic Sword", item_id=99999)
+        self.assertEqual(99999, items.get_by_name("magic sword").item_id)
+        self.assertEqual("Magic Sword", items.get_by_id(99999).name)
+        self.assertEqual([items.entries[0]], items.search("magic sw"))
+
+        items.entries = [DisplayItem(name="crystal coin", item_id=3043)]
+        self.assertEqual([], items.search("backpack"))
+        self.assertEqual(3043, items.get_by_name("Crystal Coin").item_id)
+        self.assertEqual(2, len(ItemSummary(entries=items.entries * 2).search("co")))
+
+    def test_paginated_summary_lookup_cost(self):
+        """Testing that summary lookups don't depend on the number of entries"""
+        def create_summary(count):
+            summary = ItemSummary(entries=[DisplayItem(name=f"Item {i}", item_id=i) for i in range(count)])
+            summary.entries[50] = DisplayItem(name="Magic Sword", item_id=50)
+            return summary
+
+        small_items = create_summary(100)
+        items = create_summary(20000)
+        self.assertEqual([items.entries[50]], items.search("magic sw"))
+
+        def lookup(summary):
+            return summary.get_by_name("Item 60"), summary.get_by_id(60), summary.search("magic sw")
+
+        small_time = self.measure_time(lambda: lookup(small_items))
+        large_time = self.measure_time(lambda: lookup(items))
+
+        self.assertLess(large_time, small_time * 5)
+
+    def test_auction_query_plan(self):
+        """Testing translating auction queries into filters and local conditions"""
+        query = AuctionQuery(worlds=["Antica", "Secura"], vocations=[VocationAuctionFilter.KNIGHT], min_level=300,
+                             max_level=400, skill=SkillFilter.SWORD_FIGHTING, min_skill_level=100,
+                             pvp_type=PvpTypeFilter.OPTIONAL_PVP, order_by=AuctionOrderBy.BID)
+        filters = query.plan()
+
+        self.assertEqual(["Antica", "Secura"], [f.world for f in filters])
+        self.assertEqual({VocationAuctionFilter.KNIGHT}, {f.vocation for f in filters})
+        self.assertEqual({"filter_profession": 3, "filter_levelrangefrom": 300, "filter_levelrangeto": 400,
+                          "filter_world": "Secura", "filter_worldpvptype": 1, "filter_skillid": 8,
+                          "filter_skillrangefrom": 100, "order_column": 100, "order_direction": 0},
+                         filters[1].query_params)
+
+        # Too many combinations, vocations are checked locally instead.
+        query = AuctionQuery(worlds=["Antica", "Secura"], vocations=list(VocationAuctionFilter), max_splits=4)
+        self.assertEqual([("Antica", None), ("Secura", None)], [(f.world, f.vocation) for f in query.plan()])
+
+        # The results of a skill order can't be merged, so the worlds are checked locally.
+        query = AuctionQuery(worlds=["Antica", "Secura"], order_by=AuctionOrderBy.SWORD_FIGHTING)
+        self.assertEqual([None], [f.world for f in query.plan()])
+
+        query = AuctionQuery(max_bid=1000)
+        self.assertEqual(AuctionOrderBy.BID, query.order_by)
+        self.assertEqual(AuctionOrder.LOWEST_EARLIEST, query.order)
+
+    def test_auction_query_matches(self):
+        """Testing checking listed auctions against the local conditions of a query"""
+        bazaar = CharacterBazaar.from_content(self.load_resource(FILE_BAZAAR_CURRENT))
+        auction = bazaar.entries[0]
+        vocation = next(v for v in VocationAuctionFilter if v.name in auction.vocation.name)
+
+        self.assertTrue(AuctionQuery(worlds=[auction.world], vocations=[vocation], min_level=auction.level,
+                                     max_bid=auction.bid, predicate=lambda a: a.name == auction.name).matches(auction))
+        self.assertFalse(AuctionQuery(worlds=["Gladera"]).matches(auction))
+        self.assertFalse(AuctionQuery(max_level=auction.level - 1).matches(auction))
+        self.assertFalse(AuctionQuery(min_bid=auction.bid + 1).matches(auction))
+        self.assertFalse(AuctionQuery(predicate=lambda a: False).matches(auction))
+
+        self.assertTrue(AuctionQuery(min_bid=auction.bid + 1).is_past_results(auction))
+        self.assertFalse(AuctionQuery(max_bid=auction.bid).is_past_results(auction))
+        self.assertTrue(AuctionQuery(max_bid=auction.bid - 1).is_past_results(auction))
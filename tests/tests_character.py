@@ -1,4 +1,6 @@
+import copy
 import datetime
+import pickle
 import unittest
 
 from tests.tests_tibiapy import TestCommons
@@ -148,6 +150,29 @@ class TestCharacter(TestCommons, unittest.TestCase):
         self.assertEqual(51, len(char.deaths))
         self.assertTrue(char.deaths_truncated)
 
+    def test_character_from_content_lazy(self):
+        """Testing parsing a character lazily"""
+        content = self.load_resource(FILE_CHARACTER_TRUNCATED_DEATHS)
+        char = Character.from_content(content)
+        lazy_char = Character.from_content(content, lazy=True)
+
+        self.assertEqual(char.level, lazy_char.level)
+        self.assertIn("Character Deaths", lazy_char._pending_tables)
+        self.assertTrue(lazy_char.deaths_truncated)
+        self.assertNotIn("Character Deaths", lazy_char._pending_tables)
+        self.assertEqual(51, len(lazy_char.deaths))
+        self.assertIn("Characters", lazy_char._pending_tables)
+        self.assertEqual(char.to_json(), lazy_char.to_json())
+
+    def test_character_from_content_lazy_copy(self):
+        """Testing that copying or pickling a lazily parsed character parses all its sections"""
+        content = self.load_resource(FILE_CHARACTER_RESOURCE)
+        char = Character.from_content(content)
+
+        self.assertEqual(char.to_json(), copy.copy(Character.from_content(content, lazy=True)).to_json())
+        pickled = pickle.dumps(Character.from_content(content, lazy=True))
+        self.assertEqual(char.to_json(), pickle.loads(pickled).to_json())
+
     def test_character_from_content_unrelated(self):
         """Testing parsing an unrelated tibia.com section"""
         content = self.load_resource(self.FILE_UNRELATED_SECTION)
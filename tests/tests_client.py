@@ -1,10 +1,21 @@
+import asyncio
+import concurrent.futures
+import contextlib
 import datetime
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 import aiohttp
 import asynctest
 from aioresponses import aioresponses
 
-from tests.tests_bazaar import FILE_BAZAAR_CURRENT
+from tests.tests_bazaar import FILE_AUCTION_FINISHED, FILE_BAZAAR_CURRENT
 from tests.tests_character import FILE_CHARACTER_RESOURCE, FILE_CHARACTER_NOT_FOUND
 from tests.tests_forums import FILE_CM_POST_ARCHIVE_PAGES
 from tests.tests_guild import FILE_GUILD_FULL, FILE_GUILD_LIST
@@ -14,10 +25,14 @@ from tests.tests_kill_statistics import FILE_KILL_STATISTICS_FULL
 from tests.tests_news import FILE_NEWS_LIST, FILE_NEWS_ARTICLE
 from tests.tests_tibiapy import TestCommons
 from tests.tests_world import FILE_WORLD_FULL, FILE_WORLD_LIST
-from tibiapy import CharacterBazaar, Client, Character, CMPostArchive, Guild, Highscores, VocationFilter, Category, \
-    House, ListedHouse, \
+from tibiapy import AuctionDetails, CharacterBazaar, Client, Character, CMPostArchive, Guild, Highscores, \
+    VocationFilter, Category, House, ListedHouse, \
     ListedGuild, \
-    KillStatistics, ListedNews, News, World, WorldOverview, Forbidden, NetworkError, BoostedCreature
+    KillStatistics, ListedNews, News, World, WorldOverview, Forbidden, BoostedCreature, ResponseCache, \
+    ParseCache, RateLimiter, ResponseArchive, SQLiteResponseCache, HighscoresEntry, TibiaResponse, HighscoresCrawler, \
+    NetworkError, AuctionHistorySync, ListedAuction, AuctionQuery, AuctionOrderBy, VocationAuctionFilter, Vocation, \
+    SnapshotReader, SnapshotWriter
+from tibiapy.client import RawResponse
 
 
 class TestClient(asynctest.TestCase, TestCommons):
@@ -229,4 +244,546 @@ class TestClient(asynctest.TestCase, TestCommons):
         response = await self.client.fetch_current_auctions()
         self.assertIsInstance(response.data, CharacterBazaar)
 
+    @aioresponses()
+    async def test_client_cache(self, mock):
+        """Testing that cached responses are reused"""
+        client = Client(session=self.client.session, cache_size=10)
+        content = self.load_resource(FILE_WORLD_LIST)
+        mock.get(WorldOverview.get_url(), status=200, body=content, headers={"Age": "30"})
+        first = await client.fetch_world_list()
+        second = await client.fetch_world_list()
+
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertGreaterEqual(second.age, 30)
+        self.assertIsInstance(second.data, WorldOverview)
+        self.assertEqual(1, len(client.cache))
+
+    def test_response_cache_expired_entries(self):
+        """Testing that responses older than the cache limit are not stored"""
+        cache = ResponseCache(2)
+        response = RawResponse.__new__(RawResponse)
+        response.age = 300
+        cache.put(("GET", "url", ()), response)
+
+        self.assertEqual(0, len(cache))
+        self.assertIsNone(cache.get(("GET", "url", ())))
+
+    @aioresponses()
+    async def test_client_sqlite_cache(self, mock):
+        """Testing that responses stored in a SQLite cache are reused by other clients"""
+        content = self.load_resource(FILE_WORLD_LIST)
+        mock.get(WorldOverview.get_url(), status=200, body=content, headers={"Age": "30"})
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            first_cache = SQLiteResponseCache(path)
+            first = await Client(session=self.client.session, cache=first_cache).fetch_world_list()
+            first_cache.close()
+            second_cache = SQLiteResponseCache(path)
+            threads = []
+            get = second_cache.get
+            with patch.object(second_cache, "get", lambda key: threads.append(threading.get_ident()) or get(key)):
+                second = await Client(session=self.client.session, cache=second_cache).fetch_world_list()
+
+            self.assertEqual(1, len(threads))
+            self.assertNotEqual(threading.get_ident(), threads[0])
+            self.assertFalse(first.cached)
+            self.assertTrue(second.cached)
+            self.assertGreaterEqual(second.age, 30)
+            self.assertEqual(first.data.to_json(), second.data.to_json())
+            self.assertEqual(1, len(second_cache))
+            second_cache.close()
+
+    def test_sqlite_response_cache_expired_entries(self):
+        """Testing that expired responses are not returned by a SQLite cache"""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SQLiteResponseCache(os.path.join(directory, "cache.sqlite"))
+            key = cache.get_key("GET", "url")
+            cache.put(key, RawResponse._from_values(datetime.datetime.utcnow(), 0.5, False, 290, "content"))
+
+            self.assertEqual("content", cache.get(key).content)
+            with patch("tibiapy.client.time.time", return_value=time.time() + 20):
+                self.assertIsNone(cache.get(key))
+                self.assertEqual(0, len(cache))
+            cache.close()
+
+    def test_sqlite_response_cache_unavailable(self):
+        """Testing that a SQLite cache behaves as empty while its database is unavailable"""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SQLiteResponseCache(os.path.join(directory, "cache.sqlite"))
+            connection, cache._connection = cache._connection, MagicMock()
+            cache._connection.execute.side_effect = sqlite3.OperationalError("database is locked")
+            key = cache.get_key("GET", "url")
+            cache.put(key, RawResponse._from_values(datetime.datetime.utcnow(), 0.5, False, 0, "content"))
+
+            self.assertEqual(0, len(cache))
+            self.assertIsNone(cache.get(key))
+            cache._connection = connection
+            cache.close()
+
+    @aioresponses()
+    async def test_client_archive_record_and_replay(self, mock):
+        """Testing recording responses to an archive and replaying them without the network"""
+        content = self.load_resource(FILE_WORLD_LIST)
+        mock.get(WorldOverview.get_url(), status=200, body=content, headers={"Age": "30"})
+        with tempfile.TemporaryDirectory() as directory:
+            recorded = await Client(session=self.client.session,
+                                    archive=ResponseArchive(directory)).fetch_world_list()
+            replay_client = Client(session=self.client.session, archive=ResponseArchive(directory, replay=True))
+            replayed = await replay_client.fetch_world_list()
+
+            self.assertEqual(2, len(os.listdir(directory)))
+            self.assertEqual(30, replayed.age)
+            self.assertEqual(recorded.timestamp, replayed.timestamp)
+            self.assertEqual(recorded.data.to_json(), replayed.data.to_json())
+            with self.assertRaises(NetworkError):
+                await replay_client.fetch_world("Antica")
+
+    @aioresponses()
+    async def test_client_parse_cache(self, mock):
+        """Testing that identical content is only parsed once"""
+        client = Client(session=self.client.session, parse_cache_size=10)
+        content = self.load_resource(FILE_WORLD_LIST)
+        mock.get(WorldOverview.get_url(), status=200, body=content, repeat=True)
+        first = await client.fetch_world_list()
+        second = await client.fetch_world_list()
+
+        self.assertIsNot(first.data, second.data)
+        self.assertEqual(first.data.to_json(), second.data.to_json())
+        self.assertLess(second.parsing_time, first.parsing_time)
+        self.assertEqual(1, client.parse_cache.hits)
+        self.assertEqual(0.5, client.parse_cache.hit_ratio)
+
+    def test_parse_cache_none(self):
+        """Testing that parsed results of None are cached"""
+        cache = ParseCache(1)
+        key = cache.get_key(Character.from_content, "content")
+        cache.put(key, None)
+        cache.put(cache.get_key(Character.from_content, "other content"), None)
+
+        self.assertEqual(1, len(cache))
+        self.assertEqual("missing", cache.get(key, "missing"))
+        self.assertIsNone(cache.get(cache.get_key(Character.from_content, "other content"), "missing"))
+
+    @aioresponses()
+    async def test_client_iter_pages(self, mock):
+        """Testing iterating over all the pages of the highscores"""
+        content = self.load_resource(FILE_HIGHSCORES_FULL)
+        mock.get(re.compile(r".*subtopic=highscores.*"), status=200, body=content, repeat=True)
+        responses = [r async for r in self.client.iter_pages(self.client.fetch_highscores_page, "Estela",
+                                                                 Category.MAGIC_LEVEL, VocationFilter.KNIGHTS,
+                                                                 page=36, prefetch=2)]
+        entries = [e async for e in self.client.iter_entries(self.client.fetch_highscores_page, "Estela",
+                                                               Category.MAGIC_LEVEL, VocationFilter.KNIGHTS, page=38)]
+
+        self.assertEqual(4, len(responses))
+        requested_pages = [int(re.search(r"currentpage=(\d+)", str(url)).group(1)) for _, url in mock.requests]
+        self.assertEqual([36, 37, 38, 39], sorted(requested_pages[:4]))
+        self.assertEqual(len(responses[0].data.entries) * 2, len(entries))
+
+    @aioresponses()
+    async def test_client_iter_pages_prefetch_limit(self, mock):
+        """Testing that only the requested number of pages are fetched in advance"""
+        content = self.load_resource(FILE_HIGHSCORES_FULL)
+        mock.get(re.compile(r".*subtopic=highscores.*"), status=200, body=content, repeat=True)
+        pages = self.client.iter_pages(self.client.fetch_highscores_page, "Estela", prefetch=5)
+        async for _ in pages:
+            await asyncio.sleep(0.1)
+            break
+        await pages.aclose()
+        await asyncio.gather(*self.client._pending_requests.values())
+
+        self.assertEqual(6, len(mock.requests))
+
+    async def test_client_find_highscores_page(self):
+        """Testing finding the highscores page of a character using binary search"""
+        values = [1000 - i // 3 for i in range(1000)]
+        requested_pages = []
+
+        async def fetch_highscores_page(world, category, vocation, page):
+            requested_pages.append(page)
+            entries = [HighscoresEntry(i + 1, f"Character {i + 1}", None, world, 100, value)
+                       for i, value in enumerate(values) if page * 50 - 50 <= i < page * 50]
+            highscores = Highscores(world, category, vocation=vocation, entries=entries, page=page,
+                                    total_pages=len(values) // 50)
+            return TibiaResponse(RawResponse._from_values(datetime.datetime.utcnow(), 0, False, 0, None), highscores)
+
+        with patch.object(self.client, "fetch_highscores_page", fetch_highscores_page):
+            response = await self.client.find_highscores_page("Antica", "character 730", values[729])
+            self.assertEqual(15, response.data.page)
+            self.assertLessEqual(len(requested_pages), 6)
+
+            # The value is shared with the last entry of the previous page.
+            requested_pages.clear()
+            response = await self.client.find_highscores_page("Antica", "Character 150", values[149])
+            self.assertEqual(3, response.data.page)
+            self.assertLessEqual(len(requested_pages), 4)
+
+            requested_pages.clear()
+            response = await self.client.find_highscores_page("Antica", "Character 731", values[730])
+            self.assertEqual(15, response.data.page)
+            self.assertEqual([15], requested_pages)
+
+            # The known boundaries are outdated, so the search is started again.
+            values[:0] = [2000] * 100
+            response = await self.client.find_highscores_page("Antica", "Character 851", values[850])
+            self.assertEqual(18, response.data.page)
+
+            response = await self.client.find_highscores_page("Antica", "Unknown", values[300])
+            self.assertIsNone(response.data)
+
+    async def test_client_iter_auctions(self):
+        """Testing fetching the auctions matching a query, applying the filters supported by Tibia.com"""
+        vocations = [Vocation.ELITE_KNIGHT, Vocation.DRUID, Vocation.PALADIN, Vocation.SORCERER]
+        auctions = [ListedAuction(auction_id=i, world=["Antica", "Secura", "Gladera"][i % 3], vocation=vocations[i % 4],
+                                  level=i % 500, bid=i * 7 % 1000) for i in range(3000)]
+        requested = []
+
+        async def fetch_current_auctions(page=1, filters=None):
+            requested.append((filters.world, page))
+            results = [a for a in auctions if a.world == filters.world and a.vocation == Vocation.ELITE_KNIGHT
+                       and filters.min_level <= a.level]
+            results.sort(key=lambda a: a.bid, reverse=True)
+            bazaar = CharacterBazaar(page=page, total_pages=-(-len(results) // 25),
+                                     entries=results[page * 25 - 25:page * 25])
+            return TibiaResponse(RawResponse._from_values(datetime.datetime.utcnow(), 0, False, 0, None), bazaar)
+
+        query = AuctionQuery(worlds=["Antica", "Secura"], vocations=[VocationAuctionFilter.KNIGHT], min_level=300,
+                             min_bid=800, predicate=lambda a: a.auction_id % 2 == 0)
+        with patch.object(self.client, "fetch_current_auctions", fetch_current_auctions):
+            results = [a async for a in self.client.iter_auctions(query, prefetch=0)]
+
+        expected = [a for a in auctions if query.matches(a) and a.vocation == Vocation.ELITE_KNIGHT]
+        self.assertEqual(sorted(a.auction_id for a in expected), sorted(a.auction_id for a in results))
+        self.assertEqual(sorted((a.bid for a in results), reverse=True), [a.bid for a in results])
+        self.assertEqual(["Antica", "Secura"], sorted({world for world, _ in requested}))
+        self.assertLessEqual(len(requested), 4)
+
+    @aioresponses()
+    async def test_client_coalesce_requests(self, mock):
+        """Testing that identical concurrent requests are only performed once"""
+        name = "Antica"
+        content = self.load_resource(FILE_WORLD_FULL)
+        mock.get(World.get_url(name), status=200, body=content)
+        responses = await asyncio.gather(*[self.client.fetch_world(name) for _ in range(5)])
+
+        self.assertIsInstance(responses[0].data, World)
+        for response in responses:
+            self.assertIs(responses[0], response)
+        self.assertEqual(0, len(self.client._pending_requests))
+
+    @aioresponses()
+    async def test_client_coalesce_requests_cancelled(self, mock):
+        """Testing that cancelling a coalesced request doesn't affect the others"""
+        name = "Antica"
+        content = self.load_resource(FILE_WORLD_FULL)
+        mock.get(World.get_url(name), status=200, body=content)
+        cancelled = asyncio.ensure_future(self.client.fetch_world(name))
+        waiting = asyncio.ensure_future(self.client.fetch_world(name))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        response = await waiting
+
+        self.assertTrue(cancelled.cancelled())
+        self.assertIsInstance(response.data, World)
+
+    @aioresponses()
+    async def test_client_rate_limiter_forbidden(self, mock):
+        """Testing that the rate limiter's window is decreased when getting rate-limited"""
+        limiter = RateLimiter(100, 100, initial_window=4)
+        client = Client(session=self.client.session, rate_limiter=limiter)
+        mock.get(WorldOverview.get_url(), status=403)
+        with self.assertRaises(Forbidden):
+            await client.fetch_world_list()
+
+        self.assertEqual(2, limiter.window)
+        self.assertEqual(0, limiter.in_flight)
+
+    @aioresponses()
+    async def test_client_parse_executor(self, mock):
+        """Testing parsing responses in an executor"""
+        name = "Tschas"
+        content = self.load_resource(FILE_CHARACTER_RESOURCE)
+        mock.get(Character.get_url(name), status=200, body=content, repeat=True)
+        for executor_class in (concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor):
+            with executor_class(max_workers=1) as executor:
+                client = Client(session=self.client.session, parse_executor=executor)
+                character = await client.fetch_character(name)
+
+                self.assertIsInstance(character.data, Character)
+                self.assertGreater(character.parsing_time, 0)
+
+    @aioresponses()
+    async def test_client_fetch_auction_all_pages(self, mock):
+        """Testing fetching an auction with all its item and outfit pages"""
+        auction_id = 82526
+        content = self.load_resource(FILE_AUCTION_FINISHED)
+        mock.get(AuctionDetails.get_url(auction_id), status=200, body=content)
+        ajax_url = "https://www.tibia.com/charactertrade/ajax_getcharacterdata.php?auctionid=%d&type=%d&currentpage=%d"
+        for page in range(2, 9):
+            item = '<div class="BoxContent"><div class="CVIcon" title="1x &quot;item %d&quot;">' \
+                   '<img src="https://static.tibia.com/%d.gif"></div></div>'
+            mock.get(ajax_url % (auction_id, 0, page), status=200,
+                     body=json.dumps({"AjaxObjects": [{"Data": item % (page, page)}]}))
+        mock.get(ajax_url % (auction_id, 4, 2), status=200, body=json.dumps({"AjaxObjects": [{"Data": ""}]}))
+        response = await self.client.fetch_auction(auction_id, fetch_items=True, fetch_outfits=True,
+                                                   max_concurrent_pages=2)
+        auction = response.data
+
+        self.assertTrue(auction.items.fully_fetched)
+        self.assertTrue(auction.outfits.fully_fetched)
+        self.assertEqual(list(range(2, 9)), [i.item_id for i in auction.items.entries[-7:]])
+        self.assertEqual("item 8", auction.items.entries[-1].name)
+        self.assertFalse(auction.mounts.fully_fetched)
+
+    async def test_client_fetch_auction_invalid_max_concurrent_pages(self):
+        """Testing fetching an auction with an invalid number of concurrent pages"""
+        for max_concurrent_pages in (0, -1):
+            with self.subTest(max_concurrent_pages=max_concurrent_pages):
+                with self.assertRaises(ValueError):
+                    await self.client.fetch_auction(82526, fetch_items=True, max_concurrent_pages=max_concurrent_pages)
+
+    @aioresponses()
+    async def test_client_fetch_auction_sections(self, mock):
+        """Testing that additional pages are not fetched for sections that were not parsed"""
+        auction_id = 82526
+        content = self.load_resource(FILE_AUCTION_FINISHED)
+        mock.get(AuctionDetails.get_url(auction_id), status=200, body=content)
+        response = await self.client.fetch_auction(auction_id, fetch_items=True, sections=["General"])
+        auction = response.data
+
+        self.assertIsNone(auction.items)
+        self.assertNotEqual(0, auction.hit_points)
+
+
+class TestRateLimiter(asynctest.TestCase):
+    async def test_rate_limiter_additive_increase(self):
+        """Testing that the window grows while requests succeed"""
+        limiter = RateLimiter(100, 100, initial_window=2)
+        for _ in range(4):
+            ticket = await limiter.acquire()
+            limiter.release(ticket)
+
+        self.assertEqual(3, int(limiter.window))
+        self.assertEqual(0, limiter.in_flight)
+        self.assertIsNotNone(limiter.average_latency)
+
+    async def test_rate_limiter_multiplicative_decrease(self):
+        """Testing that the window is only halved once for requests affected by the same throttling"""
+        limiter = RateLimiter(100, 100, initial_window=8)
+        tickets = [await limiter.acquire() for _ in range(4)]
+        for ticket in tickets:
+            limiter.release(ticket, throttled=True)
+
+        self.assertEqual(4, limiter.window)
+
+    async def test_rate_limiter_queue(self):
+        """Testing that requests exceeding the window wait for a slot"""
+        limiter = RateLimiter(100, 100, initial_window=1, max_window=1)
+        ticket = await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        self.assertEqual(1, limiter.queue_depth)
+        self.assertFalse(waiting.done())
+
+        limiter.release(ticket)
+        limiter.release(await waiting)
+
+        self.assertEqual(0, limiter.queue_depth)
+        self.assertEqual(0, limiter.in_flight)
+
+    async def test_rate_limiter_token_bucket(self):
+        """Testing that requests exceeding the rate are delayed"""
+        limiter = RateLimiter(20, 1, initial_window=5)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.release(await limiter.acquire())
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_rate_limiter_invalid_parameters(self):
+        """Testing creating a rate limiter with invalid parameters"""
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+        with self.assertRaises(ValueError):
+            RateLimiter(initial_window=10, max_window=5)
+
+
+class FakeHighscoresClient:
+    """A client serving generated highscores pages, updated at the given times."""
+    def __init__(self, total_pages=3):
+        self.total_pages = total_pages
+        self.updated_at = {}
+        self.requested_pages = []
+        self.fail_on = None
+
+    async def fetch_highscores_page(self, world, category, vocation, page):
+        if (world, category, page) == self.fail_on:
+            raise NetworkError("Connection reset")
+        self.requested_pages.append((world, category, page))
+        now = datetime.datetime.utcnow()
+        updated_at = self.updated_at.get((world, category), datetime.datetime(2020, 10, 1))
+        entries = [HighscoresEntry(rank, f"Character {rank}", None, world, 100, 1000 - rank)
+                   for rank in range(page * 50 - 49, page * 50 + 1)]
+        highscores = Highscores(world, category, vocation=vocation, entries=entries, page=page,
+                                total_pages=self.total_pages, last_updated=now - updated_at)
+        return TibiaResponse(RawResponse._from_values(now, 0, False, 0, None), highscores)
+
+
+class TestHighscoresCrawler(asynctest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "crawler.db")
+        self.client = FakeHighscoresClient()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def crawl(self, pages=None, snapshot_path=None, **kwargs):
+        pages = [] if pages is None else pages
+        crawler = HighscoresCrawler(self.client, self.path, worlds=["Antica", "Secura"],
+                                    categories=[Category.EXPERIENCE, Category.MAGIC_LEVEL],
+                                    vocations=[VocationFilter.ALL], **kwargs)
+        with contextlib.ExitStack() as stack:
+            writer = SnapshotWriter(stack.enter_context(open(snapshot_path, "ab"))) if snapshot_path else None
+            stack.callback(crawler.close)
+            async for highscores in crawler.crawl():
+                pages.append((highscores.world, highscores.category, highscores.page))
+                if writer:
+                    writer.write_all(highscores.entries)
+        return pages
+
+    async def test_highscores_crawler(self):
+        """Testing crawling the highscores of multiple worlds and categories"""
+        pages = await self.crawl(concurrency=3)
+
+        self.assertEqual(12, len(pages))
+        self.assertEqual(12, len(set(pages)))
+        self.assertEqual(set(pages), set(self.client.requested_pages))
+
+        # Highscores that were not updated are skipped.
+        self.client.requested_pages.clear()
+        self.assertEqual([], await self.crawl())
+        self.assertEqual(4, len(self.client.requested_pages))
+
+        self.client.updated_at[("Secura", Category.MAGIC_LEVEL)] = datetime.datetime(2020, 10, 2)
+        pages = await self.crawl()
+        self.assertEqual({("Secura", Category.MAGIC_LEVEL)}, {(world, category) for world, category, _ in pages})
+        self.assertEqual(3, len(pages))
+
+    async def test_highscores_crawler_resume(self):
+        """Testing resuming a crawl that was interrupted"""
+        self.client.fail_on = ("Secura", Category.EXPERIENCE, 2)
+        first_pages = []
+        with self.assertRaises(NetworkError):
+            await self.crawl(first_pages, concurrency=1)
+
+        self.client.fail_on = None
+        self.client.requested_pages.clear()
+        pages = await self.crawl()
+
+        self.assertIn(("Secura", Category.EXPERIENCE, 2), pages)
+        self.assertEqual(12, len(first_pages) + len(pages))
+        self.assertEqual(12, len(set(first_pages) | set(pages)))
+        self.assertFalse({p for p in first_pages if p[2] > 1} & set(self.client.requested_pages))
+
+    async def test_highscores_crawler_resume_snapshot(self):
+        """Testing appending the entries of a resumed crawl to the same snapshot"""
+        snapshot_path = os.path.join(self.directory.name, "highscores.snapshot")
+        self.client.fail_on = ("Secura", Category.EXPERIENCE, 2)
+        first_pages = []
+        with self.assertRaises(NetworkError):
+            await self.crawl(first_pages, snapshot_path, concurrency=1)
+
+        self.client.fail_on = None
+        pages = await self.crawl(None, snapshot_path)
+        with open(snapshot_path, "rb") as f:
+            entries = list(SnapshotReader(f))
+
+        self.assertEqual((len(first_pages) + len(pages)) * 50, len(entries))
+        self.assertEqual({"Antica", "Secura"}, {e.world for e in entries})
+        self.assertEqual("Character 150", entries[-1].name)
+
+    def test_highscores_crawler_invalid_concurrency(self):
+        """Testing creating a crawler with an invalid concurrency"""
+        with self.assertRaises(ValueError):
+            HighscoresCrawler(self.client, self.path, concurrency=0)
+
 
+class FakeAuctionHistoryClient:
+    """A client serving the auction history from a list of auctions, sorted by end date, newest first."""
+    def __init__(self):
+        self.auctions = []
+        self.requested_pages = []
+        self.requested_auctions = []
+
+    def add_auctions(self, count, end):
+        first_id = max((a.auction_id for a in self.auctions), default=0) + 1
+        self.auctions[:0] = [ListedAuction(auction_id=first_id + i, auction_end=end) for i in range(count)]
+
+    async def fetch_auction_history(self, page=1):
+        self.requested_pages.append(page)
+        bazaar = CharacterBazaar(page=page, total_pages=max(1, -(-len(self.auctions) // 25)),
+                                 entries=self.auctions[page * 25 - 25:page * 25])
+        return TibiaResponse(RawResponse._from_values(datetime.datetime.utcnow(), 0, False, 0, None), bazaar)
+
+    async def fetch_auction(self, auction_id):
+        self.requested_auctions.append(auction_id)
+        auction = AuctionDetails(auction_id=auction_id, auction_end=None) if auction_id % 2 else None
+        return TibiaResponse(RawResponse._from_values(datetime.datetime.utcnow(), 0, False, 0, None), auction)
+
+
+class TestAuctionHistorySync(asynctest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history.json")
+        self.client = FakeAuctionHistoryClient()
+        self.end = datetime.datetime(2020, 8, 27, 8, tzinfo=datetime.timezone.utc)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def test_auction_history_sync(self):
+        """Testing syncing the auction history incrementally"""
+        self.client.add_auctions(60, self.end)
+        self.client.add_auctions(10, self.end + datetime.timedelta(hours=1))
+        history_sync = AuctionHistorySync(self.client, self.path)
+
+        auctions = [a async for a in history_sync.sync()]
+        self.assertEqual(70, len(auctions))
+        self.assertEqual([1, 2, 3], self.client.requested_pages)
+        self.assertEqual(70, history_sync.highest_auction_id)
+
+        # New auctions ending at the same time as the newest known ones, and later.
+        self.client.requested_pages.clear()
+        self.client.add_auctions(3, self.end + datetime.timedelta(hours=1))
+        self.client.add_auctions(5, self.end + datetime.timedelta(hours=2))
+        history_sync = AuctionHistorySync(self.client, self.path)
+        self.assertEqual(self.end + datetime.timedelta(hours=1), history_sync.newest_end)
+
+        auctions = [a async for a in history_sync.sync()]
+        self.assertEqual(list(range(78, 70, -1)), sorted((a.auction_id for a in auctions), reverse=True))
+        self.assertEqual([1], self.client.requested_pages)
+
+        self.client.requested_pages.clear()
+        self.assertEqual([], [a async for a in history_sync.sync()])
+        self.assertEqual([1], self.client.requested_pages)
+
+    async def test_auction_history_sync_details(self):
+        """Testing fetching the details of the new auctions when syncing the auction history"""
+        self.client.add_auctions(30, self.end)
+        history_sync = AuctionHistorySync(self.client, self.path, fetch_details=True, concurrency=2, max_pages=1)
+
+        auctions = [a async for a in history_sync.sync()]
+
+        self.assertEqual(25, len(auctions))
+        self.assertEqual([1], self.client.requested_pages)
+        self.assertEqual(25, len(self.client.requested_auctions))
+        self.assertIsInstance(auctions[0], ListedAuction)
+        self.assertEqual(13, len([a for a in auctions if isinstance(a, AuctionDetails)]))
+
+    def test_auction_history_sync_invalid_concurrency(self):
+        """Testing creating an auction history sync with an invalid concurrency"""
+        with self.assertRaises(ValueError):
+            AuctionHistorySync(self.client, self.path, concurrency=0)
@@ -2,7 +2,7 @@ import unittest
 import datetime
 
 from tests.tests_tibiapy import TestCommons
-from tibiapy import EventSchedule
+from tibiapy import EventEntry, EventSchedule
 
 FILE_EVENT_CALENDAR = "events/tibiacom_calendar.txt"
 
@@ -22,4 +22,58 @@ class TestEvents(TestCommons, unittest.TestCase):
         events_on_day = calendar.get_events_on(datetime.date(2020, 9, 15))
         self.assertEqual(2, len(events_on_day))
         self.assertEqual(4, events_on_day[0].duration)
+
+        events_in_range = calendar.get_events_between(datetime.date(2020, 9, 14), datetime.date(2020, 10, 1))
+        self.assertEqual(["Full Moon", "Colours of Magic", "Annual Autumn Vintage"], [e.title for e in events_in_range])
+        self.assertEqual([], calendar.get_events_between(datetime.date(2020, 9, 30), datetime.date(2020, 9, 1)))
+        self.assertEqual(["Hot Cuisine Month"], [e.title for e in calendar.get_events_on(datetime.date(2019, 1, 1))])
     # endregion
+
+    def test_event_schedule_merge(self):
+        """Testing merging the schedules of consecutive months"""
+        calendar = EventSchedule.from_content(self.load_resource(FILE_EVENT_CALENDAR))
+        next_calendar = EventSchedule(10, 2020, events=[
+            EventEntry("Annual Autumn Vintage", "", start_date=datetime.date(2020, 10, 1),
+                       end_date=datetime.date(2020, 10, 8)),
+            EventEntry("Orcsoberfest", "", end_date=datetime.date(2020, 10, 20)),
+            EventEntry("Full Moon", "", start_date=datetime.date(2020, 10, 12), end_date=datetime.date(2020, 10, 15)),
+        ])
+
+        merged = next_calendar.merge(calendar)
+
+        self.assertEqual(9, merged.month)
+        self.assertEqual(2020, merged.year)
+        self.assertEqual(7, len(merged.events))
+        orcsoberfest = merged.get_events_on(datetime.date(2020, 10, 15))[0]
+        self.assertEqual("Orcsoberfest", orcsoberfest.title)
+        self.assertEqual(12, orcsoberfest.duration)
+        self.assertIsNone(calendar.events[-1].end_date)
+        self.assertEqual(2, len([e for e in merged.events if e.title == "Full Moon"]))
+
+        merged.events.append(EventEntry("Halloween", "", start_date=datetime.date(2020, 10, 31)))
+        self.assertEqual("Halloween", merged.get_events_on(datetime.date(2020, 11, 2))[-1].title)
+
+        replaced = merged.events[1]
+        merged.events[1] = EventEntry("Double XP", "", start_date=datetime.date(2020, 8, 1),
+                                      end_date=datetime.date(2020, 8, 3))
+        self.assertIn("Double XP", [e.title for e in merged.get_events_on(datetime.date(2020, 8, 2))])
+        self.assertNotIn(replaced, merged.get_events_between(datetime.date(2019, 1, 1), datetime.date(2021, 1, 1)))
+
+    def test_event_schedule_query_cost(self):
+        """Testing that querying the schedule doesn't scan every event"""
+        def create_schedule(count):
+            start = datetime.date(2000, 1, 1)
+            return EventSchedule(1, 2000, events=[
+                EventEntry(f"Event {i}", "", start_date=start + datetime.timedelta(days=i),
+                           end_date=start + datetime.timedelta(days=i + 1)) for i in range(count)
+            ])
+
+        small_schedule = create_schedule(100)
+        schedule = create_schedule(20000)
+        date = datetime.date(2000, 1, 20)
+        self.assertEqual(["Event 18", "Event 19"], [e.title for e in schedule.get_events_on(date)])
+
+        small_time = self.measure_time(lambda: small_schedule.get_events_on(date))
+        large_time = self.measure_time(lambda: schedule.get_events_on(date))
+
+        self.assertLess(large_time, small_time * 5)
@@ -55,6 +55,51 @@ class TestsGuild(TestCommons, unittest.TestCase):
         self.assertEqual(guild.guildhall.world, guild.world)
         self.assertIsInstance(guild.guildhall.paid_until_date, datetime.date)
 
+    def test_guild_cached_views(self):
+        """Testing that the derived views of a guild are updated when its members change"""
+        guild = Guild.from_content(self.load_resource(FILE_GUILD_FULL))
+        online_count = guild.online_count
+        guild.online_members.clear()
+        guild.members_by_rank['Vice Leader'].clear()
+
+        self.assertEqual(online_count, len(guild.online_members))
+        self.assertEqual(8, len(guild.members_by_rank['Vice Leader']))
+
+        guild.members.append(GuildMember("Galarzaa", "New Rank", level=300, online=True))
+        self.assertEqual(online_count + 1, guild.online_count)
+        self.assertEqual("Galarzaa", guild.online_members[-1].name)
+        self.assertEqual("New Rank", guild.ranks[-1])
+
+        offline_member = next(m for m in guild.members[1:-1] if not m.online)
+        index = guild.members.index(offline_member)
+        guild.members[index] = GuildMember("Xzy", "Zzz", level=100, online=True)
+        self.assertEqual(online_count + 2, guild.online_count)
+        self.assertIn("Xzy", [m.name for m in guild.online_members])
+        self.assertIn("Zzz", guild.ranks)
+        self.assertEqual("Xzy", guild.members_by_rank["Zzz"][0].name)
+
+        guild.members = guild.members[:1]
+        self.assertEqual(1, len(guild.members_by_rank))
+        self.assertEqual([guild.members[0].rank], guild.ranks)
+
+        del guild.members[0]
+        self.assertEqual(0, guild.online_count)
+        self.assertEqual([], guild.ranks)
+
+    def test_guild_cached_views_cost(self):
+        """Testing that reading the derived views of a guild again doesn't depend on the number of members"""
+        small_guild = Guild("Small", members=[GuildMember(f"Member {i}", "Rank", online=i % 2) for i in range(10)])
+        guild = Guild("Big", members=[GuildMember(f"Member {i}", "Rank", online=i % 2) for i in range(10000)])
+        self.assertEqual(5000, guild.online_count)
+        self.assertEqual(["Rank"], guild.ranks)
+
+        small_time = self.measure_time(lambda: (small_guild.online_count, small_guild.ranks))
+        cached_time = self.measure_time(lambda: (guild.online_count, guild.ranks))
+        uncached_time = self.measure_time(lambda: sum(1 for m in guild.members if m.online), number=20) * 10
+
+        self.assertLess(cached_time, small_time * 5)
+        self.assertLess(cached_time * 10, uncached_time)
+
     def test_guild_from_content_not_found(self):
         """Testing parsing a non existent guild"""
         content = self.load_resource(FILE_GUILD_NOT_FOUND)
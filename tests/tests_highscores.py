@@ -78,6 +78,21 @@ class TestHighscores(unittest.TestCase, TestCommons):
             self.assertIsInstance(entry.level, int)
             self.assertIsInstance(entry.title, str)
 
+    def test_highscores_from_content_fast_matches_bs4(self):
+        """Testing that the lxml parser produces the same results as the BeautifulSoup parser"""
+        for resource in [FILE_HIGHSCORES_FULL, FILE_HIGHSCORES_EXPERIENCE, FILE_HIGHSCORES_LOYALTY]:
+            with self.subTest(resource=resource):
+                content = self.load_resource(resource)
+                highscores = Highscores.from_content(content)
+
+                self.assertEqual(Highscores.from_content(content, fast=False).to_json(), highscores.to_json())
+
+    def test_highscores_from_content_unrelated_section_bs4(self):
+        """Testing parsing an unrelated section with the BeautifulSoup parser"""
+        content = self.load_resource(self.FILE_UNRELATED_SECTION)
+        with self.assertRaises(InvalidContent):
+            Highscores.from_content(content, fast=False)
+
     def _test_highscores_from_content_empty(self):
         """Testing parsing highscores when empty (world doesn't exist)"""
         content = self.load_resource(FILE_HIGHSCORES_EMPTY)
@@ -0,0 +1,94 @@
+import gzip
+import io
+import unittest
+
+from tests.tests_bazaar import FILE_AUCTION_FINISHED, FILE_BAZAAR_HISTORY
+from tests.tests_highscores import FILE_HIGHSCORES_LOYALTY
+from tests.tests_kill_statistics import FILE_KILL_STATISTICS_FULL
+from tests.tests_tibiapy import TestCommons
+from tests.tests_world import FILE_WORLD_FULL
+from tibiapy import AuctionDetails, CharacterBazaar, Highscores, HighscoresEntry, KillStatistics, \
+    LoyaltyHighscoresEntry, SnapshotReader, SnapshotWriter, World
+from tibiapy.snapshot import SNAPSHOT_VERSION
+
+
+class TestSnapshot(TestCommons, unittest.TestCase):
+    def test_snapshot_round_trip(self):
+        """Testing writing models to a snapshot and reading them back"""
+        models = [
+            Highscores.from_content(self.load_resource(FILE_HIGHSCORES_LOYALTY)),
+            CharacterBazaar.from_content(self.load_resource(FILE_BAZAAR_HISTORY)),
+            AuctionDetails.from_content(self.load_resource(FILE_AUCTION_FINISHED)),
+            KillStatistics.from_content(self.load_resource(FILE_KILL_STATISTICS_FULL)),
+            World.from_content(self.load_resource(FILE_WORLD_FULL)),
+        ]
+        fp = io.BytesIO()
+        writer = SnapshotWriter(fp)
+        writer.write_all(models)
+        fp.seek(0)
+
+        restored = list(SnapshotReader(fp))
+
+        self.assertEqual(len(models), writer.count)
+        self.assertEqual([type(m) for m in models], [type(m) for m in restored])
+        self.assertEqual([m.to_json() for m in models], [m.to_json() for m in restored])
+        self.assertIsInstance(restored[0].entries[0], LoyaltyHighscoresEntry)
+
+    def test_snapshot_streaming_entries(self):
+        """Testing that repeated strings are only written once and entries are read one by one"""
+        world = World.from_content(self.load_resource(FILE_WORLD_FULL))
+        fp = io.BytesIO()
+        writer = SnapshotWriter(fp)
+        writer.write_all(world.online_players)
+        json_size = sum(len(p.to_json()) for p in world.online_players)
+
+        self.assertLess(len(fp.getvalue()) * 3, json_size)
+
+        fp.seek(0)
+        reader = SnapshotReader(fp)
+        first = reader.read()
+        self.assertEqual(world.online_players[0].name, first.name)
+        self.assertEqual(world.online_players[0].vocation, first.vocation)
+        self.assertEqual(len(world.online_players) - 1, len(list(reader)))
+        self.assertIsNone(reader.read())
+
+    def test_snapshot_compressed(self):
+        """Testing writing and reading snapshots through compressed files"""
+        highscores = Highscores.from_content(self.load_resource(FILE_HIGHSCORES_LOYALTY))
+        fp = io.BytesIO()
+        with gzip.GzipFile(fileobj=fp, mode="wb") as gzip_file:
+            SnapshotWriter(gzip_file, max_strings=10).write_all(highscores.entries)
+        fp.seek(0)
+
+        with gzip.GzipFile(fileobj=fp, mode="rb") as gzip_file:
+            restored = list(SnapshotReader(gzip_file))
+
+        self.assertEqual([e.to_json() for e in highscores.entries], [e.to_json() for e in restored])
+
+    def test_snapshot_appended(self):
+        """Testing reading snapshots appended to the same file as a single one"""
+        highscores = Highscores.from_content(self.load_resource(FILE_HIGHSCORES_LOYALTY))
+        # The length of this entry's record is the first byte of the magic string.
+        entry = HighscoresEntry(1, "a" * 17, None, "Antica", 100, 1000)
+        fp = io.BytesIO()
+        SnapshotWriter(fp).write_all([entry, *highscores.entries[:10]])
+        SnapshotWriter(fp).write_all([*highscores.entries[10:], entry])
+        fp.seek(0)
+
+        restored = list(SnapshotReader(fp))
+
+        self.assertEqual([e.to_json() for e in [entry, *highscores.entries, entry]], [e.to_json() for e in restored])
+
+    def test_snapshot_invalid(self):
+        """Testing reading files that are not valid snapshots"""
+        with self.assertRaises(ValueError):
+            SnapshotReader(io.BytesIO(b"{}"))
+        with self.assertRaises(ValueError):
+            SnapshotReader(io.BytesIO(b"TIBIAPY" + bytes([SNAPSHOT_VERSION + 1])))
+        with self.assertRaises(TypeError):
+            SnapshotWriter(io.BytesIO()).write("Galarzaa")
+
+        fp = io.BytesIO()
+        SnapshotWriter(fp).write(World.from_content(self.load_resource(FILE_WORLD_FULL)))
+        with self.assertRaises(ValueError):
+            SnapshotReader(io.BytesIO(fp.getvalue()[:-10])).read()
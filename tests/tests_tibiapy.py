@@ -1,4 +1,5 @@
 import os.path
+import timeit
 
 import tibiapy
 
@@ -18,3 +19,8 @@ class TestCommons:
     def load_parsed_resource(resource):
         content = TestCommons.load_resource(resource)
         return tibiapy.utils.parse_tibiacom_content(content)
+
+    @staticmethod
+    def measure_time(func, number=200, repeat=5):
+        """Gets the best time, in seconds, it takes to call a function a number of times."""
+        return min(timeit.repeat(func, number=number, repeat=repeat))
@@ -1,7 +1,14 @@
 import datetime
+import json
 import unittest
+from unittest import mock
 
 import tibiapy
+from tests import tests_bazaar, tests_character, tests_events, tests_forums, tests_guild, tests_highscores, \
+    tests_house, tests_kill_statistics, tests_news, tests_tournament, tests_world
+from tests.tests_character import FILE_CHARACTER_DEATHS_COMPLEX
+from tests.tests_forums import FILE_BOARD_THREAD_LIST
+from tests.tests_kill_statistics import FILE_KILL_STATISTICS_FULL
 from tests.tests_tibiapy import TestCommons
 from tibiapy import enums, utils
 from tibiapy.utils import get_tibia_url, parse_integer, parse_tibia_money
@@ -15,8 +22,74 @@ TIBIA_DATE = "Jun 20 2018"
 TIBIA_FULL_DATE = "July 23, 2015"
 TIBIA_DATE_INVALID = "8 Nov 2018"
 
+ROUND_TRIP_RESOURCES = [
+    (tibiapy.AuctionDetails.from_content, [tests_bazaar.FILE_AUCTION_FINISHED]),
+    (tibiapy.CharacterBazaar.from_content, [tests_bazaar.FILE_BAZAAR_CURRENT, tests_bazaar.FILE_BAZAAR_CURRENT_EMPTY,
+                                            tests_bazaar.FILE_BAZAAR_CURRENT_ALL_FILTERS,
+                                            tests_bazaar.FILE_BAZAAR_HISTORY]),
+    (tibiapy.Character.from_content, [tests_character.FILE_CHARACTER_RESOURCE,
+                                      tests_character.FILE_CHARACTER_FORMER_NAMES,
+                                      tests_character.FILE_CHARACTER_SPECIAL_POSITION,
+                                      tests_character.FILE_CHARACTER_DELETION,
+                                      tests_character.FILE_CHARACTER_DEATHS_COMPLEX,
+                                      tests_character.FILE_CHARACTER_TITLE_BADGES,
+                                      tests_character.FILE_CHARACTER_NO_BADGES_SELECTED,
+                                      tests_character.FILE_CHARACTER_MULTIPLE_HOUSES,
+                                      tests_character.FILE_CHARACTER_TRUNCATED_DEATHS]),
+    (tibiapy.EventSchedule.from_content, [tests_events.FILE_EVENT_CALENDAR]),
+    (tibiapy.CMPostArchive.from_content, [tests_forums.FILE_CM_POST_ARCHIVE_INITIAL,
+                                          tests_forums.FILE_CM_POST_ARCHIVE_NO_PAGES,
+                                          tests_forums.FILE_CM_POST_ARCHIVE_NO_RESULTS,
+                                          tests_forums.FILE_CM_POST_ARCHIVE_PAGES]),
+    (tibiapy.ForumAnnouncement.from_content, [tests_forums.FILE_ANNOUNCEMENT]),
+    (tibiapy.ForumBoard.from_content, [tests_forums.FILE_BOARD_THREAD_LIST, tests_forums.FILE_BOARD_EMPTY_THREAD_LIST,
+                                       tests_forums.FILE_BOARD_INVALID_PAGE, tests_forums.FILE_BOARD_GOLDEN_FRAMES]),
+    (tibiapy.ForumThread.from_content, [tests_forums.FILE_THREAD, tests_forums.FILE_THREAD_INVALID_PAGE]),
+    (tibiapy.ListedBoard.list_from_content, [tests_forums.FILE_WORLD_BOARDS, tests_forums.FILE_SECTION_EMPTY_BOARD]),
+    (tibiapy.Guild.from_content, [tests_guild.FILE_GUILD_FULL, tests_guild.FILE_GUILD_IN_WAR]),
+    (tibiapy.GuildWars.from_content, [tests_guild.FILE_GUILD_WAR_ACTIVE_HISTORY, tests_guild.FILE_GUILD_WAR_EMPTY,
+                                      tests_guild.FILE_GUILD_WAR_UNACTIVE_HISTORY]),
+    (tibiapy.ListedGuild.list_from_content, [tests_guild.FILE_GUILD_LIST]),
+    (tibiapy.Highscores.from_content, [tests_highscores.FILE_HIGHSCORES_FULL,
+                                       tests_highscores.FILE_HIGHSCORES_EXPERIENCE,
+                                       tests_highscores.FILE_HIGHSCORES_LOYALTY]),
+    (tibiapy.House.from_content, [tests_house.FILE_HOUSE_FULL]),
+    (tibiapy.ListedHouse.list_from_content, [tests_house.FILE_HOUSE_LIST, tests_house.FILE_HOUSE_LIST_EMPTY]),
+    (tibiapy.KillStatistics.from_content, [tests_kill_statistics.FILE_KILL_STATISTICS_FULL]),
+    (tibiapy.ListedNews.list_from_content, [tests_news.FILE_NEWS_LIST, tests_news.FILE_NEWS_LIST_EMPTY]),
+    (tibiapy.News.from_content, [tests_news.FILE_NEWS_ARTICLE, tests_news.FILE_NEWS_TICKER]),
+    (tibiapy.Tournament.from_content, [tests_tournament.FILE_TOURNAMENT_SIGN_UP,
+                                       tests_tournament.FILE_TOURNAMENT_ARCHIVE]),
+    (tibiapy.TournamentLeaderboard.from_content, [tests_tournament.FILE_TOURNAMENT_LEADERBOARD_ENDED,
+                                                  tests_tournament.FILE_TOURNAMENT_LEADERBOARD_CURRENT,
+                                                  tests_tournament.FILE_TOURNAMENT_LEADERBOARD_NO_DATA]),
+    (tibiapy.World.from_content, [tests_world.FILE_WORLD_FULL, tests_world.FILE_WORLD_FULL_OFFLINE,
+                                  tests_world.FILE_WORLD_TOURNAMENT]),
+    (tibiapy.WorldOverview.from_content, [tests_world.FILE_WORLD_LIST, tests_world.FILE_WORLD_LIST_OFFLINE]),
+]
+
 
 class TestUtils(TestCommons, unittest.TestCase):
+    def assertRestored(self, original, restored):
+        """Asserts that a restored object has the same types and values as the original, recursively."""
+        if isinstance(original, tibiapy.abc.Serializable):
+            self.assertIs(type(original), type(restored))
+            for key in original._get_converters()[0]:
+                with self.subTest(key=key):
+                    self.assertRestored(getattr(original, key, None), getattr(restored, key, None))
+        elif isinstance(original, (list, tuple)):
+            self.assertIs(type(original), type(restored))
+            self.assertEqual(len(original), len(restored))
+            for original_value, restored_value in zip(original, restored):
+                self.assertRestored(original_value, restored_value)
+        elif isinstance(original, dict):
+            self.assertEqual(list(original), list(restored))
+            for key, value in original.items():
+                self.assertRestored(value, restored[key])
+        else:
+            self.assertEqual(original, restored)
+            self.assertIs(type(original), type(restored))
+
     def test_serializable_get_item(self):
         """Testing the muliple ways to use __get__ for Serializable"""
         # Class inherits from Serializable
@@ -260,3 +333,99 @@ class TestUtils(TestCommons, unittest.TestCase):
         self.assertEqual(8, total_pages)
         self.assertEqual(567, results_count)
 
+    def test_parse_tibiacom_content_self_closing_tags(self):
+        """Testing that non-void elements written as self-closing don't close their parent when using lxml"""
+        content = """<div class="BoxContent"><div class="Outer"><div class="Frame" /></div><div class="Inner">Text</div>
+        <br/><img src="image.gif"/></div></div>"""
+        parsed_content = utils.parse_tibiacom_content(content, fix_self_closing=True)
+        outer = parsed_content.find("div", attrs={"class": "Outer"})
+
+        self.assertIsNotNone(outer.find("div", attrs={"class": "Inner"}))
+        self.assertIsNotNone(outer.find("img"))
+
+        # Content is parsed as it is unless requested.
+        parsed_content = utils.parse_tibiacom_content(content)
+        self.assertIsNone(parsed_content.find("div", attrs={"class": "Outer"}).find("div", attrs={"class": "Inner"}))
+
+    def test_serializable_to_dict(self):
+        """Testing that to_dict produces the same JSON as serializing the objects through their keys"""
+        for resource, parser in [(FILE_CHARACTER_DEATHS_COMPLEX, tibiapy.Character.from_content),
+                                 (FILE_BOARD_THREAD_LIST, tibiapy.ForumBoard.from_content),
+                                 (FILE_KILL_STATISTICS_FULL, tibiapy.KillStatistics.from_content)]:
+            with self.subTest(resource=resource):
+                parsed = parser(self.load_resource(resource))
+                expected = json.dumps({k: v for k, v in dict(parsed).items() if v is not None},
+                                      default=tibiapy.abc.Serializable._try_dict)
+
+                self.assertEqual(expected, json.dumps(parsed.to_dict()))
+                self.assertEqual(expected, parsed.to_json())
+
+    def test_serializable_keys_cached(self):
+        """Testing that the serializable keys are computed once per class"""
+        character = tibiapy.Character("Name")
+
+        self.assertEqual(list(tibiapy.Character.__slots_inherited__()), character.keys())
+        self.assertIs(tibiapy.Character._get_keys(), tibiapy.Character._get_keys())
+        self.assertNotEqual(tibiapy.Character._get_keys(), tibiapy.Guild._get_keys())
+        with self.assertRaises(KeyError):
+            character["unknown"]
+
+    def test_serializable_to_json_bytes(self):
+        """Testing that the JSON bytes contain the same data as to_json"""
+        parsed = tibiapy.KillStatistics.from_content(self.load_resource(FILE_KILL_STATISTICS_FULL))
+
+        self.assertEqual(parsed.to_json().encode(), parsed.to_json_bytes())
+        self.assertEqual(json.loads(parsed.to_json()), json.loads(parsed.to_json_bytes(fast=True)))
+        with mock.patch("tibiapy.abc.orjson", None):
+            self.assertEqual(parsed.to_json().encode(), parsed.to_json_bytes(fast=True))
+
+    def test_serve_json_response(self):
+        """Testing that the server encodes responses with the fast encoder if available"""
+        import serve
+
+        parsed = tibiapy.KillStatistics.from_content(self.load_resource(FILE_KILL_STATISTICS_FULL))
+        response = serve.CustomJson.response([parsed])
+
+        self.assertEqual("application/json", response.content_type)
+        self.assertEqual(tibiapy.abc.Serializable._dumps_bytes([parsed], fast=True), response.body)
+        self.assertEqual([json.loads(parsed.to_json())], json.loads(response.body))
+        with mock.patch("tibiapy.abc.orjson", None):
+            self.assertEqual(f"[{parsed.to_json()}]".encode(), serve.CustomJson.response([parsed]).body)
+
+    def test_serializable_from_json_round_trip(self):
+        """Testing that every parsed resource can be restored from its JSON representation"""
+        for parser, resources in ROUND_TRIP_RESOURCES:
+            for resource in resources:
+                with self.subTest(resource=resource):
+                    parsed = parser(self.load_resource(resource))
+                    for original in parsed if isinstance(parsed, list) else [parsed]:
+                        restored = type(original).from_json(original.to_json())
+
+                        self.assertRestored(original, restored)
+                        self.assertEqual(original.to_json(), restored.to_json())
+
+    def test_serializable_from_dict_subclass(self):
+        """Testing that from_dict creates the subclass containing all the keys"""
+        entry = tibiapy.LoyaltyHighscoresEntry(1, "Name", "Knight", "Antica", 100, 5, "Warlord of Tibia")
+        highscores = tibiapy.Highscores("Antica", tibiapy.Category.LOYALTY_POINTS, entries=[entry])
+
+        restored = tibiapy.Highscores.from_dict(highscores.to_dict())
+
+        self.assertIsInstance(restored.entries[0], tibiapy.LoyaltyHighscoresEntry)
+        self.assertEqual(entry.title, restored.entries[0].title)
+        self.assertEqual(tibiapy.Category.LOYALTY_POINTS, restored.category)
+        self.assertEqual(tibiapy.Vocation.KNIGHT, restored.entries[0].vocation)
+        self.assertIsInstance(tibiapy.HighscoresEntry.from_dict({"name": "Name"}), tibiapy.HighscoresEntry)
+
+    def test_tibia_response_from_json(self):
+        """Testing restoring a response and its data from its JSON representation"""
+        world = tibiapy.World.from_content(self.load_resource(tests_world.FILE_WORLD_FULL))
+        raw_response = tibiapy.client.RawResponse._from_values(datetime.datetime(2020, 1, 1, 12, 30), 0.5, True, 30, "")
+        response = tibiapy.TibiaResponse(raw_response, world, 0.25)
+
+        restored = tibiapy.TibiaResponse.from_json(response.to_json(), tibiapy.World)
+
+        self.assertEqual(response.timestamp, restored.timestamp)
+        self.assertEqual(response.parsing_time, restored.parsing_time)
+        self.assertRestored(world, restored.data)
+        self.assertIsInstance(tibiapy.TibiaResponse.from_json(response.to_json()).data, dict)
@@ -115,6 +115,37 @@ class TestWorld(TestCommons, unittest.TestCase):
         worlds = ListedWorld.list_from_content(content)
         self.assertEqual(len(world_overview.worlds), len(worlds))
 
+    def test_world_overview_cached_views(self):
+        """Testing that the derived views of the world overview are updated when its worlds change"""
+        world_overview = WorldOverview.from_content(self.load_resource(FILE_WORLD_LIST))
+        total_online = world_overview.total_online
+        world_overview.regular_worlds.clear()
+        self.assertEqual(65, len(world_overview.regular_worlds))
+
+        world_overview.worlds.append(ListedWorld("Gladera", online_count=100))
+        self.assertEqual(total_online + 100, world_overview.total_online)
+        self.assertEqual(66, len(world_overview.regular_worlds))
+
+        world_overview.worlds = [w for w in world_overview.worlds if w.tournament_world_type]
+        self.assertEqual(6, len(world_overview.tournament_worlds))
+        self.assertEqual([], world_overview.regular_worlds)
+
+        world_overview.worlds[2] = ListedWorld("Gladera", online_count=100)
+        self.assertEqual(5, len(world_overview.tournament_worlds))
+        self.assertEqual(["Gladera"], [w.name for w in world_overview.regular_worlds])
+
+    def test_world_overview_cached_views_cost(self):
+        """Testing that reading the derived views of the world overview again doesn't depend on the number of worlds"""
+        small_overview = WorldOverview(worlds=[ListedWorld(f"World {i}", online_count=i) for i in range(10)])
+        world_overview = WorldOverview(worlds=[ListedWorld(f"World {i}", online_count=i) for i in range(10000)])
+        self.assertEqual(49995000, world_overview.total_online)
+        self.assertEqual([], world_overview.tournament_worlds)
+
+        small_time = self.measure_time(lambda: (small_overview.total_online, small_overview.tournament_worlds))
+        cached_time = self.measure_time(lambda: (world_overview.total_online, world_overview.tournament_worlds))
+
+        self.assertLess(cached_time, small_time * 5)
+
     def test_world_overview_from_content_offline(self):
         """Testing parsing world overview with offline worlds"""
         content = self.load_resource(FILE_WORLD_LIST_OFFLINE)
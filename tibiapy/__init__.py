@@ -18,7 +18,9 @@ from tibiapy.news import *
 from tibiapy.tournament import *
 from tibiapy.world import *
 from tibiapy.bazaar import *
+from tibiapy.snapshot import *
 from tibiapy.client import *
+from tibiapy.crawler import *
 
 from logging import NullHandler
 
@@ -1,11 +1,19 @@
 import abc
 import datetime
 import enum
+import functools
 import json
+import operator
+import sys
 from collections import OrderedDict
 
 from tibiapy.enums import HouseOrder, HouseStatus, HouseType
-from tibiapy.utils import get_tibia_url
+from tibiapy.utils import get_tibia_url, try_enum
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class Serializable:
@@ -13,32 +21,124 @@ class Serializable:
 
     Only attributes defined in ``__slots__`` will be serialized.
 
-    .. note::
-        | There's no way to convert JSON strings back to their original object.
-        | Attempting to do so may result in data loss.
+    Objects can be restored from their JSON or dictionary representation using :meth:`from_json` and
+    :meth:`from_dict`. Additional properties are not restored, as they are computed from the other attributes.
     """
 
     _serializable_properties = ()
     """:class:`tuple` of :class:`str`: Additional properties to serialize."""
 
+    _serializable_types = {}
+    """:class:`dict`: The types of the attributes that can't be restored from their JSON representation as they are.
+
+    Types may be classes, or the name of a class defined or imported in the same module. A :class:`list` containing a
+    type represents a list of values of that type, a :class:`tuple` containing a type represents a tuple, and a
+    :class:`dict` mapping :class:`str` to a type represents a dictionary with values of that type.
+    """
+
+    _keys_cache = {}
+    """:class:`dict`: The serializable keys of every class and a set of them, computed on first use."""
+
+    _converters_cache = {}
+    """:class:`dict`: The attributes of every class and the functions to restore their values, computed on first use."""
+
     @classmethod
     def __slots_inherited__(cls):
         slots = []
+        base_slots = []
         for base in cls.__bases__:
             try:
                 # noinspection PyUnresolvedReferences
                 slots.extend(base.__slots_inherited__())
             except AttributeError:
-                continue
+                base_slots.extend(getattr(base, "__slots__", []))
         slots.extend(getattr(cls, "__slots__", []))
         slots.extend(getattr(cls, "_serializable_properties", []))
+        slots.extend(base_slots)
         return tuple(OrderedDict.fromkeys(slots))
 
+    @classmethod
+    def _get_keys(cls):
+        """Gets the serializable keys of the class and a set of them, computing them only once per class."""
+        keys = Serializable._keys_cache.get(cls)
+        if keys is None:
+            slots = cls.__slots_inherited__()
+            keys = Serializable._keys_cache[cls] = (slots, frozenset(slots))
+        return keys
+
+    @classmethod
+    def _get_converters(cls):
+        """Gets the attributes of the class and the functions to restore their values, computing them only once."""
+        converters = Serializable._converters_cache.get(cls)
+        if converters is None:
+            slots = []
+            types = {}
+            for base in reversed(cls.__mro__):
+                slots.extend(vars(base).get("__slots__", ()))
+                module = sys.modules.get(base.__module__)
+                for key, value_type in vars(base).get("_serializable_types", {}).items():
+                    types[key] = Serializable._get_converter(value_type, module)
+            slots = tuple(OrderedDict.fromkeys(slot for slot in slots if not slot.startswith("__")))
+            converters = Serializable._converters_cache[cls] = (slots, types)
+        return converters
+
+    @staticmethod
+    def _get_converter(value_type, module=None):
+        """Gets a function that restores a value of the given type from its JSON representation.
+
+        Parameters
+        ----------
+        value_type:
+            The type of the value, as described in :attr:`_serializable_types`.
+        module:
+            The module where class names are looked up.
+
+        Returns
+        -------
+        :class:`callable`, optional
+            The function that restores the value, or :obj:`None` if the value is kept as it is.
+        """
+        if isinstance(value_type, str):
+            value_type = getattr(module, value_type)
+        if isinstance(value_type, list):
+            converter = Serializable._get_converter(value_type[0], module)
+            return (lambda value: [converter(v) for v in value]) if converter else list
+        if isinstance(value_type, tuple):
+            converter = Serializable._get_converter(value_type[0], module)
+            return (lambda value: tuple(converter(v) for v in value)) if converter else tuple
+        if isinstance(value_type, dict):
+            converter = Serializable._get_converter(next(iter(value_type.values())), module)
+            return (lambda value: {k: converter(v) for k, v in value.items()}) if converter else dict
+        if issubclass(value_type, Serializable):
+            return value_type.from_dict
+        if issubclass(value_type, enum.Flag):
+            return lambda value: functools.reduce(operator.or_, (value_type[v.upper()] for v in value), value_type(0))
+        if issubclass(value_type, enum.Enum):
+            return lambda value: try_enum(value_type, value)
+        if value_type is datetime.datetime:
+            return _parse_isoformat
+        if value_type is datetime.date:
+            return lambda value: datetime.datetime.strptime(value, "%Y-%m-%d").date()
+        if value_type is datetime.timedelta:
+            return lambda value: datetime.timedelta(seconds=value)
+        return None
+
+    @classmethod
+    def _get_class_for(cls, data):
+        """Gets the class or subclass that contains all the keys of a dictionary representation."""
+        if cls._get_keys()[1].issuperset(data):
+            return cls
+        for subclass in cls.__subclasses__():
+            match = subclass._get_class_for(data)
+            if match is not None:
+                return match
+        return None
+
     def keys(self):
-        return list(self.__slots_inherited__())
+        return list(self._get_keys()[0])
 
     def __getitem__(self, item):
-        if item in self.keys():
+        if item in self._get_keys()[1]:
             try:
                 return getattr(self, item)
             except AttributeError:
@@ -47,7 +147,7 @@ class Serializable:
             raise KeyError(item)
 
     def __setitem__(self, key, value):
-        if key in self.keys():
+        if key in self._get_keys()[1]:
             setattr(self, key, value)
         else:
             raise KeyError(key)
@@ -67,6 +167,89 @@ class Serializable:
         except TypeError:
             return str(obj)
 
+    @staticmethod
+    def _to_dict_value(value):
+        """Converts a value into its JSON compatible representation, the same way :meth:`to_json` does."""
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        if isinstance(value, Serializable):
+            return value.to_dict()
+        if isinstance(value, (list, tuple)):
+            return [Serializable._to_dict_value(v) for v in value]
+        if isinstance(value, dict):
+            return {k: Serializable._to_dict_value(v) for k, v in value.items()}
+        return Serializable._to_dict_value(Serializable._try_dict(value))
+
+    def to_dict(self):
+        """Gets the object's dictionary representation, as used for its JSON representation.
+
+        Nested objects are converted recursively, and attributes with a value of :obj:`None` are omitted.
+
+        .. versionadded:: 3.6.0
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary containing only JSON compatible values.
+        """
+        output = {}
+        for key in self._get_keys()[0]:
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
+            if value is not None:
+                output[key] = self._to_dict_value(value)
+        return output
+
+    @classmethod
+    def from_dict(cls, data):
+        """Creates an instance of the class from its dictionary representation, as returned by :meth:`to_dict`.
+
+        Enums, dates and nested objects are restored to their original types. If the dictionary contains attributes
+        that are only found in a subclass, such as :class:`LoyaltyHighscoresEntry`, an instance of that subclass is
+        created instead. Attributes missing from the dictionary are set to :obj:`None`.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            The dictionary representation of the object.
+
+        Returns
+        -------
+        :class:`Serializable`
+            The restored object.
+        """
+        cls = cls._get_class_for(data) or cls
+        slots, converters = cls._get_converters()
+        obj = cls.__new__(cls)
+        for key in slots:
+            value = data.get(key)
+            if value is not None and key in converters:
+                value = converters[key](value)
+            setattr(obj, key, value)
+        return obj
+
+    @classmethod
+    def from_json(cls, content):
+        """Creates an instance of the class from its JSON representation, as returned by :meth:`to_json`.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        content: :class:`str` or :class:`bytes`
+            The JSON representation of the object.
+
+        Returns
+        -------
+        :class:`Serializable`
+            The restored object.
+        """
+        return cls.from_dict(json.loads(content))
+
     def to_json(self, *, indent=None, sort_keys=False):
         """Gets the object's JSON representation.
 
@@ -82,8 +265,67 @@ class Serializable:
         :class:`str`
             JSON representation of the object.
         """
-        return json.dumps({k: v for k, v in dict(self).items() if v is not None}, indent=indent, sort_keys=sort_keys,
-                          default=self._try_dict)
+        return json.dumps(self.to_dict(), indent=indent, sort_keys=sort_keys)
+
+    def to_json_bytes(self, *, fast=False):
+        """Gets the object's JSON representation, encoded as UTF-8 bytes.
+
+        By default, the result is the same as encoding the result of :meth:`to_json`.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        fast: :class:`bool`, optional
+            Whether to encode the object using `orjson <https://pypi.org/project/orjson/>`_ if it is installed,
+            which is considerably faster. Its output contains the same keys, in the same order, and the same values
+            as :meth:`to_json`, but without whitespace and without escaping non-ASCII characters.
+
+        Returns
+        -------
+        :class:`bytes`
+            JSON representation of the object.
+        """
+        return self._encode_bytes(self.to_dict(), fast=fast)
+
+    @staticmethod
+    def _dumps_bytes(value, *, fast=False):
+        """Encodes a value as JSON bytes.
+
+        Parameters
+        ----------
+        value:
+            The value to encode. It may contain :class:`Serializable` objects.
+        fast: :class:`bool`
+            Whether to use orjson if available.
+
+        Returns
+        -------
+        :class:`bytes`
+            The JSON representation of the value.
+        """
+        return Serializable._encode_bytes(Serializable._to_dict_value(value), fast=fast)
+
+    @staticmethod
+    def _encode_bytes(value, *, fast=False):
+        """Encodes a value that only contains JSON compatible types as JSON bytes, optionally using orjson."""
+        if fast and orjson is not None:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(value).encode()
+
+
+def _parse_isoformat(value):
+    """Parses a datetime in the format returned by :meth:`datetime.datetime.isoformat`."""
+    if hasattr(datetime.datetime, "fromisoformat"):
+        return datetime.datetime.fromisoformat(value)
+    if len(value) > 19 and value[-6] in "+-" and value[-3] == ":":
+        value = value[:-3] + value[-2:]
+    for date_format in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f"):
+        try:
+            return datetime.datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    raise ValueError("invalid isoformat string: %r" % value)
 
 
 class BaseAnnouncement(metaclass=abc.ABCMeta):
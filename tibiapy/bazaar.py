@@ -1,4 +1,5 @@
 import datetime
+import itertools
 import logging
 import re
 import urllib.parse
@@ -14,7 +15,8 @@ from tibiapy.enums import AuctionOrder, AuctionOrderBy, AuctionSearchType, Aucti
     PvpTypeFilter, \
     SkillFilter, \
     VocationAuctionFilter
-from tibiapy.utils import convert_line_breaks, deprecated, get_tibia_url, parse_integer, parse_pagination, \
+from tibiapy.utils import _TrackedListsMixin, convert_line_breaks, deprecated, get_tibia_url, parse_integer, \
+    parse_pagination, \
     parse_tibia_datetime, \
     parse_tibia_money, \
     parse_tibiacom_content, \
@@ -24,6 +26,7 @@ __all__ = (
     "AchievementEntry",
     "AuctionDetails",
     "AuctionFilters",
+    "AuctionQuery",
     "CharacterBazaar",
     "CharmEntry",
     "BestiaryEntry",
@@ -47,6 +50,26 @@ id_regex = re.compile(r'(\d+).(?:gif|png)')
 description_regex = re.compile(r'"(?:an?\s)?([^"]+)"')
 quotes = re.compile(r'"([^"]+)"')
 
+_VOCATION_FILTERS = {
+    Vocation.NONE: VocationAuctionFilter.NONE,
+    Vocation.DRUID: VocationAuctionFilter.DRUID,
+    Vocation.ELDER_DRUID: VocationAuctionFilter.DRUID,
+    Vocation.KNIGHT: VocationAuctionFilter.KNIGHT,
+    Vocation.ELITE_KNIGHT: VocationAuctionFilter.KNIGHT,
+    Vocation.PALADIN: VocationAuctionFilter.PALADIN,
+    Vocation.ROYAL_PALADIN: VocationAuctionFilter.PALADIN,
+    Vocation.SORCERER: VocationAuctionFilter.SORCERER,
+    Vocation.MASTER_SORCERER: VocationAuctionFilter.SORCERER,
+}
+
+# The attributes of listed auctions that can be used to merge the results of multiple queries in order.
+_ORDER_ATTRIBUTES = {
+    AuctionOrderBy.BID: "bid",
+    AuctionOrderBy.END_DATE: "auction_end",
+    AuctionOrderBy.LEVEL: "level",
+    AuctionOrderBy.START_DATE: "auction_start",
+}
+
 log = logging.getLogger("tibiapy")
 
 
@@ -120,6 +143,16 @@ class AuctionFilters(abc.Serializable):
         "search_type",
     )
 
+    _serializable_types = {
+        "pvp_type": PvpTypeFilter,
+        "battleye": BattlEyeTypeFilter,
+        "vocation": VocationAuctionFilter,
+        "skill": SkillFilter,
+        "order": AuctionOrder,
+        "order_by": AuctionOrderBy,
+        "search_type": AuctionSearchType,
+    }
+
     def __init__(self, **kwargs):
         self.world: Optional[str] = kwargs.get("world")
         self.pvp_type: Optional[PvpTypeFilter] = kwargs.get("pvp_type")
@@ -247,6 +280,183 @@ class AuctionFilters(abc.Serializable):
         return filters
 
 
+class AuctionQuery:
+    """A query of the current auctions, combining the filters Tibia.com can apply with conditions checked locally.
+
+    Every condition that can be expressed with :class:`AuctionFilters` is applied by Tibia.com, so only the pages
+    containing matching auctions are fetched. Conditions with multiple values, like several worlds or vocations, are
+    split into multiple filters, one per combination, as long as they don't exceed ``max_splits``. The remaining
+    conditions are checked locally on every :class:`ListedAuction`.
+
+    If a bid range is given and no order is requested, the auctions are ordered by their bid, so the pages after the
+    range can be skipped.
+
+    The query is executed by :meth:`Client.iter_auctions`.
+
+    .. versionadded:: 3.6.0
+
+    Examples
+    --------
+    Knights between levels 300 and 400, with sword fighting 100 or higher, on Optional PvP worlds, sorted by bid:
+
+    .. code-block:: python
+
+        query = AuctionQuery(vocations=[VocationAuctionFilter.KNIGHT], min_level=300, max_level=400,
+                             skill=SkillFilter.SWORD_FIGHTING, min_skill_level=100,
+                             pvp_type=PvpTypeFilter.OPTIONAL_PVP, order_by=AuctionOrderBy.BID)
+        async for auction in client.iter_auctions(query):
+            print(auction.name, auction.bid)
+
+    Parameters
+    ----------
+    worlds: :class:`list` of :class:`str`, optional
+        The worlds the characters must be in.
+    pvp_type: :class:`PvpTypeFilter`, optional
+        The PvP type of the characters' worlds.
+    battleye: :class:`BattlEyeTypeFilter`, optional
+        The type of BattlEye protection of the characters' worlds.
+    vocations: :class:`list` of :class:`VocationAuctionFilter`, optional
+        The vocations the characters must have.
+    min_level: :class:`int`, optional
+        The minimum level of the characters.
+    max_level: :class:`int`, optional
+        The maximum level of the characters.
+    skill: :class:`SkillFilter`, optional
+        The skill to filter by its level range.
+    min_skill_level: :class:`int`, optional
+        The minimum level of the selected skill.
+    max_skill_level: :class:`int`, optional
+        The maximum level of the selected skill.
+    min_bid: :class:`int`, optional
+        The minimum bid of the auctions.
+    max_bid: :class:`int`, optional
+        The maximum bid of the auctions.
+    search_string: :class:`str`, optional
+        The search term to filter out auctions.
+    search_type: :class:`AuctionSearchType`, optional
+        The type of search to use.
+    order_by: :class:`AuctionOrderBy`, optional
+        The value to order the auctions by.
+    order: :class:`AuctionOrder`, optional
+        The ordering direction. Highest or latest first by default.
+    predicate: :class:`callable`, optional
+        An additional condition, called with every :class:`ListedAuction` that matched the other conditions.
+    max_splits: :class:`int`
+        The maximum number of filters a query can be split into.
+    """
+
+    def __init__(self, *, worlds=None, pvp_type=None, battleye=None, vocations=None, min_level=None, max_level=None,
+                 skill=None, min_skill_level=None, max_skill_level=None, min_bid=None, max_bid=None,
+                 search_string=None, search_type=None, order_by=None, order=None, predicate=None, max_splits=8):
+        self.worlds: Optional[List[str]] = list(worlds) if worlds is not None else None
+        self.pvp_type: Optional[PvpTypeFilter] = pvp_type
+        self.battleye: Optional[BattlEyeTypeFilter] = battleye
+        self.vocations: Optional[List[VocationAuctionFilter]] = list(vocations) if vocations is not None else None
+        self.min_level: Optional[int] = min_level
+        self.max_level: Optional[int] = max_level
+        self.skill: Optional[SkillFilter] = skill
+        self.min_skill_level: Optional[int] = min_skill_level
+        self.max_skill_level: Optional[int] = max_skill_level
+        self.min_bid: Optional[int] = min_bid
+        self.max_bid: Optional[int] = max_bid
+        self.search_string: Optional[str] = search_string
+        self.search_type: Optional[AuctionSearchType] = search_type
+        self.order_by: Optional[AuctionOrderBy] = order_by
+        self.order: Optional[AuctionOrder] = order
+        self.predicate = predicate
+        self.max_splits: int = max_splits
+        if self.order_by is None and (min_bid is not None or max_bid is not None):
+            self.order_by = AuctionOrderBy.BID
+            self.order = AuctionOrder.LOWEST_EARLIEST if max_bid is not None else AuctionOrder.HIGHEST_LATEST
+        if self.order_by is not None and self.order is None:
+            self.order = AuctionOrder.HIGHEST_LATEST
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} worlds={self.worlds!r} vocations={self.vocations!r} " \
+               f"order_by={self.order_by!r}>"
+
+    @property
+    def order_attribute(self):
+        """:class:`str`: The attribute of :class:`ListedAuction` the results are ordered by, if they can be merged
+        in order."""
+        return _ORDER_ATTRIBUTES.get(self.order_by)
+
+    def plan(self):
+        """Gets the filters that must be applied by Tibia.com to get the auctions matching the query.
+
+        Returns
+        -------
+        :class:`list` of :class:`AuctionFilters`
+            The filters to apply. The auctions of each filter must then be checked with :meth:`matches`.
+        """
+        worlds = self.worlds or [None]
+        vocations = self.vocations or [None]
+        # Results from multiple filters can only be merged in order if the ordered value is known.
+        can_split = self.order_by is None or self.order_attribute is not None
+        for split_worlds, split_vocations in ((True, True), (True, False), (False, True), (False, False)):
+            count = (len(worlds) if split_worlds else 1) * (len(vocations) if split_vocations else 1)
+            if count == 1 or (can_split and count <= self.max_splits):
+                break
+        worlds = worlds if split_worlds or len(worlds) == 1 else [None]
+        vocations = vocations if split_vocations or len(vocations) == 1 else [None]
+        return [AuctionFilters(world=world, pvp_type=self.pvp_type, battleye=self.battleye, vocation=vocation,
+                               min_level=self.min_level, max_level=self.max_level, skill=self.skill,
+                               min_skill_level=self.min_skill_level, max_skill_level=self.max_skill_level,
+                               order_by=self.order_by, order=self.order, search_string=self.search_string,
+                               search_type=self.search_type)
+                for world, vocation in itertools.product(worlds, vocations)]
+
+    def matches(self, auction):
+        """Checks if an auction matches the conditions of the query.
+
+        Conditions that can only be applied by Tibia.com, like the skill range or the search string, are not checked.
+
+        Parameters
+        ----------
+        auction: :class:`ListedAuction`
+            The auction to check.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the auction matches the query or not.
+        """
+        if self.worlds is not None and auction.world not in self.worlds:
+            return False
+        if self.vocations is not None and _VOCATION_FILTERS.get(auction.vocation) not in self.vocations:
+            return False
+        if self.min_level is not None and auction.level < self.min_level:
+            return False
+        if self.max_level is not None and auction.level > self.max_level:
+            return False
+        if self.min_bid is not None and auction.bid < self.min_bid:
+            return False
+        if self.max_bid is not None and auction.bid > self.max_bid:
+            return False
+        return self.predicate is None or bool(self.predicate(auction))
+
+    def is_past_results(self, auction):
+        """Checks if an auction comes after all the auctions matching the query, according to the query's order.
+
+        When this is true, the following auctions and pages don't need to be checked.
+
+        Parameters
+        ----------
+        auction: :class:`ListedAuction`
+            The auction to check.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the auction is past the matching results.
+        """
+        if self.order_by != AuctionOrderBy.BID:
+            return False
+        if self.order == AuctionOrder.HIGHEST_LATEST:
+            return self.min_bid is not None and auction.bid < self.min_bid
+        return self.max_bid is not None and auction.bid > self.max_bid
+
+
 class BestiaryEntry(abc.Serializable):
     """The bestiary progress for a specific creature.
 
@@ -325,6 +535,12 @@ class CharacterBazaar(abc.Serializable):
         "entries",
     )
 
+    _serializable_types = {
+        "type": BazaarType,
+        "filters": AuctionFilters,
+        "entries": ["ListedAuction"],
+    }
+
     def __init__(self, **kwargs):
         self.type: BazaarType = kwargs.get("type")
         self.filters: Optional[AuctionFilters] = kwargs.get("filters")
@@ -388,7 +604,7 @@ class CharacterBazaar(abc.Serializable):
             The character bazaar with the entries found.
         """
         try:
-            parsed_content = parse_tibiacom_content(content, builder='html5lib')
+            parsed_content = parse_tibiacom_content(content, fix_self_closing=True)
             tables = parsed_content.find_all("div", attrs={"class": "TableContainer"})
             filter_table = None
             if len(tables) == 1:
@@ -650,6 +866,18 @@ class ListedAuction(BaseCharacter, abc.Serializable):
         "status",
     )
 
+    _serializable_types = {
+        "vocation": Vocation,
+        "sex": Sex,
+        "outfit": "OutfitImage",
+        "displayed_items": [DisplayItem],
+        "sales_arguments": ["SalesArgument"],
+        "auction_start": datetime.datetime,
+        "auction_end": datetime.datetime,
+        "bid_type": BidType,
+        "status": AuctionStatus,
+    }
+
     def __init__(self, **kwargs):
         self.auction_id: int = kwargs.get("auction_id", 0)
         self.name: str = kwargs.get("name")
@@ -963,6 +1191,22 @@ class AuctionDetails(ListedAuction):
         "bestiary_progress",
     )
 
+    _serializable_types = {
+        "skills": ["SkillEntry"],
+        "creation_date": datetime.datetime,
+        "regular_world_transfer_available_date": datetime.datetime,
+        "items": "ItemSummary",
+        "store_items": "ItemSummary",
+        "mounts": "Mounts",
+        "store_mounts": "Mounts",
+        "outfits": "Outfits",
+        "store_outfits": "Outfits",
+        "blessings": [BlessingEntry],
+        "charms": [CharmEntry],
+        "achievements": [AchievementEntry],
+        "bestiary_progress": [BestiaryEntry],
+    }
+
     @property
     def completed_bestiary_entries(self):
         """:class:`list` of :class:`BestiaryEntry`: Gets a list of completed bestiary entries."""
@@ -979,7 +1223,7 @@ class AuctionDetails(ListedAuction):
         return {skill.name: skill for skill in self.skills}
 
     @classmethod
-    def from_content(cls, content, auction_id=0, skip_details=False):
+    def from_content(cls, content, auction_id=0, skip_details=False, sections=None):
         """Parses an auction detail page from Tibia.com and extracts its data.
 
         Parameters
@@ -995,6 +1239,15 @@ class AuctionDetails(ListedAuction):
 
             This allows fetching basic information like name, level, vocation, world, bid and status, shaving off some
             parsing time.
+        sections: :class:`collections.abc.Iterable` of :class:`str`, optional
+            The ids of the details sections to parse. By default, all sections are parsed.
+
+            The available sections are ``General``, ``ItemSummary``, ``StoreItemSummary``, ``Mounts``,
+            ``StoreMounts``, ``Outfits``, ``StoreOutfits``, ``Blessings``, ``Imbuements``, ``Charms``,
+            ``CompletedCyclopediaMapAreas``, ``CompletedQuestLines``, ``Titles``, ``Achievements`` and
+            ``BestiaryProgress``. The remaining sections are not parsed at all, and their attributes are left empty.
+
+            .. versionadded:: 3.6.0
 
         Returns
         -------
@@ -1006,7 +1259,15 @@ class AuctionDetails(ListedAuction):
         InvalidContent
             If the content does not belong to a auction detail's page.
         """
-        parsed_content = parse_tibiacom_content(content, builder='html5lib' if not skip_details else 'lxml')
+        if skip_details:
+            sections = ()
+        strainer = None
+        if sections is not None:
+            sections = set(sections)
+            # Only the auction and the requested details blocks are built, the rest of the page is skipped entirely.
+            strainer = bs4.SoupStrainer("div", attrs={"class": ["Auction", "CharacterDetailsBlock"],
+                                                      "id": lambda value: value is None or value in sections})
+        parsed_content = parse_tibiacom_content(content, builder='lxml', parse_only=strainer, fix_self_closing=True)
         auction_row = parsed_content.find("div", attrs={"class": "Auction"})
         if not auction_row:
             if "internal error" in content:
@@ -1310,7 +1571,7 @@ class OutfitImage(abc.Serializable):
                f"image_url={self.image_url!r}>"
 
 
-class PaginatedSummary(abc.Serializable):
+class PaginatedSummary(_TrackedListsMixin, abc.Serializable):
     """Represents a paginated summary in the character auction section.
 
     Attributes
@@ -1328,6 +1589,11 @@ class PaginatedSummary(abc.Serializable):
     """
     entry_class = None
 
+    _id_attribute = None
+    # The index of the entries, built on the first lookup.
+    _index = None
+    _tracked_lists = ("entries",)
+
     def __init__(self, **kwargs):
         self.page: int = kwargs.get("page", 1)
         self.total_pages: int = kwargs.get("total_pages", 1)
@@ -1360,7 +1626,12 @@ class PaginatedSummary(abc.Serializable):
         :class:`object`:
             The entry matching the name.
         """
-        return next((e for e in self.entries if e.name.lower() == name.lower()), None)
+        index = self._get_index()
+        entry = index.by_name.get(name.lower())
+        if entry is not None and (entry.name or "").lower() != name.lower():
+            index = self._get_index(rebuild=True)
+            entry = index.by_name.get(name.lower())
+        return entry
 
     def search(self, value):
         """Searches an entry by its name
@@ -1375,7 +1646,7 @@ class PaginatedSummary(abc.Serializable):
         :class:`list`
             A list of entries with names containing the search term.
         """
-        return [e for e in self.entries if value.lower() in e.name.lower()]
+        return self._get_index().search(value)
 
     def get_by_id(self, name):
         """Gets an entry by its id.
@@ -1392,12 +1663,99 @@ class PaginatedSummary(abc.Serializable):
         """
         return NotImplemented
 
+    def _get_index(self, rebuild=False):
+        """Gets the index of the entries, building it or adding the new entries to it if needed.
+
+        Parameters
+        ----------
+        rebuild: :class:`bool`
+            Whether to build the index again, even if it seems up to date.
+
+        Returns
+        -------
+        :class:`_SummaryIndex`
+            The index of the current entries.
+        """
+        index = self._index
+        if rebuild or index is None or not index.is_valid(self.entries):
+            index = self._index = _SummaryIndex(self.entries, self._id_attribute)
+        else:
+            index.update()
+        return index
+
+    def _get_by_indexed_id(self, entry_id):
+        """Gets an entry by its id, using the index."""
+        index = self._get_index()
+        entry = index.by_id.get(entry_id)
+        if entry is not None and getattr(entry, self._id_attribute) != entry_id:
+            entry = self._get_index(rebuild=True).by_id.get(entry_id)
+        return entry
+
     def _parse_pagination(self, parsed_content):
         pagination_block = parsed_content.find("div", attrs={"class": "BlockPageNavigationRow"})
         if pagination_block is not None:
             self.page, self.total_pages, self.results = parse_pagination(pagination_block)
 
 
+class _SummaryIndex:
+    """Indexes the entries of a :class:`PaginatedSummary` by name, id and the trigrams of their names.
+
+    Entries appended to the list are added the next time the index is used.
+    If the list is replaced or the version of the list changes, the index must be built again.
+    """
+
+    __slots__ = (
+        "entries",
+        "id_attribute",
+        "version",
+        "names",
+        "by_name",
+        "by_id",
+        "trigrams",
+    )
+
+    def __init__(self, entries, id_attribute=None):
+        self.entries = entries
+        self.id_attribute = id_attribute
+        self.version = entries.version
+        self.names = []
+        self.by_name = {}
+        self.by_id = {}
+        self.trigrams = {}
+        self.update()
+
+    def is_valid(self, entries):
+        """Checks if the index can still be used for a list of entries, after adding the new entries to it."""
+        return entries is self.entries and entries.version == self.version and len(self.names) <= len(entries)
+
+    def update(self):
+        """Adds the entries appended since the last update to the index."""
+        for position in range(len(self.names), len(self.entries)):
+            entry = self.entries[position]
+            name = (entry.name or "").lower()
+            self.names.append(name)
+            self.by_name.setdefault(name, entry)
+            if self.id_attribute:
+                self.by_id.setdefault(getattr(entry, self.id_attribute), entry)
+            for trigram in {name[i:i + 3] for i in range(len(name) - 2)}:
+                self.trigrams.setdefault(trigram, []).append(position)
+
+    def search(self, value):
+        """Gets the entries whose names contain a value, in their original order."""
+        value = value.lower()
+        if len(value) < 3:
+            positions = range(len(self.names))
+        else:
+            candidates = []
+            for i in range(len(value) - 2):
+                positions = self.trigrams.get(value[i:i + 3])
+                if positions is None:
+                    return []
+                candidates.append(positions)
+            positions = min(candidates, key=len)
+        return [self.entries[p] for p in positions if value in self.names[p]]
+
+
 class ItemSummary(PaginatedSummary):
     """Items in a character's inventory and depot.
 
@@ -1416,6 +1774,11 @@ class ItemSummary(PaginatedSummary):
     """
     entries: List[DisplayItem]
     entry_class = DisplayItem
+    _id_attribute = "item_id"
+
+    _serializable_types = {
+        "entries": [DisplayItem],
+    }
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1433,7 +1796,7 @@ class ItemSummary(PaginatedSummary):
         :class:`DisplayItem`
             The item matching the id.
         """
-        return next((e for e in self.entries if e.item_id == entry_id), None)
+        return self._get_by_indexed_id(entry_id)
 
     @classmethod
     def _parse_table(cls, table):
@@ -1477,6 +1840,11 @@ class Mounts(PaginatedSummary):
     """
     entries: List[DisplayMount]
     entry_class = DisplayMount
+    _id_attribute = "mount_id"
+
+    _serializable_types = {
+        "entries": [DisplayMount],
+    }
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1494,7 +1862,7 @@ class Mounts(PaginatedSummary):
         :class:`DisplayMount`
             The mount matching the id.
         """
-        return next((e for e in self.entries if e.mount_id == entry_id), None)
+        return self._get_by_indexed_id(entry_id)
 
     @classmethod
     def _parse_table(cls, table):
@@ -1526,6 +1894,11 @@ class Outfits(PaginatedSummary):
     """
     entries: List[DisplayOutfit]
     entry_class = DisplayOutfit
+    _id_attribute = "outfit_id"
+
+    _serializable_types = {
+        "entries": [DisplayOutfit],
+    }
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1543,7 +1916,7 @@ class Outfits(PaginatedSummary):
         :class:`DisplayOutfit`
             The outfit matching the id.
         """
-        return next((e for e in self.entries if e.outfit_id == entry_id), None)
+        return self._get_by_indexed_id(entry_id)
 
     @classmethod
     def _parse_table(cls, table):
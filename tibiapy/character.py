@@ -91,6 +91,10 @@ class AccountInformation(abc.Serializable):
         "position",
     )
 
+    _serializable_types = {
+        "created": datetime.datetime,
+    }
+
     def __init__(self, created, loyalty_title=None, position=None):
         self.created = try_datetime(created)
         self.loyalty_title: Optional[str] = loyalty_title
@@ -223,6 +227,33 @@ class Character(abc.BaseCharacter, abc.Serializable):
         "hidden",
     )
 
+    _serializable_types = {
+        "sex": Sex,
+        "vocation": Vocation,
+        "deletion_date": datetime.datetime,
+        "houses": [CharacterHouse],
+        "guild_membership": "GuildMembership",
+        "last_login": datetime.datetime,
+        "account_status": AccountStatus,
+        "account_badges": [AccountBadge],
+        "achievements": [Achievement],
+        "deaths": ["Death"],
+        "account_information": AccountInformation,
+        "other_characters": ["OtherCharacter"],
+    }
+
+    # The sections that can be parsed on first access, by table title, with the method that parses them and the
+    # attributes they fill, with their default values.
+    _LAZY_SECTIONS = OrderedDict([
+        ("Account Achievements", ("_parse_achievements", (("achievements", list),))),
+        ("Account Badges", ("_parse_badges", (("account_badges", list),))),
+        ("Character Deaths", ("_parse_deaths", (("deaths", list), ("deaths_truncated", bool)))),
+        ("Characters", ("_parse_other_characters", (("other_characters", list),))),
+    ])
+    _LAZY_ATTRIBUTES = {attr: title for title, (_, attrs) in _LAZY_SECTIONS.items() for attr, _ in attrs}
+
+    _pending_tables = None
+
     def __init__(self, name=None, world=None, vocation=None, level=0, sex=None, **kwargs):
         self.name: str = name
         self.traded: bool = kwargs.get("traded", False)
@@ -255,6 +286,19 @@ class Character(abc.BaseCharacter, abc.Serializable):
         return f"<{self.__class__.__name__} name={self.name!r} world={self.world!r} vocation={self.vocation!r} " \
                f"level={self.level} sex={self.sex!r}>"
 
+    def __getattr__(self, name):
+        # Only called when the attribute is not set, which is the case for sections that haven't been parsed yet.
+        title = self._LAZY_ATTRIBUTES.get(name)
+        if title is None or not self._pending_tables or title not in self._pending_tables:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+        self._parse_pending_section(title)
+        return getattr(self, name)
+
+    def __reduce_ex__(self, protocol):
+        # The pending tables can't be pickled or copied, so every section is parsed beforehand.
+        self._parse_pending_sections()
+        return super().__reduce_ex__(protocol)
+
     # region Properties
     @property
     def deleted(self) -> bool:
@@ -289,13 +333,21 @@ class Character(abc.BaseCharacter, abc.Serializable):
 
     # region Public methods
     @classmethod
-    def from_content(cls, content):
+    def from_content(cls, content, lazy=False):
         """Creates an instance of the class from the html content of the character's page.
 
         Parameters
         ----------
         content: :class:`str`
             The HTML content of the page.
+        lazy: :class:`bool`, optional
+            Whether to defer parsing the character's achievements, badges, deaths and other characters until the
+            first time they are accessed. Disabled by default.
+
+            The character's information is always parsed immediately. This saves most of the parsing time when only
+            the character's information is needed, at the cost of keeping the parsed tables in memory.
+
+            .. versionadded:: 3.6.0
 
         Returns
         -------
@@ -316,16 +368,42 @@ class Character(abc.BaseCharacter, abc.Serializable):
             char._parse_character_information(tables["Character Information"])
         else:
             raise InvalidContent("content does not contain a tibia.com character information page.")
+        char._parse_account_information(tables.get("Account Information", []))
+        if lazy:
+            char._pending_tables = OrderedDict((title, tables.get(title)) for title in cls._LAZY_SECTIONS)
+            for attr in cls._LAZY_ATTRIBUTES:
+                delattr(char, attr)
+            return char
         char._parse_achievements(tables.get("Account Achievements", []))
         if "Account Badges" in tables:
             char._parse_badges(tables["Account Badges"])
         char._parse_deaths(tables.get("Character Deaths", []))
-        char._parse_account_information(tables.get("Account Information", []))
         char._parse_other_characters(tables.get("Characters", []))
         return char
     # endregion
 
     # region Private methods
+    def _parse_pending_section(self, title):
+        """Parses a section that was deferred when parsing lazily.
+
+        Parameters
+        ----------
+        title: :class:`str`
+            The title of the section's table.
+        """
+        rows = self._pending_tables.pop(title)
+        method, attrs = self._LAZY_SECTIONS[title]
+        for attr, default in attrs:
+            setattr(self, attr, default())
+        if rows:
+            getattr(self, method)(rows)
+
+    def _parse_pending_sections(self):
+        """Parses all the sections that haven't been parsed yet, if the character was parsed lazily."""
+        while self._pending_tables:
+            self._parse_pending_section(next(iter(self._pending_tables)))
+        self.__dict__.pop("_pending_tables", None)
+
     def _parse_account_information(self, rows):
         """
         Parses the character's account information
@@ -633,6 +711,12 @@ class Death(abc.Serializable):
         "by_player"
     )
 
+    _serializable_types = {
+        "killers": ["Killer"],
+        "assists": ["Killer"],
+        "time": datetime.datetime,
+    }
+
     def __init__(self, name=None, level=0, **kwargs):
         self.name = name
         self.level = level
@@ -770,6 +854,10 @@ class OnlineCharacter(abc.BaseCharacter, abc.Serializable):
         "level",
     )
 
+    _serializable_types = {
+        "vocation": Vocation,
+    }
+
     def __init__(self, name, world, level, vocation):
         self.name: str = name
         self.world: str = world
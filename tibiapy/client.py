@@ -1,7 +1,16 @@
 import asyncio
+import collections
+import concurrent.futures
+import copy
 import datetime
+import functools
+import hashlib
+import itertools
 import json
 import logging
+import os
+import pickle
+import sqlite3
 import time
 import typing
 
@@ -12,7 +21,8 @@ import tibiapy
 from tibiapy import abc, AuctionDetails, AuctionFilters, CharacterBazaar
 from tibiapy.character import Character
 from tibiapy.creature import BoostedCreature
-from tibiapy.enums import Category, HouseOrder, HouseStatus, HouseType, NewsCategory, NewsType, VocationFilter
+from tibiapy.enums import AuctionOrder, Category, HouseOrder, HouseStatus, HouseType, NewsCategory, NewsType, \
+    VocationFilter
 from tibiapy.errors import Forbidden, NetworkError, SiteMaintenanceError
 from tibiapy.event import EventSchedule
 from tibiapy.forum import CMPostArchive, ForumAnnouncement, ForumBoard, ForumPost, ForumThread, ListedBoard
@@ -26,6 +36,11 @@ from tibiapy.world import World, WorldOverview
 
 __all__ = (
     "TibiaResponse",
+    "ResponseCache",
+    "SQLiteResponseCache",
+    "ResponseArchive",
+    "ParseCache",
+    "RateLimiter",
     "Client",
 )
 
@@ -37,6 +52,25 @@ T = typing.TypeVar('T')
 
 log = logging.getLogger("tibiapy")
 
+# Sentinel used to tell apart missing entries from cached None values.
+_MISSING = object()
+
+
+def _timed_parse(parser, content, *args):
+    """Parses content, measuring the time it took.
+
+    This is defined at module level so it can be sent to process pools.
+
+    Returns
+    -------
+    :class:`tuple`
+        The parsed data and the time in seconds it took to parse it.
+    """
+    start_time = time.perf_counter()
+    parsed = parser(content, *args)
+    return parsed, time.perf_counter() - start_time
+
+
 class TibiaResponse(typing.Generic[T], abc.Serializable):
     """Represents a response from Tibia.com
 
@@ -74,6 +108,57 @@ class TibiaResponse(typing.Generic[T], abc.Serializable):
 
     _serializable_properties = ("time_left", )
 
+    _serializable_types = {
+        "timestamp": datetime.datetime,
+    }
+
+    @classmethod
+    def from_dict(cls, data, data_type=None):
+        """Creates a response from its dictionary representation, as returned by :meth:`to_dict`.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            The dictionary representation of the response.
+        data_type: optional
+            The type of the response's data, e.g. :class:`Character`, or ``[ListedNews]`` for a list.
+            If not provided, the data is kept in its dictionary representation.
+
+        Returns
+        -------
+        :class:`TibiaResponse`
+            The restored response.
+        """
+        response = super().from_dict(data)
+        if data_type is not None and response.data is not None:
+            converter = abc.Serializable._get_converter(data_type)
+            if converter is not None:
+                response.data = converter(response.data)
+        return response
+
+    @classmethod
+    def from_json(cls, content, data_type=None):
+        """Creates a response from its JSON representation, as returned by :meth:`to_json`.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        content: :class:`str` or :class:`bytes`
+            The JSON representation of the response.
+        data_type: optional
+            The type of the response's data, e.g. :class:`Character`, or ``[ListedNews]`` for a list.
+            If not provided, the data is kept in its dictionary representation.
+
+        Returns
+        -------
+        :class:`TibiaResponse`
+            The restored response.
+        """
+        return cls.from_dict(json.loads(content), data_type)
+
     @property
     def time_left(self):
         """:class:`datetime.timedelta`: The time left for the cache of this response to expire."""
@@ -97,8 +182,665 @@ class RawResponse:
             self.age = int(age)
         else:
             self.age = 0
+        self.url = str(response.url)
+        self.method = response.method
+        self.headers = dict(response.headers)
         self.content = None
 
+    @classmethod
+    def _from_values(cls, timestamp, fetching_time, cached, age, content, *, url=None, method=None, headers=None):
+        """Creates a response from its stored values, without a :class:`aiohttp.ClientResponse`."""
+        response = cls.__new__(cls)
+        response.timestamp = timestamp
+        response.fetching_time = fetching_time
+        response.cached = cached
+        response.age = age
+        response.url = url
+        response.method = method
+        response.headers = headers or {}
+        response.content = content
+        return response
+
+    def _from_cache(self, elapsed):
+        """Creates a copy of this response, as served from a local cache.
+
+        Parameters
+        ----------
+        elapsed: :class:`float`
+            The seconds elapsed since the response was stored.
+
+        Returns
+        -------
+        :class:`RawResponse`
+            A copy of the response, with its age and cache status updated.
+        """
+        response = copy.copy(self)
+        response.timestamp = datetime.datetime.utcnow()
+        response.fetching_time = 0
+        response.cached = True
+        response.age = self.age + int(elapsed)
+        return response
+
+
+class ResponseCache:
+    """An in-memory cache of raw responses, with a limited number of entries.
+
+    Entries are only kept until Tibia.com's own cache would expire, that is, :data:`CACHE_LIMIT` seconds minus the
+    response's age. When the cache is full, the least recently used entry is discarded.
+
+    .. versionadded:: 3.6.0
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum number of responses to keep.
+    """
+    def __init__(self, max_size=256):
+        self.max_size: int = max_size
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(method, url, data=None):
+        """Gets the key used to store a request.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The HTTP method of the request.
+        url: :class:`str`
+            The requested URL.
+        data: :class:`dict`, optional
+            The form-data sent with the request.
+
+        Returns
+        -------
+        :class:`tuple`
+            A hashable key identifying the request.
+        """
+        form = tuple(sorted((str(k), str(v)) for k, v in data.items())) if data else ()
+        return method.upper(), url, form
+
+    def get(self, key):
+        """Gets a stored response, if it hasn't expired yet.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the request, as returned by :meth:`get_key`.
+
+        Returns
+        -------
+        :class:`RawResponse`, optional
+            A copy of the stored response, with its age updated, or :obj:`None` if there's no valid entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, expires_at, response = entry
+        now = time.monotonic()
+        if now >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response._from_cache(now - stored_at)
+
+    def put(self, key, response):
+        """Stores a response.
+
+        Responses whose age already exceeds Tibia.com's cache limit are not stored.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the request, as returned by :meth:`get_key`.
+        response: :class:`RawResponse`
+            The response to store.
+        """
+        time_to_live = CACHE_LIMIT - response.age
+        if time_to_live <= 0 or self.max_size <= 0:
+            return
+        now = time.monotonic()
+        self._entries[key] = (now, now + time_to_live, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_async(self, key):
+        """Gets a stored response without blocking the event loop, as used by the client.
+
+        By default, this is the same as :meth:`get`. Caches performing blocking operations run them in another thread.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the request, as returned by :meth:`get_key`.
+
+        Returns
+        -------
+        :class:`RawResponse`, optional
+            The stored response, or :obj:`None` if there's no valid entry.
+        """
+        return self.get(key)
+
+    async def put_async(self, key, response):
+        """Stores a response without blocking the event loop, as used by the client.
+
+        By default, this is the same as :meth:`put`. Caches performing blocking operations run them in another thread.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the request, as returned by :meth:`get_key`.
+        response: :class:`RawResponse`
+            The response to store.
+        """
+        self.put(key, response)
+
+    def clear(self):
+        """Removes all the stored responses."""
+        self._entries.clear()
+
+
+class SQLiteResponseCache(ResponseCache):
+    """A persistent cache of raw responses, stored in a SQLite database.
+
+    Unlike :class:`ResponseCache`, stored responses survive restarts and can be shared by multiple processes in the
+    same host using the same database file. Entries are kept until Tibia.com's own cache would expire, that is,
+    :data:`CACHE_LIMIT` seconds minus the response's age, and expired entries are removed as new responses are stored.
+
+    If the database is locked by another process for longer than ``timeout``, the operation is skipped, so the
+    request is performed or its response is not stored. When used by the client, database operations run in a
+    dedicated thread, so waiting for the database doesn't block the event loop.
+
+    .. versionadded:: 3.6.0
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path to the database file. It will be created if it doesn't exist.
+    timeout: :class:`float`
+        The seconds to wait for the database to be unlocked by other processes.
+    """
+    def __init__(self, path, *, timeout=1.0):
+        super().__init__(0)
+        self.path: str = path
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL,"
+                                 " fetched_at REAL NOT NULL, expires_at REAL NOT NULL, age INTEGER NOT NULL,"
+                                 " fetching_time REAL NOT NULL, cached INTEGER NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+        # A single thread, so the connection is never used concurrently.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def __len__(self):
+        rows = self._execute("SELECT COUNT(*) FROM responses WHERE expires_at > ?", (time.time(),))
+        return rows[0][0] if rows else 0
+
+    def _execute(self, query, parameters=()):
+        try:
+            return self._connection.execute(query, parameters).fetchall()
+        except sqlite3.OperationalError as e:
+            log.warning("%s | Response cache unavailable: %s", self.path, e)
+            return None
+
+    def get(self, key):
+        """Gets a stored response, if it hasn't expired yet.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the request, as returned by :meth:`get_key`.
+
+        Returns
+        -------
+        :class:`RawResponse`, optional
+            The stored response, with its age updated, or :obj:`None` if there's no valid entry.
+        """
+        now = time.time()
+        rows = self._execute("SELECT content, fetched_at, age, fetching_time, cached FROM responses "
+                             "WHERE key = ? AND expires_at > ?", (json.dumps(key), now))
+        if not rows:
+            return None
+        content, fetched_at, age, fetching_time, cached = rows[0]
+        response = RawResponse._from_values(datetime.datetime.utcfromtimestamp(fetched_at), fetching_time,
+                                            bool(cached), age, content)
+        return response._from_cache(now - fetched_at)
+
+    def put(self, key, response):
+        """Stores a response.
+
+        Responses whose age already exceeds Tibia.com's cache limit are not stored.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the request, as returned by :meth:`get_key`.
+        response: :class:`RawResponse`
+            The response to store.
+        """
+        time_to_live = CACHE_LIMIT - response.age
+        if time_to_live <= 0:
+            return
+        now = time.time()
+        self._execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        self._execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                      (json.dumps(key), response.content, now, now + time_to_live, response.age,
+                       response.fetching_time, int(response.cached)))
+
+    async def get_async(self, key):
+        return await asyncio.get_event_loop().run_in_executor(self._executor, self.get, key)
+
+    async def put_async(self, key, response):
+        await asyncio.get_event_loop().run_in_executor(self._executor, self.put, key, response)
+
+    def clear(self):
+        """Removes all the stored responses."""
+        self._execute("DELETE FROM responses")
+
+    def close(self):
+        """Closes the connection to the database, after the pending operations are completed."""
+        self._executor.shutdown()
+        self._connection.close()
+
+
+class ResponseArchive:
+    """An archive of raw responses stored in a directory, used to record and replay requests.
+
+    In record mode, every response obtained from Tibia.com is saved to the archive. In replay mode, requests are
+    served from the archive instead, without using the network, so the parsers can be run against previously
+    recorded pages.
+
+    Every response is saved as two files named after the request: a ``.txt`` file with the HTML content, like the
+    resources used in the tests, and a ``.json`` file with the request and the response's metadata.
+    Requests recorded more than once keep the most recent response.
+
+    .. versionadded:: 3.6.0
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The directory of the archive. It will be created if it doesn't exist.
+    replay: :class:`bool`
+        Whether to serve responses from the archive instead of recording them.
+    """
+    _TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+    def __init__(self, path, *, replay=False):
+        self.path: str = path
+        self.replay: bool = replay
+        self._loaded: typing.Dict[str, RawResponse] = {}
+        os.makedirs(path, exist_ok=True)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path!r} replay={self.replay}>"
+
+    def _get_name(self, key):
+        return hashlib.sha1(json.dumps(key).encode()).hexdigest()
+
+    def get(self, key):
+        """Gets the response recorded for a request.
+
+        Recorded responses are kept in memory once loaded.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the request, as returned by :meth:`ResponseCache.get_key`.
+
+        Returns
+        -------
+        :class:`RawResponse`, optional
+            The recorded response, or :obj:`None` if the request wasn't recorded.
+        """
+        name = self._get_name(key)
+        response = self._loaded.get(name)
+        if response is None:
+            try:
+                with open(os.path.join(self.path, f"{name}.json"), encoding="utf-8") as f:
+                    metadata = json.load(f)
+                with open(os.path.join(self.path, f"{name}.txt"), encoding="utf-8", newline="") as f:
+                    content = f.read()
+            except FileNotFoundError:
+                return None
+            timestamp = datetime.datetime.strptime(metadata["timestamp"], self._TIMESTAMP_FORMAT)
+            response = RawResponse._from_values(timestamp, metadata["fetching_time"], metadata["cached"],
+                                                metadata["age"], content, url=metadata["url"],
+                                                method=metadata["method"], headers=metadata["headers"])
+            self._loaded[name] = response
+        return copy.copy(response)
+
+    def put(self, key, response):
+        """Records the response of a request.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the request, as returned by :meth:`ResponseCache.get_key`.
+        response: :class:`RawResponse`
+            The response to record.
+        """
+        method, url, form = key
+        name = self._get_name(key)
+        metadata = {
+            "method": method,
+            "url": url,
+            "data": dict(form),
+            "timestamp": response.timestamp.strftime(self._TIMESTAMP_FORMAT),
+            "fetching_time": response.fetching_time,
+            "cached": response.cached,
+            "age": response.age,
+            "headers": response.headers,
+        }
+        # Files are written to a temporary path first, so other processes never read them half written.
+        for extension, value in (("txt", response.content), ("json", json.dumps(metadata, indent=2))):
+            path = os.path.join(self.path, f"{name}.{extension}")
+            with open(f"{path}.tmp", "w", encoding="utf-8", newline="") as f:
+                f.write(value)
+            os.replace(f"{path}.tmp", path)
+
+
+class ParseCache:
+    """An in-memory cache of parsed data, indexed by a hash of the content it was parsed from.
+
+    Tibia.com serves the same content for several minutes, so pages polled periodically are often identical to the
+    previous poll. This allows reusing their parsed data instead of parsing them again.
+
+    Parsed data is stored serialized, so every hit returns a new copy that can be modified freely.
+    When the cache is full, the least recently used entry is discarded.
+
+    .. versionadded:: 3.6.0
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum number of parsed results to keep.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The number of lookups that found a parsed result.
+    misses: :class:`int`
+        The number of lookups that didn't find a parsed result.
+    """
+    def __init__(self, max_size=128):
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} size={len(self)} max_size={self.max_size} hit_ratio={self.hit_ratio:.2f}>"
+
+    @property
+    def hit_ratio(self):
+        """:class:`float`: The ratio of lookups that found a parsed result, from 0 to 1."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def get_key(parser, content, args=()):
+        """Gets the key used to store the parsed data of some content.
+
+        Parameters
+        ----------
+        parser:
+            The function used to parse the content.
+        content: :class:`str`
+            The parsed content.
+        args: :class:`tuple`
+            Additional arguments passed to the parser.
+
+        Returns
+        -------
+        :class:`tuple`
+            A hashable key identifying the parsed data.
+        """
+        return parser, args, hashlib.sha1(content.encode()).digest()
+
+    def get(self, key, default=None):
+        """Gets a copy of the parsed data stored for a key.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the parsed data, as returned by :meth:`get_key`.
+        default:
+            The value to return if there's no entry for the key.
+
+        Returns
+        -------
+            A copy of the parsed data, or the default value.
+        """
+        serialized = self._entries.get(key)
+        if serialized is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return pickle.loads(serialized)
+
+    def put(self, key, parsed):
+        """Stores parsed data.
+
+        Data that can't be serialized is not stored.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            The key of the parsed data, as returned by :meth:`get_key`.
+        parsed:
+            The parsed data.
+        """
+        if self.max_size <= 0:
+            return
+        try:
+            self._entries[key] = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            log.debug("Could not store parsed data in cache: %s", e)
+            return
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all the stored data and resets the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class RateLimiter:
+    """Limits the rate and number of concurrent requests made to Tibia.com, adapting to its responses.
+
+    Requests are limited by a token bucket, allowing up to ``rate`` requests per second with bursts of up to ``burst``
+    requests, and by a concurrency window, the maximum number of requests in progress at the same time.
+
+    The window grows additively while requests succeed, by roughly one request per window of successful requests, and
+    is halved when Tibia.com responds with 403 Forbidden or when a response takes considerably longer than usual.
+
+    Requests exceeding the limits wait in a queue, in the order they were made.
+
+    .. versionadded:: 3.6.0
+
+    Parameters
+    ----------
+    rate: :class:`float`
+        The maximum number of requests per second.
+    burst: :class:`int`
+        The maximum number of requests that can be made at once, if enough time has passed since the last ones.
+    initial_window: :class:`int`
+        The initial number of concurrent requests allowed.
+    min_window: :class:`int`
+        The minimum number of concurrent requests allowed.
+    max_window: :class:`int`
+        The maximum number of concurrent requests allowed.
+    latency_factor: :class:`float`
+        How many times slower than the average a response must be to be considered a latency spike.
+
+    Attributes
+    ----------
+    window: :class:`float`
+        The current concurrency window. Only the integer part is used to limit requests.
+    in_flight: :class:`int`
+        The number of requests currently in progress.
+    average_latency: :class:`float`, optional
+        The moving average of the response times, in seconds.
+    """
+    _LATENCY_SMOOTHING = 0.2
+
+    def __init__(self, rate=5.0, burst=5, *, initial_window=2, min_window=1, max_window=20, latency_factor=3.0):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        if not 1 <= min_window <= initial_window <= max_window:
+            raise ValueError("windows must satisfy 1 <= min_window <= initial_window <= max_window.")
+        self.rate: float = rate
+        self.burst: int = burst
+        self.min_window: int = min_window
+        self.max_window: int = max_window
+        self.latency_factor: float = latency_factor
+        self.window: float = initial_window
+        self.in_flight: int = 0
+        self.average_latency: typing.Optional[float] = None
+        self._tokens: float = burst
+        self._last_refill = time.monotonic()
+        self._last_decrease = float("-inf")
+        self._waiters: typing.Deque[asyncio.Future] = collections.deque()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} window={self.window:.2f} in_flight={self.in_flight} " \
+               f"queue_depth={self.queue_depth}>"
+
+    @property
+    def queue_depth(self):
+        """:class:`int`: The number of requests waiting for a slot in the window."""
+        return sum(1 for w in self._waiters if not w.done())
+
+    async def acquire(self):
+        """Waits until a request can be made.
+
+        Every call must be followed by a call to :meth:`release` once the request is done.
+
+        Returns
+        -------
+        :class:`float`
+            The time when the request was allowed, used as a ticket for :meth:`release`.
+        """
+        if not self._waiters and self.in_flight < int(self.window):
+            self.in_flight += 1
+        else:
+            waiter = asyncio.get_event_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was assigned right before the cancellation.
+                    self._release_slot()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+        delay = self._reserve_token()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._release_slot()
+                raise
+        return time.monotonic()
+
+    def release(self, ticket, *, throttled=False, failed=False):
+        """Releases the slot used by a request, adjusting the window based on its result.
+
+        Parameters
+        ----------
+        ticket: :class:`float`
+            The value returned by :meth:`acquire`.
+        throttled: :class:`bool`
+            Whether Tibia.com rejected the request for exceeding its rate limit.
+        failed: :class:`bool`
+            Whether the request failed for another reason. Failed requests don't affect the window.
+        """
+        now = time.monotonic()
+        latency = now - ticket
+        if throttled or (not failed and self._is_latency_spike(latency)):
+            # All the requests in progress are affected by the same congestion, so the window is only decreased once.
+            if ticket > self._last_decrease:
+                self.window = max(self.min_window, self.window / 2)
+                self._last_decrease = now
+        elif not failed:
+            self.window = min(self.max_window, self.window + 1 / self.window)
+        if not throttled and not failed:
+            if self.average_latency is None:
+                self.average_latency = latency
+            else:
+                self.average_latency += self._LATENCY_SMOOTHING * (latency - self.average_latency)
+        self._release_slot()
+
+    def _is_latency_spike(self, latency):
+        return self.average_latency is not None and latency > self.average_latency * self.latency_factor
+
+    def _reserve_token(self):
+        """Takes a token from the bucket, returning the seconds to wait until it is available."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        self._tokens -= 1
+        return -self._tokens / self.rate if self._tokens < 0 else 0
+
+    def _release_slot(self):
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.window):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class _HighscoresBounds:
+    """The values of the first and last entries of the known pages of a highscores category.
+
+    Entries are sorted by value in descending order, so these are used to tell which pages may contain a value.
+    """
+
+    __slots__ = (
+        "total_pages",
+        "pages",
+    )
+
+    def __init__(self):
+        self.total_pages = None
+        self.pages: typing.Dict[int, typing.Tuple[int, int]] = {}
+
+    def update(self, highscores):
+        """Stores the values of the first and last entries of a highscores page."""
+        self.total_pages = highscores.total_pages
+        if highscores.entries:
+            self.pages[highscores.page] = (highscores.entries[0].value, highscores.entries[-1].value)
+
+    def narrow(self, value, low, high):
+        """Narrows a range of pages to the ones that may contain a value.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`int`
+            The new limits of the range and a known page in that range containing the value, if any.
+        """
+        for page, (first, last) in self.pages.items():
+            if last > value:
+                low = max(low, page + 1)
+            elif first < value:
+                high = min(high, page - 1)
+        candidate = next((page for page, (first, last) in self.pages.items()
+                          if low <= page <= high and last <= value <= first), None)
+        return low, high, candidate
+
 
 class Client:
     """An asynchronous client that fetches information from Tibia.com
@@ -122,10 +864,78 @@ class Client:
     proxy_url: :class:`str`
         The URL of the SOCKS proxy to use for requests.
         Note that if a session is passed, the SOCKS proxy won't be used and must be applied when creating the session.
+    cache_size: :class:`int`
+        The maximum number of responses to keep in memory. By default, responses are not cached.
+
+        Responses are reused for as long as Tibia.com's own cache would serve them unchanged.
+
+        .. versionadded:: 3.6.0
+    cache: :class:`ResponseCache`, optional
+        The cache used to store responses, if enabled.
+
+        A cache instance may be passed instead of ``cache_size``, such as a :class:`SQLiteResponseCache` to keep
+        responses across restarts and processes.
+
+        .. versionadded:: 3.6.0
+    coalesce_requests: :class:`bool`
+        Whether identical requests made while another one is still in progress should wait for its result instead of
+        performing a new request. Enabled by default.
+
+        Coalesced requests share the same :class:`TibiaResponse` instance.
+
+        .. versionadded:: 3.6.0
+    rate_limiter: :class:`RateLimiter`, optional
+        The rate limiter used to pace requests to Tibia.com. By default, requests are not limited.
+
+        .. versionadded:: 3.6.0
+    parse_executor: :class:`concurrent.futures.Executor`, optional
+        The executor used to parse responses, so parsing doesn't block the event loop.
+        By default, responses are parsed in the event loop.
+
+        A :class:`concurrent.futures.ProcessPoolExecutor` allows parsing in multiple cores, at the cost of transferring
+        the content and the parsed data between processes.
+
+        .. versionadded:: 3.6.0
+    archive: :class:`ResponseArchive`, optional
+        The archive where responses are recorded to, or replayed from if it is in replay mode.
+
+        When replaying, requests that were not recorded raise :class:`NetworkError`.
+
+        .. versionadded:: 3.6.0
+    parse_cache_size: :class:`int`
+        The maximum number of parsed results to keep, to skip parsing content identical to a previous response.
+        By default, parsed results are not cached.
+
+        .. versionadded:: 3.6.0
+    parse_cache: :class:`ParseCache`, optional
+        The cache of parsed results, if enabled. Its hit ratio can be used to size it.
+
+        .. versionadded:: 3.6.0
     """
 
-    def __init__(self, loop=None, session=None, *, proxy_url=None):
+    # The attribute containing the entries of every paginated class.
+    _PAGE_ENTRIES = {
+        CharacterBazaar: "entries",
+        CMPostArchive: "posts",
+        ForumBoard: "threads",
+        ForumThread: "posts",
+        Highscores: "entries",
+        TournamentLeaderboard: "entries",
+    }
+
+    def __init__(self, loop=None, session=None, *, proxy_url=None, cache_size=0, cache=None, coalesce_requests=True,
+                 rate_limiter=None, parse_executor=None, archive=None, parse_cache_size=0):
         self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop() if loop is None else loop
+        if cache is None and cache_size:
+            cache = ResponseCache(cache_size)
+        self.cache: typing.Optional[ResponseCache] = cache
+        self.coalesce_requests: bool = coalesce_requests
+        self.rate_limiter: typing.Optional[RateLimiter] = rate_limiter
+        self.parse_executor: typing.Optional[concurrent.futures.Executor] = parse_executor
+        self.archive: typing.Optional[ResponseArchive] = archive
+        self.parse_cache: typing.Optional[ParseCache] = ParseCache(parse_cache_size) if parse_cache_size else None
+        self._pending_requests: typing.Dict[tuple, asyncio.Future] = {}
+        self._highscores_bounds: typing.Dict[tuple, _HighscoresBounds] = {}
         self._session_ready = asyncio.Event()
         if session is not None:
             self.session: aiohttp.ClientSession = session
@@ -153,6 +963,108 @@ class Client:
         else:
             raise NetworkError("Request error, status code: %d" % status_code)
 
+    async def _coalesce(self, key, coro_func, *args):
+        """Runs a coroutine function, or waits for the result of an identical call in progress.
+
+        The call runs in its own task, so cancelling one of the callers waiting for it does not affect the rest.
+
+        Parameters
+        ----------
+        key: :class:`tuple`
+            A hashable key identifying the call.
+        coro_func:
+            The coroutine function to call.
+        args:
+            The arguments to pass to the coroutine function.
+
+        Returns
+        -------
+            The result of the coroutine.
+        """
+        if not self.coalesce_requests:
+            return await coro_func(*args)
+        task = self._pending_requests.get(key)
+        if task is None:
+            task = self.loop.create_task(coro_func(*args))
+            self._pending_requests[key] = task
+            task.add_done_callback(functools.partial(self._remove_pending_request, key))
+        return await asyncio.shield(task)
+
+    def _remove_pending_request(self, key, task):
+        if self._pending_requests.get(key) is task:
+            del self._pending_requests[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved, in case every caller was cancelled.
+            task.exception()
+
+    async def _fetch_response(self, parser, url, *args, method="GET", data=None):
+        """Fetches a page and parses its content into a response.
+
+        Identical requests in progress are coalesced, see :meth:`_coalesce`.
+
+        Parameters
+        ----------
+        parser:
+            The function used to parse the content, e.g. :meth:`Character.from_content`.
+        url: :class:`str`
+            The URL that will be requested.
+        args:
+            Additional arguments to pass to the parser, after the content.
+        method: :class:`str`
+            The HTTP method to use for the request.
+        data: :class:`dict`
+            A mapping representing the form-data to send as part of the request.
+
+        Returns
+        -------
+        :class:`TibiaResponse`
+            The response containing the parsed data.
+        """
+        key = ResponseCache.get_key(method, url, data) + (parser, args)
+        return await self._coalesce(key, self._fetch_and_parse, parser, url, args, method, data)
+
+    async def _fetch_and_parse(self, parser, url, args, method, data):
+        response = await self._request(method, url, data)
+        parsed, parsing_time = await self._parse(parser, response.content, *args)
+        return TibiaResponse(response, parsed, parsing_time)
+
+    async def _parse(self, parser, content, *args):
+        """Parses content using the parse executor, if set.
+
+        If the parse cache is enabled and the same content was already parsed, a copy of the previous result is used.
+
+        Parameters
+        ----------
+        parser:
+            The function used to parse the content.
+        content: :class:`str`
+            The content to parse.
+        args:
+            Additional arguments to pass to the parser, after the content.
+
+        Returns
+        -------
+        :class:`tuple`
+            The parsed data and the time in seconds it took to parse it, not counting the time spent waiting for a
+            worker.
+        """
+        if self.parse_cache is None:
+            return await self._parse_content(parser, content, *args)
+        start_time = time.perf_counter()
+        key = self.parse_cache.get_key(parser, content, args)
+        parsed = self.parse_cache.get(key, _MISSING)
+        if parsed is not _MISSING:
+            return parsed, time.perf_counter() - start_time
+        parsed, parsing_time = await self._parse_content(parser, content, *args)
+        self.parse_cache.put(key, parsed)
+        return parsed, parsing_time
+
+    async def _parse_content(self, parser, content, *args):
+        if self.parse_executor is None:
+            return _timed_parse(parser, content, *args)
+        return await self.loop.run_in_executor(self.parse_executor,
+                                               functools.partial(_timed_parse, parser, content, *args))
+
     async def _request(self, method, url, data=None, headers=None):
         """Base request, handling possible error statuses.
 
@@ -180,7 +1092,22 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
+        key = ResponseCache.get_key(method, url, data)
+        if self.archive is not None and self.archive.replay:
+            response = self.archive.get(key)
+            if response is None:
+                raise NetworkError(f"No recorded response for {method} {url}")
+            log.info("%s | %s | Replayed response", url, method)
+            return response
+        if self.cache is not None:
+            response = await self.cache.get_async(key)
+            if response is not None:
+                log.info("%s | %s | Cached response, age: %d", url, method, response.age)
+                return response
         await self._session_ready.wait()
+        ticket = await self.rate_limiter.acquire() if self.rate_limiter is not None else None
+        throttled = False
+        completed = False
         try:
             init_time = time.perf_counter()
             log.info(f"%s | %s | Fetching...", url, method)
@@ -188,9 +1115,15 @@ class Client:
                 log.info(f"%s | %s | %s %s", url, method, resp.status, resp.reason)
                 if "maintenance.tibia.com" in str(resp.url):
                     raise SiteMaintenanceError("Tibia.com is down for maintenance.")
+                throttled = resp.status == 403
                 self._handle_status(resp.status)
                 response = RawResponse(resp, time.perf_counter()-init_time)
                 response.content = await resp.text()
+                completed = True
+                if self.cache is not None:
+                    await self.cache.put_async(key, response)
+                if self.archive is not None:
+                    self.archive.put(key, response)
                 return response
         except aiohttp.ClientError as e:
             raise NetworkError("aiohttp.ClientError: %s" % e, e)
@@ -198,6 +1131,172 @@ class Client:
             raise NetworkError("aiohttp_socks.SocksConnectionError: %s" % e, e)
         except UnicodeDecodeError as e:
             raise NetworkError('UnicodeDecodeError: %s' % e, e)
+        finally:
+            if ticket is not None:
+                self.rate_limiter.release(ticket, throttled=throttled, failed=not completed and not throttled)
+
+    async def iter_pages(self, fetch_method, *args, prefetch=2, **kwargs):
+        """Iterates over all the pages of a paginated section, fetching the following pages in advance.
+
+        The total number of pages is taken from the first page. While each page is being processed, up to ``prefetch``
+        of the following pages are fetched concurrently.
+
+        .. versionadded:: 3.6.0
+
+        Examples
+        --------
+        .. code-block:: python
+
+            async for response in client.iter_pages(client.fetch_highscores_page, "Antica", Category.MAGIC_LEVEL):
+                print(response.data.page, len(response.data.entries))
+
+        Parameters
+        ----------
+        fetch_method:
+            The client method used to fetch a single page, it must accept a ``page`` keyword argument.
+            These are :meth:`fetch_highscores_page`, :meth:`fetch_current_auctions`, :meth:`fetch_auction_history`,
+            :meth:`fetch_forum_board`, :meth:`fetch_forum_thread`, :meth:`fetch_cm_post_archive` and
+            :meth:`fetch_tournament_leaderboard`.
+        args:
+            The arguments passed to the fetch method.
+        prefetch: :class:`int`
+            The maximum number of pages to fetch in advance. If 0, pages are fetched one at a time, when requested.
+        kwargs:
+            The keyword arguments passed to the fetch method. If ``page`` is passed, iteration starts on that page.
+
+        Yields
+        ------
+        :class:`TibiaResponse`
+            The response of every page, in order. If the first page has no data, it is the only one yielded.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be 0 or greater.")
+        page = kwargs.pop("page", 1)
+        response = await fetch_method(*args, page=page, **kwargs)
+        if response.data is None:
+            yield response
+            return
+        pages = iter(range(page + 1, response.data.total_pages + 1))
+        pending: typing.Deque[asyncio.Task] = collections.deque()
+
+        def schedule(limit):
+            for next_page in itertools.islice(pages, max(limit - len(pending), 0)):
+                pending.append(self.loop.create_task(fetch_method(*args, page=next_page, **kwargs)))
+
+        try:
+            schedule(prefetch)
+            yield response
+            while True:
+                schedule(1)
+                if not pending:
+                    break
+                response = await pending.popleft()
+                schedule(prefetch)
+                yield response
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def iter_entries(self, fetch_method, *args, prefetch=2, **kwargs):
+        """Iterates over the entries of all the pages of a paginated section, fetching the following pages in advance.
+
+        This works like :meth:`iter_pages`, but yields the entries of every page instead, e.g. the highscores entries,
+        the auctions of the bazaar, the threads of a board or the posts of a thread.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        fetch_method:
+            The client method used to fetch a single page. See :meth:`iter_pages`.
+        args:
+            The arguments passed to the fetch method.
+        prefetch: :class:`int`
+            The maximum number of pages to fetch in advance.
+        kwargs:
+            The keyword arguments passed to the fetch method.
+
+        Yields
+        ------
+            The entries of every page, in order.
+        """
+        async for response in self.iter_pages(fetch_method, *args, prefetch=prefetch, **kwargs):
+            if response.data is None:
+                return
+            for entry in getattr(response.data, self._PAGE_ENTRIES[type(response.data)]):
+                yield entry
+
+    async def iter_auctions(self, query, *, prefetch=2):
+        """Iterates over the current auctions matching a query.
+
+        The query is translated into the filters Tibia.com can apply, see :meth:`AuctionQuery.plan`, and the pages of
+        each filter are fetched in advance like in :meth:`iter_entries`. The conditions Tibia.com can't apply are
+        checked on every auction. If the query is ordered by bid and has a bid range, no more pages are fetched once
+        the range is passed.
+
+        If the query was split into multiple filters and it is ordered, their results are merged in order.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        query: :class:`AuctionQuery`
+            The query to execute.
+        prefetch: :class:`int`
+            The maximum number of pages to fetch in advance for each filter.
+
+        Yields
+        ------
+        :class:`ListedAuction`
+            The auctions matching the query.
+
+        Raises
+        ------
+        Forbidden
+            If a 403 Forbidden error was returned.
+            This usually means that Tibia.com is rate-limiting the client because of too many requests.
+        NetworkError
+            If there's any connection errors during the request.
+        """
+        iterators = [self._iter_filtered_auctions(query, filters, prefetch) for filters in query.plan()]
+        try:
+            if query.order_attribute is None or len(iterators) == 1:
+                for iterator in iterators:
+                    async for auction in iterator:
+                        yield auction
+                return
+            choose = max if query.order == AuctionOrder.HIGHEST_LATEST else min
+            heads = {}
+            for index in range(len(iterators)):
+                await self._advance_auctions(iterators, heads, index)
+            while heads:
+                index = choose(heads, key=lambda i: getattr(heads[i], query.order_attribute))
+                yield heads[index]
+                await self._advance_auctions(iterators, heads, index)
+        finally:
+            for iterator in iterators:
+                await iterator.aclose()
+
+    @staticmethod
+    async def _advance_auctions(iterators, heads, index):
+        """Gets the next auction of one of the iterators being merged, removing it once it's exhausted."""
+        try:
+            heads[index] = await iterators[index].__anext__()
+        except StopAsyncIteration:
+            heads.pop(index, None)
+
+    async def _iter_filtered_auctions(self, query, filters, prefetch):
+        """Iterates over the auctions of a filter that match a query, until the query's results are passed."""
+        entries = self.iter_entries(self.fetch_current_auctions, filters=filters, prefetch=prefetch)
+        try:
+            async for auction in entries:
+                if query.is_past_results(auction):
+                    break
+                if query.matches(auction):
+                    yield auction
+        finally:
+            await entries.aclose()
 
     async def fetch_current_auctions(self, page=1, filters=None):
         """Fetches the current auctions in the bazaar
@@ -228,11 +1327,8 @@ class Client:
         """
         if not page:
             raise ValueError('page must be 1 or greater.')
-        response = await self._request("GET", CharacterBazaar.get_current_auctions_url(page, filters))
-        start_time = time.perf_counter()
-        current_auctions = CharacterBazaar.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, current_auctions, parsing_time)
+        return await self._fetch_response(CharacterBazaar.from_content,
+                                          CharacterBazaar.get_current_auctions_url(page, filters))
 
     async def fetch_auction_history(self, page=1):
         """Fetches the auction history of the bazaar.
@@ -261,14 +1357,10 @@ class Client:
         """
         if not page:
             raise ValueError('page must be 1 or greater.')
-        response = await self._request("GET", CharacterBazaar.get_auctions_history_url(page))
-        start_time = time.perf_counter()
-        auction_history = CharacterBazaar.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, auction_history, parsing_time)
+        return await self._fetch_response(CharacterBazaar.from_content, CharacterBazaar.get_auctions_history_url(page))
 
     async def fetch_auction(self, auction_id, *, fetch_items=False, fetch_mounts=False, fetch_outfits=False,
-                            skip_details=False):
+                            skip_details=False, max_concurrent_pages=4, sections=None):
         """Fetches an auction by its ID.
 
         .. versionadded:: 3.3.0
@@ -288,6 +1380,18 @@ class Client:
 
             This allows fetching basic information like name, level, vocation, world, bid and status, shaving off some
             parsing time.
+        max_concurrent_pages: :class:`int`, optional
+            The maximum number of additional pages of items, mounts and outfits to fetch at the same time.
+            Must be 1 or greater.
+
+            .. versionadded:: 3.6.0
+        sections: :class:`collections.abc.Iterable` of :class:`str`, optional
+            The ids of the details sections to parse. By default, all sections are parsed.
+            See :meth:`AuctionDetails.from_content` for the available sections.
+
+            Additional pages are only fetched for the summaries whose section was parsed.
+
+            .. versionadded:: 3.6.0
 
         Returns
         -------
@@ -301,26 +1405,45 @@ class Client:
             This usually means that Tibia.com is rate-limiting the client because of too many requests.
         NetworkError
             If there's any connection errors during the request.
+        ValueError
+            If ``max_concurrent_pages`` is less than 1.
         """
+        if max_concurrent_pages < 1:
+            raise ValueError("max_concurrent_pages must be 1 or greater.")
+        # The additional pages are appended to the parsed auction, so they must be part of the coalesced request.
+        if sections is not None:
+            sections = frozenset(sections)
+        key = ResponseCache.get_key("GET", AuctionDetails.get_url(auction_id)) + \
+            (AuctionDetails.from_content, fetch_items, fetch_mounts, fetch_outfits, skip_details, sections)
+        return await self._coalesce(key, self._fetch_auction, auction_id, fetch_items, fetch_mounts, fetch_outfits,
+                                    skip_details, max_concurrent_pages, sections)
+
+    async def _fetch_auction(self, auction_id, fetch_items, fetch_mounts, fetch_outfits, skip_details,
+                             max_concurrent_pages, sections):
+        """Fetches an auction and the additional pages of its summaries, if requested.
+
+        See :meth:`fetch_auction` for the parameters."""
         response = await self._request("GET", AuctionDetails.get_url(auction_id))
-        start_time = time.perf_counter()
-        auction = AuctionDetails.from_content(response.content, auction_id, skip_details)
-        parsing_time = time.perf_counter() - start_time
+        auction, parsing_time = await self._parse(AuctionDetails.from_content, response.content, auction_id,
+                                                  skip_details, sections)
         if auction and not skip_details:
+            paginators = []
             if fetch_items:
-                await self._fetch_all_pages(auction_id, auction.items, 0)
-                await self._fetch_all_pages(auction_id, auction.store_items, 1)
+                paginators.extend([(auction.items, 0), (auction.store_items, 1)])
             if fetch_mounts:
-                await self._fetch_all_pages(auction_id, auction.mounts, 2)
-                await self._fetch_all_pages(auction_id, auction.store_mounts, 3)
+                paginators.extend([(auction.mounts, 2), (auction.store_mounts, 3)])
             if fetch_outfits:
-                await self._fetch_all_pages(auction_id, auction.outfits, 4)
-                await self._fetch_all_pages(auction_id, auction.store_outfits, 5)
+                paginators.extend([(auction.outfits, 4), (auction.store_outfits, 5)])
+            semaphore = asyncio.Semaphore(max_concurrent_pages)
+            await asyncio.gather(*[self._fetch_all_pages(auction_id, paginator, item_type, semaphore)
+                                   for paginator, item_type in paginators])
         return TibiaResponse(response, auction, parsing_time)
 
-    async def _fetch_all_pages(self, auction_id, paginator, item_type):
+    async def _fetch_all_pages(self, auction_id, paginator, item_type, semaphore):
         """Fetches all the pages of a auction paginator.
 
+        The pages are fetched concurrently, but their entries are added in page order.
+
         Parameters
         ----------
         auction_id: :class:`int`
@@ -329,17 +1452,44 @@ class Client:
             The paginator object
         item_type: :class:`int`
             The item type.
+        semaphore: :class:`asyncio.Semaphore`
+            The semaphore limiting the number of pages fetched at the same time.
         """
         if paginator is None or paginator.entry_class is None:
             return
-        current_page = 2
-        while current_page <= paginator.total_pages:
-            content = await self._fetch_ajax_page(auction_id, item_type, current_page)
-            entries = AuctionDetails.parse_page_items(content, paginator.entry_class)
+        pages = await asyncio.gather(*[self._fetch_page_items(auction_id, paginator.entry_class, item_type, page,
+                                                              semaphore)
+                                       for page in range(2, paginator.total_pages + 1)])
+        for entries in pages:
             paginator.entries.extend(entries)
-            current_page += 1
         paginator.fully_fetched = True
 
+    async def _fetch_page_items(self, auction_id, entry_class, item_type, page, semaphore):
+        """Fetches and parses the entries of a single page of an auction paginator.
+
+        Parameters
+        ----------
+        auction_id: :class:`int`
+            The id of the auction.
+        entry_class:
+            The class defining the elements.
+        item_type: :class:`int`
+            The item type.
+        page: :class:`int`
+            The page number to fetch.
+        semaphore: :class:`asyncio.Semaphore`
+            The semaphore limiting the number of pages fetched at the same time.
+
+        Returns
+        -------
+        :class:`list`
+            The entries contained in the page.
+        """
+        async with semaphore:
+            content = await self._fetch_ajax_page(auction_id, item_type, page)
+        entries, _ = await self._parse(AuctionDetails.parse_page_items, content, entry_class)
+        return entries
+
     async def _fetch_ajax_page(self, auction_id, type_id, page):
         """Fetches an ajax page from the paginated summaries in the auction section.
 
@@ -402,11 +1552,7 @@ class Client:
             raise ValueError("start_date cannot be more recent than end_date")
         if page <= 0:
             raise ValueError("page cannot be lower than 1.")
-        response = await self._request("GET", CMPostArchive.get_url(start_date, end_date, page))
-        start_time = time.perf_counter()
-        cm_post_archive = CMPostArchive.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, cm_post_archive, parsing_time)
+        return await self._fetch_response(CMPostArchive.from_content, CMPostArchive.get_url(start_date, end_date, page))
 
     async def fetch_event_schedule(self, month=None, year=None):
         """Fetches the event calendar.
@@ -435,11 +1581,7 @@ class Client:
         """
         if (year is None and month is not None) or (year is not None and month is None):
             raise ValueError("both year and month must be defined or neither must be defined.")
-        response = await self._request("GET", EventSchedule.get_url(month, year))
-        start_time = time.perf_counter()
-        calendar = EventSchedule.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, calendar, parsing_time)
+        return await self._fetch_response(EventSchedule.from_content, EventSchedule.get_url(month, year))
 
     async def fetch_forum_community_boards(self):
         """Fetches the forum's community boards.
@@ -459,11 +1601,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", ListedBoard.get_community_boards_url())
-        start_time = time.perf_counter()
-        boards = ListedBoard.list_from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, boards, parsing_time)
+        return await self._fetch_response(ListedBoard.list_from_content, ListedBoard.get_community_boards_url())
 
     async def fetch_forum_support_boards(self):
         """Fetches the forum's community boards.
@@ -482,11 +1620,7 @@ class Client:
             This usually means that Tibia.com is rate-limiting the client because of too many requests.
         NetworkError
             If there's any connection errors during the request."""
-        response = await self._request("GET", ListedBoard.get_support_boards_url())
-        start_time = time.perf_counter()
-        boards = ListedBoard.list_from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, boards, parsing_time)
+        return await self._fetch_response(ListedBoard.list_from_content, ListedBoard.get_support_boards_url())
 
     async def fetch_forum_world_boards(self):
         """Fetches the forum's world boards.
@@ -505,11 +1639,7 @@ class Client:
             This usually means that Tibia.com is rate-limiting the client because of too many requests.
         NetworkError
             If there's any connection errors during the request."""
-        response = await self._request("GET", ListedBoard.get_world_boards_url())
-        start_time = time.perf_counter()
-        boards = ListedBoard.list_from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, boards, parsing_time)
+        return await self._fetch_response(ListedBoard.list_from_content, ListedBoard.get_world_boards_url())
 
     async def fetch_forum_trade_boards(self):
         """Fetches the forum's trade boards.
@@ -528,11 +1658,7 @@ class Client:
             This usually means that Tibia.com is rate-limiting the client because of too many requests.
         NetworkError
             If there's any connection errors during the request."""
-        response = await self._request("GET", ListedBoard.get_trade_boards_url())
-        start_time = time.perf_counter()
-        boards = ListedBoard.list_from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, boards, parsing_time)
+        return await self._fetch_response(ListedBoard.list_from_content, ListedBoard.get_trade_boards_url())
 
     async def fetch_forum_board(self, board_id, page=1, age=30):
         """Fetches a forum board with a given id.
@@ -562,11 +1688,7 @@ class Client:
             This usually means that Tibia.com is rate-limiting the client because of too many requests.
         NetworkError
             If there's any connection errors during the request."""
-        response = await self._request("GET", ForumBoard.get_url(board_id, page, age))
-        start_time = time.perf_counter()
-        board = ForumBoard.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, board, parsing_time)
+        return await self._fetch_response(ForumBoard.from_content, ForumBoard.get_url(board_id, page, age))
 
     async def fetch_forum_thread(self, thread_id, page=1):
         """Fetches a forum thread with a given id.
@@ -592,11 +1714,7 @@ class Client:
             This usually means that Tibia.com is rate-limiting the client because of too many requests.
         NetworkError
             If there's any connection errors during the request."""
-        response = await self._request("GET", ForumThread.get_url(thread_id, page))
-        start_time = time.perf_counter()
-        thread = ForumThread.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, thread, parsing_time)
+        return await self._fetch_response(ForumThread.from_content, ForumThread.get_url(thread_id, page))
 
     async def fetch_forum_post(self, post_id):
         """Fetches a forum post with a given id.
@@ -625,13 +1743,11 @@ class Client:
             This usually means that Tibia.com is rate-limiting the client because of too many requests.
         NetworkError
             If there's any connection errors during the request."""
-        response = await self._request("GET", ForumPost.get_url(post_id))
-        start_time = time.perf_counter()
-        thread = ForumThread.from_content(response.content)
+        response = await self._fetch_response(ForumThread.from_content, ForumPost.get_url(post_id))
+        thread = response.data
         if thread:
             thread.anchored_post = next((p for p in thread.posts if p.post_id == post_id), None)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, thread, parsing_time)
+        return response
 
     async def fetch_forum_announcement(self, announcement_id):
         """Fetches a forum announcement.
@@ -656,11 +1772,8 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", ForumAnnouncement.get_url(announcement_id))
-        start_time = time.perf_counter()
-        announcement = ForumAnnouncement.from_content(response.content, announcement_id)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, announcement, parsing_time)
+        return await self._fetch_response(ForumAnnouncement.from_content,
+                                          ForumAnnouncement.get_url(announcement_id), announcement_id)
 
     async def fetch_boosted_creature(self):
         """Fetches today's boosted creature.
@@ -680,19 +1793,22 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", News.get_list_url())
-        start_time = time.perf_counter()
-        boosted_creature = BoostedCreature.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, boosted_creature, parsing_time)
+        return await self._fetch_response(BoostedCreature.from_content, News.get_list_url())
 
-    async def fetch_character(self, name):
+    async def fetch_character(self, name, *, lazy=False):
         """Fetches a character by its name from Tibia.com
 
         Parameters
         ----------
         name: :class:`str`
             The name of the character.
+        lazy: :class:`bool`, optional
+            Whether to defer parsing the character's achievements, badges, deaths and other characters until they are
+            accessed. See :meth:`Character.from_content`.
+
+            This has no effect when parsing in a process pool, as the character is fully parsed to be sent back.
+
+            .. versionadded:: 3.6.0
 
         Returns
         -------
@@ -707,11 +1823,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", Character.get_url(name.strip()))
-        start_time = time.perf_counter()
-        char = Character.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, char, parsing_time)
+        return await self._fetch_response(Character.from_content, Character.get_url(name.strip()), lazy)
 
     async def fetch_guild(self, name):
         """Fetches a guild by its name from Tibia.com
@@ -734,11 +1846,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", Guild.get_url(name))
-        start_time = time.perf_counter()
-        guild = Guild.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, guild, parsing_time)
+        return await self._fetch_response(Guild.from_content, Guild.get_url(name))
 
     async def fetch_guild_wars(self, name):
         """Fetches a guild's wars by its name from Tibia.com
@@ -766,11 +1874,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", GuildWars.get_url(name))
-        start_time = time.perf_counter()
-        guild_wars = GuildWars.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, guild_wars, parsing_time)
+        return await self._fetch_response(GuildWars.from_content, GuildWars.get_url(name))
 
     async def fetch_house(self, house_id, world):
         """Fetches a house in a specific world by its id.
@@ -795,11 +1899,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", House.get_url(house_id, world))
-        start_time = time.perf_counter()
-        house = House.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, house, parsing_time)
+        return await self._fetch_response(House.from_content, House.get_url(house_id, world))
 
     async def fetch_highscores_page(self, world, category=Category.EXPERIENCE,
                                     vocation=VocationFilter.ALL, page=1):
@@ -829,11 +1929,121 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", Highscores.get_url(world, category, vocation, page))
-        start_time = time.perf_counter()
-        highscores = Highscores.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, highscores, parsing_time)
+        return await self._fetch_response(Highscores.from_content, Highscores.get_url(world, category, vocation, page))
+
+    async def find_highscores_page(self, world, name, value, category=Category.EXPERIENCE,
+                                   vocation=VocationFilter.ALL):
+        """Finds the highscores page containing a character, knowing the character's value in that category.
+
+        Since entries are sorted by their value, the page is found using binary search, requiring a number of
+        requests proportional to the logarithm of the number of pages, instead of fetching every page.
+
+        The values of the first and last entries of every page fetched are kept, so later searches in the same
+        world, category and vocation require fewer requests. If these are outdated and the character is not found,
+        the search is done again without them.
+
+        .. versionadded:: 3.6.0
+
+        Examples
+        --------
+        .. code-block:: python
+
+            character = (await client.fetch_character("Galarzaa Fidera")).data
+            response = await client.find_highscores_page(character.world, character.name,
+                                                         character.achievement_points, Category.ACHIEVEMENTS)
+            if response.data:
+                entry = next(e for e in response.data.entries if e.name == character.name)
+                print(f"Rank {entry.rank}, page {response.data.page}")
+
+        Parameters
+        ----------
+        world: :class:`str`
+            The world to search the highscores in.
+        name: :class:`str`
+            The name of the character, case insensitive.
+        value: :class:`int`
+            The character's value in the category, as shown in :attr:`HighscoresEntry.value`.
+            For the experience category, this is the character's experience points, not its level.
+        category: :class:`Category`
+            The highscores category to search, by default Experience.
+        vocation: :class:`VocationFilter`
+            The vocation filter to use. No filter used by default.
+
+        Returns
+        -------
+        :class:`TibiaResponse` of :class:`Highscores`
+            The highscores page containing the character, or :obj:`None` if the character was not found.
+
+        Raises
+        ------
+        Forbidden
+            If a 403 Forbidden error was returned.
+            This usually means that Tibia.com is rate-limiting the client because of too many requests.
+        NetworkError
+            If there's any connection errors during the request.
+        """
+        key = (world, category, vocation)
+        name = name.lower()
+        responses = {}
+        bounds = self._highscores_bounds.get(key)
+        if bounds is not None:
+            response = await self._find_highscores_page(world, name, value, category, vocation, bounds, responses)
+            if response is not None:
+                return response
+        bounds = self._highscores_bounds[key] = _HighscoresBounds()
+        for response in responses.values():
+            if response.data is not None:
+                bounds.update(response.data)
+        response = await self._find_highscores_page(world, name, value, category, vocation, bounds, responses)
+        if response is not None:
+            return response
+        last_response = list(responses.values())[-1]
+        return TibiaResponse(last_response, None, last_response.parsing_time)
+
+    async def _find_highscores_page(self, world, name, value, category, vocation, bounds, responses):
+        """Finds the highscores page containing a character, using and updating the known boundaries of the pages.
+
+        Pages already fetched during the search are taken from ``responses``, where new pages are stored as well.
+        See :meth:`find_highscores_page` for the other parameters.
+
+        Returns
+        -------
+        :class:`TibiaResponse` of :class:`Highscores`
+            The highscores page containing the character, or :obj:`None` if it was not found.
+        """
+        async def fetch_page(page):
+            if page not in responses:
+                responses[page] = await self.fetch_highscores_page(world, category, vocation, page)
+                if responses[page].data is not None:
+                    bounds.update(responses[page].data)
+            return responses[page].data
+
+        if bounds.total_pages is None and await fetch_page(1) is None:
+            return None
+        low, high = 1, bounds.total_pages
+        while True:
+            low, high, page = bounds.narrow(value, low, high)
+            if page is not None:
+                break
+            # If the page was already fetched, Tibia.com returned a different page than the one requested.
+            if low > high or (low + high) // 2 in responses:
+                return None
+            highscores = await fetch_page((low + high) // 2)
+            if not highscores or not highscores.entries:
+                return None
+        # Characters with the same value may be spread across adjacent pages.
+        for step in (-1, 1):
+            current = page
+            while 1 <= current <= bounds.total_pages:
+                highscores = await fetch_page(current)
+                if not highscores or not highscores.entries:
+                    break
+                if any(e.name.lower() == name for e in highscores.entries):
+                    return responses[current]
+                if highscores.entries[0 if step < 0 else -1].value != value:
+                    break
+                current += step
+        return None
 
     async def fetch_kill_statistics(self, world):
         """Fetches the kill statistics of a world from Tibia.com.
@@ -856,11 +2066,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", KillStatistics.get_url(world))
-        start_time = time.perf_counter()
-        kill_statistics = KillStatistics.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, kill_statistics, parsing_time)
+        return await self._fetch_response(KillStatistics.from_content, KillStatistics.get_url(world))
 
     async def fetch_world(self, name):
         """Fetches a world from Tibia.com
@@ -883,11 +2089,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", World.get_url(name))
-        start_time = time.perf_counter()
-        world = World.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, world, parsing_time)
+        return await self._fetch_response(World.from_content, World.get_url(name))
 
     async def fetch_world_houses(self, world, town, house_type=HouseType.HOUSE, status: HouseStatus = None,
                                  order=HouseOrder.NAME):
@@ -919,11 +2121,8 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", ListedHouse.get_list_url(world, town, house_type, status, order))
-        start_time = time.perf_counter()
-        world_houses = ListedHouse.list_from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, world_houses, parsing_time)
+        return await self._fetch_response(ListedHouse.list_from_content,
+                                          ListedHouse.get_list_url(world, town, house_type, status, order))
 
     async def fetch_world_guilds(self, world: str):
         """Fetches the list of guilds in a world from Tibia.com
@@ -946,11 +2145,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", ListedGuild.get_world_list_url(world))
-        start_time = time.perf_counter()
-        guilds = ListedGuild.list_from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, guilds, parsing_time)
+        return await self._fetch_response(ListedGuild.list_from_content, ListedGuild.get_world_list_url(world))
 
     async def fetch_world_list(self):
         """Fetches the world overview information from Tibia.com.
@@ -968,11 +2163,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", WorldOverview.get_url())
-        start_time = time.perf_counter()
-        world_overview = WorldOverview.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, world_overview, parsing_time)
+        return await self._fetch_response(WorldOverview.from_content, WorldOverview.get_url())
 
     async def fetch_news_archive(self, begin_date, end_date, categories=None, types=None):
         """Fetches news from the archive meeting the search criteria.
@@ -1027,11 +2218,7 @@ class Client:
         if NewsType.NEWS_TICKER in types:
             data["filter_ticker"] = "ticker"
 
-        response = await self._request("post", News.get_list_url(), data)
-        start_time = time.perf_counter()
-        news = ListedNews.list_from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, news, parsing_time)
+        return await self._fetch_response(ListedNews.list_from_content, News.get_list_url(), method="POST", data=data)
 
     async def fetch_recent_news(self, days=30, categories=None, types=None):
         """Fetches all the published news in the last specified days.
@@ -1085,11 +2272,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", News.get_url(news_id))
-        start_time = time.perf_counter()
-        news = News.from_content(response.content, news_id)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, news, parsing_time)
+        return await self._fetch_response(News.from_content, News.get_url(news_id), news_id)
 
     async def fetch_tournament(self, tournament_cycle=0):
         """Fetches a tournament from Tibia.com
@@ -1114,11 +2297,7 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", Tournament.get_url(tournament_cycle))
-        start_time = time.perf_counter()
-        tournament = Tournament.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, tournament, parsing_time)
+        return await self._fetch_response(Tournament.from_content, Tournament.get_url(tournament_cycle))
 
     async def fetch_tournament_leaderboard(self, tournament_cycle, world, page=1):
         """Fetches a tournament leaderboard from Tibia.com
@@ -1147,8 +2326,5 @@ class Client:
         NetworkError
             If there's any connection errors during the request.
         """
-        response = await self._request("GET", TournamentLeaderboard.get_url(world, tournament_cycle, page))
-        start_time = time.perf_counter()
-        tournament_leaderboard = TournamentLeaderboard.from_content(response.content)
-        parsing_time = time.perf_counter() - start_time
-        return TibiaResponse(response, tournament_leaderboard, parsing_time)
+        return await self._fetch_response(TournamentLeaderboard.from_content,
+                                          TournamentLeaderboard.get_url(world, tournament_cycle, page))
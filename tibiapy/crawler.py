@@ -0,0 +1,382 @@
+"""Crawls sections of Tibia.com with many pages, keeping track of the progress."""
+import asyncio
+import datetime
+import itertools
+import json
+import logging
+import os
+import sqlite3
+
+from tibiapy.enums import Category, VocationFilter
+
+__all__ = (
+    "AuctionHistorySync",
+    "HighscoresCrawler",
+)
+
+log = logging.getLogger("tibiapy")
+
+# The maximum difference in seconds between two update times to consider them the same update.
+# The highscores only show the minutes since their last update, so times calculated from it may be off by a minute.
+UPDATE_TOLERANCE = 120
+
+
+class HighscoresCrawler:
+    """Crawls every page of the highscores of multiple worlds, categories and vocations.
+
+    Pages are fetched concurrently and yielded as soon as they are available, so their entries can be written as a
+    stream, for example, to a :class:`SnapshotWriter`. The pages of a combination started are fetched before starting
+    new ones.
+
+    The progress is saved to a SQLite database, so if the crawl is interrupted, running it again resumes it, only
+    fetching the pages that were not yielded yet. Pages are marked as done once the next page is requested, so the
+    last page yielded before a crash may be yielded again.
+
+    The first page of every combination is always fetched, to check when its highscores were last updated.
+    Combinations that were completely crawled and have not been updated since then are skipped. Combinations that
+    were updated are crawled from the start again.
+
+    The rate of requests is controlled by the client's :class:`RateLimiter`, if any.
+
+    .. versionadded:: 3.6.0
+
+    Examples
+    --------
+    The snapshot is opened in append mode, so the entries of a resumed crawl are added after the ones already written.
+    Each run writes its own snapshot header, and :class:`SnapshotReader` reads them all as a single snapshot.
+
+    .. code-block:: python
+
+        crawler = HighscoresCrawler(client, "highscores.db")
+        with open("highscores.snapshot", "ab") as f:
+            writer = SnapshotWriter(f)
+            async for highscores in crawler.crawl():
+                writer.write_all(highscores.entries)
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client used to fetch the highscores.
+    path: :class:`str`
+        The path to the database file where the progress is saved. It will be created if it doesn't exist.
+    worlds: :class:`list` of :class:`str`, optional
+        The worlds to crawl. By default, all the worlds in :meth:`Client.fetch_world_list` are crawled.
+    categories: :class:`list` of :class:`Category`, optional
+        The categories to crawl. By default, all categories are crawled.
+    vocations: :class:`list` of :class:`VocationFilter`, optional
+        The vocation filters to crawl. By default, all vocation filters are crawled.
+    concurrency: :class:`int`
+        The maximum number of pages to fetch at the same time.
+
+    Raises
+    ------
+    ValueError
+        If ``concurrency`` is less than 1.
+    """
+    def __init__(self, client, path, *, worlds=None, categories=None, vocations=None, concurrency=4):
+        if concurrency < 1:
+            raise ValueError("concurrency must be 1 or greater.")
+        self.client = client
+        self.path: str = path
+        self.worlds = list(worlds) if worlds is not None else None
+        self.categories = list(categories or Category)
+        self.vocations = list(vocations or VocationFilter)
+        self.concurrency: int = concurrency
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS combinations (world TEXT NOT NULL,"
+                                 " category INTEGER NOT NULL, vocation INTEGER NOT NULL, updated_at REAL,"
+                                 " total_pages INTEGER NOT NULL, completed INTEGER NOT NULL,"
+                                 " PRIMARY KEY (world, category, vocation))")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS pages (world TEXT NOT NULL, category INTEGER NOT NULL,"
+                                 " vocation INTEGER NOT NULL, page INTEGER NOT NULL,"
+                                 " PRIMARY KEY (world, category, vocation, page))")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path!r} concurrency={self.concurrency}>"
+
+    async def crawl(self):
+        """Crawls the highscores, resuming the previous crawl if it was interrupted.
+
+        Yields
+        ------
+        :class:`Highscores`
+            Every highscores page fetched. Pages of different combinations may be yielded in any order.
+
+        Raises
+        ------
+        Forbidden
+            If a 403 Forbidden error was returned.
+            This usually means that Tibia.com is rate-limiting the client because of too many requests.
+        NetworkError
+            If there's any connection errors during the request.
+        """
+        worlds = self.worlds
+        if worlds is None:
+            response = await self.client.fetch_world_list()
+            worlds = [w.name for w in response.data.worlds]
+        # Pages after the first one are prioritized, so started combinations are completed first.
+        jobs = asyncio.PriorityQueue()
+        results = asyncio.Queue()
+        counter = itertools.count()
+        for world in worlds:
+            for category in self.categories:
+                for vocation in self.vocations:
+                    jobs.put_nowait((1, next(counter), (world, category, vocation), 1))
+        pending_jobs = jobs.qsize()
+        pending_pages = {}
+        workers = [asyncio.ensure_future(self._fetch_pages(jobs, results)) for _ in range(self.concurrency)]
+        try:
+            while pending_jobs:
+                combination, page, response = await results.get()
+                pending_jobs -= 1
+                if isinstance(response, BaseException):
+                    raise response
+                highscores = response.data
+                if page == 1:
+                    if highscores is None:
+                        continue
+                    done = self._start_combination(combination, highscores.total_pages, self._get_updated_at(response))
+                    if done is None:
+                        log.debug("%s | Skipping highscores, not updated since the last crawl.", combination)
+                        continue
+                    pages = [p for p in range(1, highscores.total_pages + 1) if p not in done]
+                    for next_page in pages[1:] if pages and pages[0] == 1 else pages:
+                        jobs.put_nowait((0, next(counter), combination, next_page))
+                        pending_jobs += 1
+                    pending_pages[combination] = len(pages)
+                    if 1 in done:
+                        self._check_completed(combination, pending_pages)
+                        continue
+                if highscores is not None:
+                    yield highscores
+                self._connection.execute("INSERT OR IGNORE INTO pages VALUES (?, ?, ?, ?)",
+                                         (*self._get_key(combination), page))
+                pending_pages[combination] -= 1
+                self._check_completed(combination, pending_pages)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def reset(self):
+        """Removes all the saved progress, so every combination is crawled again."""
+        self._connection.execute("DELETE FROM combinations")
+        self._connection.execute("DELETE FROM pages")
+
+    def close(self):
+        """Closes the connection to the database."""
+        self._connection.close()
+
+    async def _fetch_pages(self, jobs, results):
+        """Fetches the pages in the job queue, putting their responses or the errors raised in the results queue."""
+        while True:
+            _, _, combination, page = await jobs.get()
+            try:
+                response = await self.client.fetch_highscores_page(*combination, page=page)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                response = e
+            results.put_nowait((combination, page, response))
+
+    @staticmethod
+    def _get_key(combination):
+        """Gets the values identifying a combination in the database."""
+        world, category, vocation = combination
+        return world, category.value, vocation.value
+
+    @staticmethod
+    def _get_updated_at(response):
+        """Gets the timestamp of the last time the highscores in a response were updated."""
+        if response.data.last_updated is None:
+            return None
+        updated_at = response.timestamp - datetime.timedelta(seconds=response.age) - response.data.last_updated
+        return updated_at.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+    def _start_combination(self, combination, total_pages, updated_at):
+        """Starts or resumes crawling a combination.
+
+        Returns
+        -------
+        :class:`set` of :class:`int`, optional
+            The pages that were already crawled, or :obj:`None` if the combination must be skipped.
+        """
+        key = self._get_key(combination)
+        rows = self._connection.execute("SELECT updated_at, completed FROM combinations WHERE world = ? AND"
+                                        " category = ? AND vocation = ?", key).fetchall()
+        if rows and rows[0][0] is not None and updated_at is not None \
+                and abs(rows[0][0] - updated_at) <= UPDATE_TOLERANCE:
+            if rows[0][1]:
+                return None
+            rows = self._connection.execute("SELECT page FROM pages WHERE world = ? AND category = ? AND"
+                                            " vocation = ?", key).fetchall()
+            return {row[0] for row in rows}
+        self._connection.execute("DELETE FROM pages WHERE world = ? AND category = ? AND vocation = ?", key)
+        self._connection.execute("INSERT OR REPLACE INTO combinations VALUES (?, ?, ?, ?, ?, 0)",
+                                 (*key, updated_at, total_pages))
+        return set()
+
+    def _check_completed(self, combination, pending_pages):
+        """Marks a combination as completed if all of its pages were crawled."""
+        if pending_pages[combination]:
+            return
+        del pending_pages[combination]
+        key = self._get_key(combination)
+        self._connection.execute("UPDATE combinations SET completed = 1 WHERE world = ? AND category = ? AND"
+                                 " vocation = ?", key)
+        self._connection.execute("DELETE FROM pages WHERE world = ? AND category = ? AND vocation = ?", key)
+
+
+class AuctionHistorySync:
+    """Keeps a local copy of the auction history up to date, fetching only the auctions that finished since the
+    last sync.
+
+    The history is sorted by the auctions' end dates, newest first. The newest end date seen and the ids of the
+    auctions that ended at that time are saved to a JSON file, and every sync walks the history pages until it reaches
+    auctions that ended before it. Auction ids are not used for this, as auctions that ended later may have lower ids.
+
+    The state is only saved once the sync is completed, so if it's interrupted, the next sync yields the same
+    auctions again.
+
+    .. versionadded:: 3.6.0
+
+    Examples
+    --------
+    .. code-block:: python
+
+        history_sync = AuctionHistorySync(client, "auction_history.json", fetch_details=True)
+        while True:
+            async for auction in history_sync.sync():
+                print(auction.auction_id, auction.name, auction.bid)
+            await asyncio.sleep(300)
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client used to fetch the auction history.
+    path: :class:`str`
+        The path to the JSON file where the state is saved. It will be created if it doesn't exist.
+    fetch_details: :class:`bool`
+        Whether to fetch the details of every new auction, using :meth:`Client.fetch_auction`.
+    concurrency: :class:`int`
+        The maximum number of auction details to fetch at the same time.
+    max_pages: :class:`int`, optional
+        The maximum number of history pages to walk in a single sync.
+        This is mostly useful to limit the first sync, which would otherwise walk the entire history.
+
+    Attributes
+    ----------
+    newest_end: :class:`datetime.datetime`, optional
+        The end date of the newest auction seen.
+    highest_auction_id: :class:`int`, optional
+        The highest auction id seen.
+
+    Raises
+    ------
+    ValueError
+        If ``concurrency`` is less than 1.
+    """
+    def __init__(self, client, path, *, fetch_details=False, concurrency=4, max_pages=None):
+        if concurrency < 1:
+            raise ValueError("concurrency must be 1 or greater.")
+        self.client = client
+        self.path: str = path
+        self.fetch_details: bool = fetch_details
+        self.concurrency: int = concurrency
+        self.max_pages = max_pages
+        self.newest_end = None
+        self.highest_auction_id = None
+        self._newest_ids = set()
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        self.newest_end = datetime.datetime.fromtimestamp(state["newest_end"], datetime.timezone.utc)
+        self.highest_auction_id = state["highest_auction_id"]
+        self._newest_ids = set(state["newest_ids"])
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path!r} newest_end={self.newest_end!r}>"
+
+    async def sync(self):
+        """Fetches the auctions that finished since the last sync.
+
+        Yields
+        ------
+        :class:`ListedAuction` or :class:`AuctionDetails`
+            Every new auction, from newest to oldest.
+            If ``fetch_details`` is enabled, their details are yielded instead, unless they are no longer available.
+
+        Raises
+        ------
+        Forbidden
+            If a 403 Forbidden error was returned.
+            This usually means that Tibia.com is rate-limiting the client because of too many requests.
+        NetworkError
+            If there's any connection errors during the request.
+        """
+        newest_end, newest_ids, highest_auction_id = self.newest_end, set(self._newest_ids), self.highest_auction_id
+        # New auctions finishing while walking the pages push the following ones to the next page.
+        seen = set()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        page = 1
+        while True:
+            response = await self.client.fetch_auction_history(page)
+            bazaar = response.data
+            if bazaar is None:
+                break
+            new_auctions = []
+            reached_known = False
+            for auction in bazaar.entries:
+                if self.newest_end is not None and auction.auction_end <= self.newest_end:
+                    if auction.auction_end < self.newest_end:
+                        reached_known = True
+                        break
+                    if auction.auction_id in self._newest_ids:
+                        continue
+                if auction.auction_id in seen:
+                    continue
+                seen.add(auction.auction_id)
+                new_auctions.append(auction)
+                if newest_end is None or auction.auction_end > newest_end:
+                    newest_end, newest_ids = auction.auction_end, set()
+                if auction.auction_end == newest_end:
+                    newest_ids.add(auction.auction_id)
+                highest_auction_id = max(highest_auction_id or 0, auction.auction_id)
+            if self.fetch_details:
+                tasks = [asyncio.ensure_future(self._fetch_auction(auction, semaphore)) for auction in new_auctions]
+                try:
+                    for task in tasks:
+                        yield await task
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+            else:
+                for auction in new_auctions:
+                    yield auction
+            if reached_known or page >= bazaar.total_pages or (self.max_pages and page >= self.max_pages):
+                break
+            page += 1
+        if newest_end is not None:
+            self.newest_end, self._newest_ids, self.highest_auction_id = newest_end, newest_ids, highest_auction_id
+            self._save()
+
+    async def _fetch_auction(self, auction, semaphore):
+        """Fetches the details of an auction, returning the listed auction if they are not available."""
+        async with semaphore:
+            response = await self.client.fetch_auction(auction.auction_id)
+        return response.data or auction
+
+    def _save(self):
+        """Saves the state of the sync to a temporary path first, so it's never left half written."""
+        state = {
+            "newest_end": self.newest_end.timestamp(),
+            "newest_ids": sorted(self._newest_ids),
+            "highest_auction_id": self.highest_auction_id,
+        }
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(f"{self.path}.tmp", self.path)
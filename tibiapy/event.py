@@ -5,7 +5,7 @@ import datetime
 from typing import List
 
 from tibiapy import abc
-from tibiapy.utils import get_tibia_url, parse_popup, parse_tibiacom_content
+from tibiapy.utils import _cached_by_list, _TrackedListsMixin, get_tibia_url, parse_popup, parse_tibiacom_content
 
 __all__ = (
     'EventSchedule',
@@ -15,7 +15,7 @@ __all__ = (
 month_year_regex = re.compile(r'([A-z]+)\s(\d+)')
 
 
-class EventSchedule(abc.Serializable):
+class EventSchedule(_TrackedListsMixin, abc.Serializable):
     """Represents the event's calendar in Tibia.com
 
     Attributes
@@ -38,6 +38,12 @@ class EventSchedule(abc.Serializable):
         'events',
     )
 
+    _serializable_types = {
+        "events": ["EventEntry"],
+    }
+
+    _tracked_lists = ("events",)
+
     def __init__(self, month, year, **kwargs):
         self.month: int = month
         self.year: int = year
@@ -68,11 +74,74 @@ class EventSchedule(abc.Serializable):
         -----
         Dates outside the calendar's month and year may yield unexpected results.
         """
-        def is_between(start, end, desired_date):
-            start = start or datetime.date.min
-            end = end or datetime.date.max
-            return start <= desired_date <= end
-        return [e for e in self.events if is_between(e.start_date, e.end_date, date)]
+        return self._get_index().search(date, date)
+
+    def get_events_between(self, start, end):
+        """Gets a list of events that are active at any point between two dates.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        start: :class:`datetime.date`
+            The first day of the range.
+        end: :class:`datetime.date`
+            The last day of the range, inclusive.
+
+        Returns
+        -------
+        :class:`list` of :class:`EventEntry`
+            The events that are active during the range, if any.
+
+        Notes
+        -----
+        Dates outside the calendar's month and year may yield unexpected results.
+        """
+        if start > end:
+            return []
+        return self._get_index().search(start, end)
+
+    def merge(self, *schedules):
+        """Merges this schedule with other schedules, such as the calendars of the following months.
+
+        Events that were cut by the limits of each calendar are joined into a single event, if they have the same
+        title, they overlap and their known start and end dates don't contradict each other. Repeated events are only
+        included once.
+
+        .. versionadded:: 3.6.0
+
+        Parameters
+        ----------
+        schedules: :class:`EventSchedule`
+            The schedules to merge with.
+
+        Returns
+        -------
+        :class:`EventSchedule`
+            A new schedule containing the events of all the schedules, sorted by their start date.
+            Its month and year are the ones of the earliest schedule.
+        """
+        all_schedules = (self, ) + schedules
+        year, month = min((s.year, s.month) for s in all_schedules)
+        events_by_title = {}
+        for schedule in all_schedules:
+            for event in schedule.events:
+                merged_events = events_by_title.setdefault(event.title, [])
+                for merged in merged_events:
+                    if merged._is_same_occurrence(event):
+                        merged.start_date = merged.start_date or event.start_date
+                        merged.end_date = merged.end_date or event.end_date
+                        break
+                else:
+                    merged_events.append(EventEntry(event.title, event.description, start_date=event.start_date,
+                                                    end_date=event.end_date))
+        events = [e for merged_events in events_by_title.values() for e in merged_events]
+        events.sort(key=lambda e: e.start_date or datetime.date.min)
+        return EventSchedule(month, year, events=events)
+
+    @_cached_by_list("events")
+    def _get_index(self):
+        return _EventIndex(self.events)
 
     @classmethod
     def get_url(cls, month=None, year=None):
@@ -207,6 +276,11 @@ class EventEntry(abc.Serializable):
         "duration",
     )
 
+    _serializable_types = {
+        "start_date": datetime.date,
+        "end_date": datetime.date,
+    }
+
     def __init__(self, title, description, **kwargs):
         self.title = title
         self.description = description
@@ -222,3 +296,69 @@ class EventEntry(abc.Serializable):
     @property
     def duration(self):
         return (self.end_date-self.start_date+datetime.timedelta(days=1)).days if (self.end_date and self.start_date) else None
+
+    def _is_same_occurrence(self, other):
+        """Checks if another entry is a part of the same occurrence of this event, seen from a different calendar."""
+        if self.title != other.title:
+            return False
+        if self.start_date and other.start_date and self.start_date != other.start_date:
+            return False
+        if self.end_date and other.end_date and self.end_date != other.end_date:
+            return False
+        return (self.start_date or datetime.date.min) <= (other.end_date or datetime.date.max) \
+            and (other.start_date or datetime.date.min) <= (self.end_date or datetime.date.max)
+
+
+class _EventIndex:
+    """Indexes the events of a :class:`EventSchedule` by their date ranges.
+
+    Events are sorted by their start date, forming an implicit binary search tree, where every node keeps the latest
+    end date of its subtree, so events that can't overlap a date range are skipped without checking them.
+    Events without a start or end date are considered to extend indefinitely in that direction.
+    """
+
+    __slots__ = (
+        "events",
+        "positions",
+        "starts",
+        "ends",
+        "max_ends",
+    )
+
+    def __init__(self, events):
+        self.events = events
+        bounds = sorted(((e.start_date or datetime.date.min, e.end_date or datetime.date.max, i)
+                         for i, e in enumerate(events)), key=lambda b: (b[0], b[2]))
+        self.starts = [b[0] for b in bounds]
+        self.ends = [b[1] for b in bounds]
+        self.positions = [b[2] for b in bounds]
+        self.max_ends = self.ends[:]
+        self._build(0, len(bounds))
+
+    def _build(self, low, high):
+        """Calculates the latest end date of the subtree formed by the events in a range of the sorted list."""
+        if low >= high:
+            return datetime.date.min
+        middle = (low + high) // 2
+        max_end = max(self.ends[middle], self._build(low, middle), self._build(middle + 1, high))
+        self.max_ends[middle] = max_end
+        return max_end
+
+    def search(self, start, end):
+        """Gets the events that overlap a date range, in their original order."""
+        positions = []
+        self._search(0, len(self.positions), start, end, positions)
+        positions.sort()
+        return [self.events[p] for p in positions]
+
+    def _search(self, low, high, start, end, positions):
+        while low < high:
+            middle = (low + high) // 2
+            if self.max_ends[middle] < start:
+                return
+            self._search(low, middle, start, end, positions)
+            if self.starts[middle] > end:
+                return
+            if self.ends[middle] >= start:
+                positions.append(self.positions[middle])
+            low = middle + 1
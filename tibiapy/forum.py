@@ -68,6 +68,10 @@ class CMPost(abc.BasePost, abc.Serializable):
         "thread_title",
     )
 
+    _serializable_types = {
+        "date": datetime.datetime,
+    }
+
     def __init__(self, **kwargs):
         self.post_id: int = kwargs.get("post_id")
         self.date: datetime.datetime = kwargs.get("date")
@@ -110,6 +114,12 @@ class CMPostArchive(abc.Serializable):
         "posts",
     )
 
+    _serializable_types = {
+        "start_date": datetime.date,
+        "end_date": datetime.date,
+        "posts": [CMPost],
+    }
+
     def __init__(self, **kwargs):
         self.start_date: datetime.date = kwargs.get("start_date")
         self.end_date: datetime.date = kwargs.get("end_date")
@@ -342,6 +352,12 @@ class ForumAnnouncement(abc.BaseAnnouncement, abc.Serializable):
         "end_date",
     )
 
+    _serializable_types = {
+        "author": "ForumAuthor",
+        "start_date": datetime.datetime,
+        "end_date": datetime.datetime,
+    }
+
     def __init__(self, **kwargs):
         self.title: str = kwargs.get("title")
         self.announcement_id: int = kwargs.get("announcement_id", 0)
@@ -458,6 +474,11 @@ class ForumAuthor(abc.BaseCharacter, abc.Serializable):
         "deleted",
     )
 
+    _serializable_types = {
+        "vocation": Vocation,
+        "guild": GuildMembership,
+    }
+
     def __init__(self, name, **kwargs):
         self.name: str = name
         self.level: int = kwargs.get("level", 2)
@@ -575,6 +596,11 @@ class ForumBoard(abc.BaseBoard, abc.Serializable):
         "threads",
     )
 
+    _serializable_types = {
+        "announcements": ["ListedAnnouncement"],
+        "threads": ["ListedThread"],
+    }
+
     def __repr__(self):
         return f"<{self.__class__.__name__} name={self.name!r} section={self.section!r}>"
 
@@ -825,6 +851,13 @@ class ForumPost(abc.BasePost, abc.Serializable):
         "content",
     )
 
+    _serializable_types = {
+        "author": ForumAuthor,
+        "emoticon": ForumEmoticon,
+        "posted_date": datetime.datetime,
+        "edited_date": datetime.datetime,
+    }
+
     def __init__(self, **kwargs):
         self.author = kwargs.get("author")
         self.emoticon = kwargs.get("emoticon")
@@ -890,6 +923,11 @@ class ForumThread(abc.BaseThread, abc.Serializable):
         "posts",
     )
 
+    _serializable_types = {
+        "posts": [ForumPost],
+        "anchored_post": ForumPost,
+    }
+
     def __init__(self, **kwargs):
         self.title: str = kwargs.get("title")
         self.thread_id: int = kwargs.get("thread_id", 0)
@@ -1125,6 +1163,10 @@ class LastPost(abc.BasePost, abc.Serializable):
         "deleted",
     )
 
+    _serializable_types = {
+        "date": datetime.datetime,
+    }
+
     def __repr__(self):
         return f"<{self.__class__.__name__} author={self.author!r} post_id={self.post_id} date={self.date!r}>"
 
@@ -1236,6 +1278,10 @@ class ListedBoard(abc.BaseBoard, abc.Serializable):
         "last_post",
     )
 
+    _serializable_types = {
+        "last_post": LastPost,
+    }
+
     def __repr__(self):
         return f"<{self.__class__.__name__} name={self.name!r} board_id={self.board_id} posts={self.posts} " \
                f"threads={self.threads} description={self.description!r}>"
@@ -1382,6 +1428,12 @@ class ListedThread(abc.BaseThread, abc.Serializable):
         "golden_frame",
     )
 
+    _serializable_types = {
+        "last_post": LastPost,
+        "status": ThreadStatus,
+        "emoticon": ForumEmoticon,
+    }
+
     def __repr__(self):
         return f"<{self.__class__.__name__} title={self.title!r} thread_id={self.thread_id} " \
                f"thread_starter={self.thread_starter!r} replies={self.replies} views={self.views}>"
@@ -9,7 +9,8 @@ from tibiapy import abc
 from tibiapy.enums import Vocation
 from tibiapy.errors import InvalidContent
 from tibiapy.house import GuildHouse
-from tibiapy.utils import parse_tibia_date, parse_tibiacom_content, try_date, try_datetime, try_enum
+from tibiapy.utils import _cached_by_list, _TrackedListsMixin, parse_tibia_date, parse_tibiacom_content, try_date, \
+    try_datetime, try_enum
 
 __all__ = (
     "Guild",
@@ -49,7 +50,7 @@ war_score_end_regex = re.compile(r'scored (\d+) kills against')
 war_current_empty = re.compile(r'The guild ([\w\s]+) is currently not')
 
 
-class Guild(abc.BaseGuild, abc.Serializable):
+class Guild(_TrackedListsMixin, abc.BaseGuild, abc.Serializable):
     """
     Represents a Tibia guild.
 
@@ -108,6 +109,16 @@ class Guild(abc.BaseGuild, abc.Serializable):
         "ranks"
     )
 
+    _serializable_types = {
+        "founded": datetime.date,
+        "guildhall": GuildHouse,
+        "disband_date": datetime.date,
+        "members": ["GuildMember"],
+        "invites": ["GuildInvite"],
+    }
+
+    _tracked_lists = ("members",)
+
     def __init__(self, name=None, world=None, **kwargs):
         self.name: str = name
         self.world: str = world
@@ -134,25 +145,30 @@ class Guild(abc.BaseGuild, abc.Serializable):
         return len(self.members)
 
     @property
+    @_cached_by_list("members")
     def online_count(self):
         """:class:`int`: The number of online members in the guild."""
-        return len(self.online_members)
+        return sum(1 for m in self.members if m.online)
 
     @property
+    @_cached_by_list("members", copy=list)
     def online_members(self):
         """:class:`list` of :class:`GuildMember`: List of currently online members."""
-        return list(filter(lambda m: m.online, self.members))
+        return [m for m in self.members if m.online]
 
     @property
+    @_cached_by_list("members", copy=list)
     def ranks(self) -> List[str]:
         """:class:`list` of :class:`str`: Ranks in their hierarchical order."""
         return list(OrderedDict.fromkeys((m.rank for m in self.members)))
 
     @property
+    @_cached_by_list("members", copy=lambda ranks: {rank: list(members) for rank, members in ranks.items()})
     def members_by_rank(self) -> Dict[str, List['GuildMember']]:
         """:class:`dict`: Gets a mapping of members, grouped by their guild rank."""
         rank_dict = defaultdict(list)
-        [rank_dict[m.rank].append(m) for m in self.members]
+        for m in self.members:
+            rank_dict[m.rank].append(m)
         return dict(rank_dict)
     # endregion
 
@@ -377,6 +393,11 @@ class GuildMember(abc.BaseCharacter, abc.Serializable):
     """
     __slots__ = ("name", "rank", "title", "level", "vocation", "joined", "online")
 
+    _serializable_types = {
+        "vocation": Vocation,
+        "joined": datetime.date,
+    }
+
     def __init__(self, name=None, rank=None, title=None, level=0, vocation=None, **kwargs):
         self.name: str = name
         self.rank: str = rank
@@ -403,6 +424,10 @@ class GuildInvite(abc.BaseCharacter, abc.Serializable):
         "date",
     )
 
+    _serializable_types = {
+        "date": datetime.date,
+    }
+
     def __init__(self, name=None, date=None):
         self.name: str = name
         self.date = try_date(date)
@@ -431,6 +456,11 @@ class GuildWars(abc.Serializable):
         'history',
     )
 
+    _serializable_types = {
+        "current": "GuildWarEntry",
+        "history": ["GuildWarEntry"],
+    }
+
     def __init__(self, name, current=None, history=None):
         self.name: str = name
         self.current: Optional[GuildWarEntry] = current
@@ -661,6 +691,12 @@ class GuildWarEntry(abc.Serializable):
         "surrender",
     )
 
+    _serializable_types = {
+        "start_date": datetime.date,
+        "duration": datetime.timedelta,
+        "end_date": datetime.date,
+    }
+
     def __init__(self, **kwargs):
         self.guild_name = kwargs.get("guild_name")
         self.guild_score = kwargs.get("guild_score", 0)
@@ -1,7 +1,9 @@
 import datetime
 import re
 from collections import OrderedDict
-from typing import List
+from typing import List, Optional
+
+import lxml.html
 
 from tibiapy import abc
 from tibiapy.enums import Category, Vocation, VocationFilter
@@ -52,6 +54,7 @@ class Highscores(abc.Serializable):
         self.results_count: int = kwargs.get("results_count", 0)
         self.page: int = kwargs.get("page", 1)
         self.total_pages: int = kwargs.get("total_pages", 1)
+        self.last_updated: Optional[datetime.timedelta] = kwargs.get("last_updated")
 
     __slots__ = (
         'world',
@@ -68,6 +71,13 @@ class Highscores(abc.Serializable):
 
     )
 
+    _serializable_types = {
+        "category": Category,
+        "vocation": VocationFilter,
+        "last_updated": datetime.timedelta,
+        "entries": ["HighscoresEntry"],
+    }
+
     def __repr__(self):
         return "<{0.__class__.__name__} world={0.world!r} category={0.category!r} vocation={0.vocation!r}>".format(self)
 
@@ -87,7 +97,7 @@ class Highscores(abc.Serializable):
         return self.get_url(self.world, self.category, self.vocation, self.page)
 
     @classmethod
-    def from_content(cls, content):
+    def from_content(cls, content, *, fast=True):
         """Creates an instance of the class from the html content of a highscores page.
 
         Notes
@@ -99,6 +109,13 @@ class Highscores(abc.Serializable):
         ----------
         content: :class:`str`
             The HTML content of the page.
+        fast: :class:`bool`, optional
+            Whether to parse the page directly with lxml, instead of building a BeautifulSoup tree. Enabled by default.
+
+            Both produce the same results, but the BeautifulSoup parser may be used as fallback if the fast parser has
+            issues with a page.
+
+            .. versionadded:: 3.6.0
 
         Returns
         -------
@@ -109,6 +126,8 @@ class Highscores(abc.Serializable):
         ------
         InvalidContent
             If content is not the HTML of a highscore's page."""
+        if fast:
+            return cls._from_content_lxml(content)
         parsed_content = parse_tibiacom_content(content)
         tables = cls._parse_tables(parsed_content)
         filters = tables.get("Highscores Filter")
@@ -169,6 +188,55 @@ class Highscores(abc.Serializable):
         return get_tibia_url("community", "highscores", world=world, category=category.value, profession=vocation.value,
                              currentpage=page)
 
+    @classmethod
+    def _from_content_lxml(cls, content):
+        """Parses the content of a highscores page using lxml's XPath.
+
+        Parameters
+        ----------
+        content: :class:`str`
+            The HTML content of the page.
+
+        Returns
+        -------
+        :class:`Highscores`
+            The highscores results contained in the page.
+
+        Raises
+        ------
+        InvalidContent
+            If content is not the HTML of a highscore's page.
+        """
+        root = lxml.html.fromstring(content)
+        world = str(root.xpath('string(//select[@name="world"]/option[@selected]/@value)'))
+        category = root.xpath('string(//select[@name="category"]/option[@selected]/@value)')
+        if not world or not category:
+            raise InvalidContent("content does is not from the highscores section of Tibia.com")
+        if world == "ALL":
+            world = None
+        vocation = root.xpath('string(//select[@name="profession"]/option[@selected]/@value)')
+        highscores = cls(world, int(category), vocation=int(vocation) if vocation else 0)
+        last_update = root.xpath('//span[@class="RightArea"]')
+        if last_update:
+            m = numeric_pattern.search(last_update[0].text_content())
+            highscores.last_updated = datetime.timedelta(minutes=int(m.group(1))) if m else datetime.timedelta()
+        table = root.xpath('//table[@class="TableContent"]')
+        if not table:
+            return None
+        _, *rows, info_row = table[0].xpath("./tr")
+        pages_div, results_div = info_row.xpath(".//div")
+        listed_pages = [int(p) for p in pages_div.xpath(".//a/text()")]
+        if listed_pages:
+            highscores.page = next((x for x in range(1, listed_pages[-1] + 1) if x not in listed_pages), 0)
+            highscores.total_pages = max(listed_pages[-1], highscores.page)
+        highscores.results_count = int(results_pattern.search(results_div.text_content()).group(1))
+        for row in rows:
+            values = [c.text_content().replace('\xa0', ' ').strip() for c in row.xpath("./td")]
+            if "There is currently no data" in values[0]:
+                break
+            highscores._add_entry(values)
+        return highscores
+
     @classmethod
     def _parse_tables(cls, parsed_content):
         """
@@ -203,7 +271,17 @@ class Highscores(abc.Serializable):
         cols: :class:`bs4.ResultSet`
             The list of columns for that entry.
         """
-        rank, name, *values = [c.text.replace('\xa0', ' ').strip() for c in cols]
+        self._add_entry([c.text.replace('\xa0', ' ').strip() for c in cols])
+
+    def _add_entry(self, values):
+        """Creates an entry from the text of its columns and adds it to py:attr:`entries`.
+
+        Parameters
+        ----------
+        values: :class:`list` of :class:`str`
+            The text content of every column of the entry.
+        """
+        rank, name, *values = values
         rank = int(rank)
         extra = None
         if self.category == Category.LOYALTY_POINTS:
@@ -254,6 +332,10 @@ class HighscoresEntry(abc.BaseCharacter, abc.Serializable):
         'value',
     )
 
+    _serializable_types = {
+        "vocation": Vocation,
+    }
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} rank={self.rank} name={self.name!r} value={self.value}>"
 
@@ -101,6 +101,15 @@ class House(abc.BaseHouse, abc.HouseWithId, abc.Serializable):
         "auction_end",
     )
 
+    _serializable_types = {
+        "status": HouseStatus,
+        "type": HouseType,
+        "owner_sex": Sex,
+        "paid_until": datetime.datetime,
+        "transfer_date": datetime.datetime,
+        "auction_end": datetime.datetime,
+    }
+
     def __init__(self, name, world=None, **kwargs):
         self.id: int = kwargs.get("id", 0)
         self.name: str = name
@@ -262,6 +271,12 @@ class CharacterHouse(abc.BaseHouse, abc.HouseWithId, abc.Serializable):
         "paid_until_date",
     )
 
+    _serializable_types = {
+        "status": HouseStatus,
+        "type": HouseType,
+        "paid_until_date": datetime.date,
+    }
+
     def __init__(self, _id, name, world=None, town=None, owner=None, paid_until_date=None):
         self.id = int(_id)
         self.name: str = name
@@ -299,6 +314,11 @@ class GuildHouse(abc.BaseHouse, abc.Serializable):
         "paid_until_date",
     )
 
+    _serializable_types = {
+        "status": HouseStatus,
+        "paid_until_date": datetime.date,
+    }
+
     def __init__(self, name, world=None, owner=None, paid_until_date=None):
         self.name: str = name
         self.world: str = world
@@ -351,6 +371,12 @@ class ListedHouse(abc.BaseHouse, abc.HouseWithId, abc.Serializable):
         "highest_bid",
     )
 
+    _serializable_types = {
+        "status": HouseStatus,
+        "type": HouseType,
+        "time_left": datetime.timedelta,
+    }
+
     def __init__(self, name, world, houseid, **kwargs):
         self.name: str = name
         self.id = int(houseid)
@@ -28,6 +28,11 @@ class KillStatistics(abc.Serializable):
         "total",
     )
 
+    _serializable_types = {
+        "entries": {str: "RaceEntry"},
+        "total": "RaceEntry",
+    }
+
     def __init__(self, world, entries=None, total=None):
         self.world: str = world
         self.entries: Dict[str, RaceEntry] = entries or dict()
@@ -57,6 +57,11 @@ class News(abc.BaseNews, abc.Serializable):
         "thread_id",
     )
 
+    _serializable_types = {
+        "category": NewsCategory,
+        "date": datetime.date,
+    }
+
     @property
     def thread_url(self):
         """:class:`str`: The URL to the thread discussing this news entry, if any."""
@@ -150,6 +155,12 @@ class ListedNews(abc.BaseNews, abc.Serializable):
         "type",
     )
 
+    _serializable_types = {
+        "category": NewsCategory,
+        "date": datetime.date,
+        "type": NewsType,
+    }
+
     def __init__(self, news_id, title, news_type, category, date, **kwargs):
         self.id: int = news_id
         self.title: str = title
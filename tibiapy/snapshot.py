@@ -0,0 +1,360 @@
+"""Compact binary encoding to store large amounts of models.
+
+A snapshot starts with a header containing a magic string and the version of the format, followed by a record for
+every model written. Each record is prefixed with its length, so snapshots can be written and read as a stream, using
+any binary file object, including compressed ones such as :func:`gzip.open`.
+
+Snapshots appended to the same file, for example, by opening it in append mode in different runs, are read as a
+single snapshot, since each of them starts with its own header.
+
+Records contain the class name of the model and the values of its dictionary representation, as returned by
+:meth:`Serializable.to_dict`, so models are restored with :meth:`Serializable.from_dict`.
+Short strings, like world names, vocations and enum members, are written once and referenced by index afterwards,
+the same is done for the keys of the dictionaries.
+"""
+import struct
+
+from tibiapy import abc
+
+__all__ = (
+    "SnapshotReader",
+    "SnapshotWriter",
+)
+
+SNAPSHOT_MAGIC = b"TIBIAPY"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<7sB")
+_DOUBLE = struct.Struct("<d")
+
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_NEGATIVE_INT = 4
+_FLOAT = 5
+_STRING = 6
+_STRING_NEW = 7
+_STRING_REF = 8
+_LIST = 9
+_DICT = 10
+_SHAPE_NEW = 11
+_SHAPE_REF = 12
+# Tags from this value onwards represent small integers, stored in the tag itself.
+_SMALL_INT = 32
+_MAX_SMALL_INT = 255 - _SMALL_INT
+
+
+def _write_varint(buffer, value):
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, offset):
+    value = data[offset]
+    offset += 1
+    if value < 0x80:
+        return value, offset
+    value &= 0x7F
+    shift = 7
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class SnapshotWriter:
+    """Writes models to a binary snapshot.
+
+    .. versionadded:: 3.6.0
+
+    Parameters
+    ----------
+    fp:
+        A binary file object to write the snapshot to. The header is written immediately.
+        If the file already contains a snapshot, the new one is appended to it and both are read as one.
+    max_strings: :class:`int`
+        The maximum number of strings that will be stored once and referenced afterwards.
+        Once reached, new strings are written every time they are found.
+    max_string_length: :class:`int`
+        The maximum length of the strings that will be stored once and referenced afterwards.
+    max_shapes: :class:`int`
+        The maximum number of dictionary key sets that will be stored once and referenced afterwards.
+
+    Attributes
+    ----------
+    count: :class:`int`
+        The number of models written.
+    """
+
+    def __init__(self, fp, *, max_strings=65536, max_string_length=128, max_shapes=4096):
+        self.fp = fp
+        self.max_strings = max_strings
+        self.max_string_length = max_string_length
+        self.max_shapes = max_shapes
+        self.count = 0
+        self._strings = {}
+        self._shapes = {}
+        fp.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+
+    def write(self, obj):
+        """Writes a model to the snapshot.
+
+        Parameters
+        ----------
+        obj: :class:`Serializable`
+            The model to write.
+
+        Raises
+        ------
+        TypeError
+            If the object is not a model.
+        """
+        if not isinstance(obj, abc.Serializable):
+            raise TypeError(f"expected a Serializable object, got {obj.__class__.__name__}")
+        record = bytearray()
+        self._write_string(record, obj.__class__.__name__)
+        self._write_value(record, obj.to_dict())
+        prefix = bytearray()
+        _write_varint(prefix, len(record))
+        self.fp.write(prefix + record)
+        self.count += 1
+
+    def write_all(self, objects):
+        """Writes every model of an iterable to the snapshot.
+
+        Parameters
+        ----------
+        objects:
+            An iterable of :class:`Serializable` models.
+        """
+        for obj in objects:
+            self.write(obj)
+
+    def _write_string(self, buffer, value):
+        index = self._strings.get(value)
+        if index is not None:
+            buffer.append(_STRING_REF)
+            _write_varint(buffer, index)
+            return
+        encoded = value.encode()
+        if len(value) <= self.max_string_length and len(self._strings) < self.max_strings:
+            self._strings[value] = len(self._strings)
+            buffer.append(_STRING_NEW)
+        else:
+            buffer.append(_STRING)
+        _write_varint(buffer, len(encoded))
+        buffer += encoded
+
+    def _write_value(self, buffer, value):
+        if value is None:
+            buffer.append(_NONE)
+        elif value is True:
+            buffer.append(_TRUE)
+        elif value is False:
+            buffer.append(_FALSE)
+        elif isinstance(value, str):
+            self._write_string(buffer, value)
+        elif isinstance(value, int):
+            if 0 <= value <= _MAX_SMALL_INT:
+                buffer.append(_SMALL_INT + value)
+            elif value > 0:
+                buffer.append(_INT)
+                _write_varint(buffer, value)
+            else:
+                buffer.append(_NEGATIVE_INT)
+                _write_varint(buffer, -value)
+        elif isinstance(value, float):
+            buffer.append(_FLOAT)
+            buffer += _DOUBLE.pack(value)
+        elif isinstance(value, dict):
+            self._write_dict(buffer, value)
+        elif isinstance(value, list):
+            buffer.append(_LIST)
+            _write_varint(buffer, len(value))
+            for item in value:
+                self._write_value(buffer, item)
+        else:
+            raise TypeError(f"unsupported value of type {value.__class__.__name__}")
+
+    def _write_dict(self, buffer, value):
+        keys = tuple(value)
+        index = self._shapes.get(keys)
+        if index is not None:
+            buffer.append(_SHAPE_REF)
+            _write_varint(buffer, index)
+        else:
+            if len(self._shapes) < self.max_shapes:
+                self._shapes[keys] = len(self._shapes)
+                buffer.append(_SHAPE_NEW)
+            else:
+                buffer.append(_DICT)
+            _write_varint(buffer, len(keys))
+            for key in keys:
+                self._write_value(buffer, key)
+        for item in value.values():
+            self._write_value(buffer, item)
+
+
+class SnapshotReader:
+    """Reads models from a binary snapshot.
+
+    Models are read one at a time, so snapshots bigger than the available memory can be read by iterating over the
+    reader.
+
+    .. versionadded:: 3.6.0
+
+    Parameters
+    ----------
+    fp:
+        A binary file object to read the snapshot from. The header is read immediately.
+
+    Attributes
+    ----------
+    version: :class:`int`
+        The version of the format the snapshot was written with.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a snapshot, or it was written with an unsupported version of the format.
+    """
+
+    _classes = {}
+
+    def __init__(self, fp):
+        self.fp = fp
+        self._read_header(fp.read(_HEADER.size))
+
+    def __iter__(self):
+        while True:
+            obj = self.read()
+            if obj is None:
+                return
+            yield obj
+
+    def read(self):
+        """Reads the next model in the snapshot.
+
+        Returns
+        -------
+        :class:`Serializable`, optional
+            The next model, or :obj:`None` if the end of the snapshot was reached.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot is truncated or contains an unknown class.
+        """
+        length = self._read_length()
+        if length is None:
+            return None
+        record = b""
+        if length == SNAPSHOT_MAGIC[0]:
+            # Records start with the tag of their class name, so they can't start with the rest of the magic string.
+            # This is the header of another snapshot appended to this one, with its own strings and shapes.
+            record = self.fp.read(_HEADER.size - 1)
+            if record.startswith(SNAPSHOT_MAGIC[1:]):
+                self._read_header(SNAPSHOT_MAGIC[:1] + record)
+                return self.read()
+        record += self.fp.read(length - len(record))
+        if len(record) < length:
+            raise ValueError("snapshot is truncated")
+        name, offset = self._read_value(record, 0)
+        value, _ = self._read_value(record, offset)
+        return self._get_class(name).from_dict(value)
+
+    def _read_header(self, header):
+        if len(header) < _HEADER.size or header[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError("file is not a tibia.py snapshot")
+        _, self.version = _HEADER.unpack(header)
+        if self.version > SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported snapshot version {self.version}, expected {SNAPSHOT_VERSION} or older")
+        self._strings = []
+        self._shapes = []
+
+    def _read_length(self):
+        value = 0
+        shift = 0
+        while True:
+            byte = self.fp.read(1)
+            if not byte:
+                if shift:
+                    raise ValueError("snapshot is truncated")
+                return None
+            value |= (byte[0] & 0x7F) << shift
+            if byte[0] < 0x80:
+                return value
+            shift += 7
+
+    @classmethod
+    def _get_class(cls, name):
+        """Gets a model class by its name, looking for new subclasses if it's not known yet."""
+        model = cls._classes.get(name)
+        if model is None:
+            pending = [abc.Serializable]
+            while pending:
+                subclass = pending.pop()
+                cls._classes.setdefault(subclass.__name__, subclass)
+                pending.extend(subclass.__subclasses__())
+            model = cls._classes.get(name)
+            if model is None:
+                raise ValueError(f"unknown class in snapshot: {name!r}")
+        return model
+
+    def _read_value(self, data, offset):
+        tag = data[offset]
+        offset += 1
+        if tag >= _SMALL_INT:
+            return tag - _SMALL_INT, offset
+        if tag == _STRING_REF:
+            index, offset = _read_varint(data, offset)
+            return self._strings[index], offset
+        if tag == _SHAPE_REF or tag == _SHAPE_NEW or tag == _DICT:
+            if tag == _SHAPE_REF:
+                index, offset = _read_varint(data, offset)
+                keys = self._shapes[index]
+            else:
+                count, offset = _read_varint(data, offset)
+                keys = []
+                for _ in range(count):
+                    key, offset = self._read_value(data, offset)
+                    keys.append(key)
+                if tag == _SHAPE_NEW:
+                    self._shapes.append(keys)
+            value = {}
+            for key in keys:
+                value[key], offset = self._read_value(data, offset)
+            return value, offset
+        if tag == _STRING or tag == _STRING_NEW:
+            length, offset = _read_varint(data, offset)
+            value = data[offset:offset + length].decode()
+            if tag == _STRING_NEW:
+                self._strings.append(value)
+            return value, offset + length
+        if tag == _LIST:
+            count, offset = _read_varint(data, offset)
+            value = []
+            for _ in range(count):
+                item, offset = self._read_value(data, offset)
+                value.append(item)
+            return value, offset
+        if tag == _NONE:
+            return None, offset
+        if tag == _TRUE:
+            return True, offset
+        if tag == _FALSE:
+            return False, offset
+        if tag == _INT:
+            return _read_varint(data, offset)
+        if tag == _NEGATIVE_INT:
+            value, offset = _read_varint(data, offset)
+            return -value, offset
+        if tag == _FLOAT:
+            return _DOUBLE.unpack_from(data, offset)[0], offset + _DOUBLE.size
+        raise ValueError(f"invalid value tag {tag} in snapshot")
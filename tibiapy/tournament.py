@@ -59,6 +59,10 @@ class LeaderboardEntry(abc.BaseCharacter, abc.Serializable):
         "score",
     )
 
+    _serializable_types = {
+        "vocation": Vocation,
+    }
+
     def __init__(self, **kwargs):
         self.name = kwargs.get("name")
         self.rank = kwargs.get("rank")
@@ -100,6 +104,11 @@ class ListedTournament(abc.BaseTournament, abc.Serializable):
 
     _serializable_properties = ("duration",)
 
+    _serializable_types = {
+        "start_date": datetime.date,
+        "end_date": datetime.date,
+    }
+
     def __init__(self, title, start_date, end_date, **kwargs):
         self.title = title
         self.start_date = start_date
@@ -216,6 +225,12 @@ class RuleSet(abc.Serializable):
         "shared_xp_bonus",
     )
 
+    _serializable_types = {
+        "pvp_type": PvpType,
+        "daily_tournament_playtime": datetime.timedelta,
+        "total_tournament_playtime": datetime.timedelta,
+    }
+
     def __init__(self, **kwargs):
         self.pvp_type = try_enum(PvpType, kwargs.get("pvp_type"))
         self.daily_tournament_playtime = self._try_parse_interval(kwargs.get("daily_tournament_playtime"))
@@ -343,6 +358,16 @@ class Tournament(abc.BaseTournament, abc.Serializable):
         "rewards_range",
     )
 
+    _serializable_types = {
+        "phase": TournamentPhase,
+        "start_date": datetime.datetime,
+        "end_date": datetime.datetime,
+        "rule_set": RuleSet,
+        "score_set": ScoreSet,
+        "reward_set": [RewardEntry],
+        "archived_tournaments": [ListedTournament],
+    }
+
     def __init__(self, **kwargs):
         self.title = kwargs.get("title")
         self.cycle = kwargs.get("cycle", 0)
@@ -656,6 +681,11 @@ class TournamentLeaderboard(abc.Serializable):
         "total_pages"
     )
 
+    _serializable_types = {
+        "tournament": ListedTournament,
+        "entries": [LeaderboardEntry],
+    }
+
     def __init__(self, **kwargs):
         self.world: str = kwargs.get("world")
         self.tournament: ListedTournament = kwargs.get("tournament")
@@ -9,6 +9,9 @@ from typing import Optional, Tuple, Type, TypeVar, Union
 import bs4
 
 TIBIA_CASH_PATTERN = re.compile(r'(\d*\.?\d*)\s?k*$')
+# Non-void elements written as self-closing, e.g. <div class="BoxFrameHorizontal" />
+SELF_CLOSING_PATTERN = re.compile(r'<((?!(?:area|base|br|col|embed|hr|img|input|link|meta|param|source|track|wbr)\b)'
+                                  r'\w+\b[^<>]*?)\s*/>')
 
 
 def convert_line_breaks(element):
@@ -313,7 +316,8 @@ def try_date(obj) -> Optional[datetime.date]:
     return res
 
 
-def parse_tibiacom_content(content, *, html_class="BoxContent", tag="div", builder="lxml"):
+def parse_tibiacom_content(content, *, html_class="BoxContent", tag="div", builder="lxml", parse_only=None,
+                           fix_self_closing=False):
     """Parses HTML content from Tibia.com into a BeautifulSoup object.
 
     Parameters
@@ -326,14 +330,29 @@ def parse_tibiacom_content(content, *, html_class="BoxContent", tag="div", build
         The HTML tag select. The default value is ``div``.
     builder: :class:`str`
         The builder to use. The default value is ``lxml``.
+    parse_only: :class:`bs4.SoupStrainer`, optional
+        A strainer selecting the elements to parse, used instead of the one built from ``tag`` and ``html_class``.
+        Ignored when using ``html5lib``.
+
+        .. versionadded:: 3.6.0
+    fix_self_closing: :class:`bool`
+        Whether to rewrite non-void elements written as self-closing, such as ``<div />``, as start tags, the same
+        way ``html5lib`` treats them. Only needed for pages containing them, ignored when using ``html5lib``.
+
+        .. versionadded:: 3.6.0
 
     Returns
     -------
     :class:`bs4.BeautifulSoup`, optional
         The parsed content.
     """
-    strainer = bs4.SoupStrainer(tag, class_=html_class) if builder != "html5lib" else None
-    return bs4.BeautifulSoup(content.replace('ISO-8859-1', 'utf-8', 1), builder, parse_only=strainer)
+    strainer = None
+    if builder != "html5lib":
+        strainer = parse_only or bs4.SoupStrainer(tag, class_=html_class)
+    content = content.replace('ISO-8859-1', 'utf-8', 1)
+    if fix_self_closing and builder != "html5lib":
+        content = SELF_CLOSING_PATTERN.sub(r"<\1>", content)
+    return bs4.BeautifulSoup(content, builder, parse_only=strainer)
 
 
 T = TypeVar('T')
@@ -453,6 +472,76 @@ def deprecated(instead=None):
     return actual_decorator
 
 
+class _TrackedList(list):
+    """A list that counts the changes to its existing elements, so values derived from it can be cached.
+
+    The version is incremented every time elements are replaced, removed or reordered. Appending elements doesn't
+    change it, since that can be detected by the length of the list, so appending is as fast as in a regular list.
+    """
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+
+def _track_changes(name):
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def tracked(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    return tracked
+
+
+for _name in ("__setitem__", "__delitem__", "__imul__", "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_TrackedList, _name, _track_changes(_name))
+
+
+class _TrackedListsMixin:
+    """Mixin for models whose list attributes are converted to :class:`_TrackedList` when assigned.
+
+    The names of the attributes are defined in ``_tracked_lists``.
+    """
+    __slots__ = ()
+
+    _tracked_lists = ()
+
+    def __setattr__(self, name, value):
+        if name in self._tracked_lists and value is not None and not isinstance(value, _TrackedList):
+            value = _TrackedList(value)
+        super().__setattr__(name, value)
+
+
+def _cached_by_list(attribute, copy=None):
+    """Decorator for methods deriving a value from a list attribute, caching the value until the list changes.
+
+    The attribute must be tracked by :class:`_TrackedListsMixin`. The list is considered changed if it's replaced,
+    its length changes or its version changes, so checking the cache takes constant time.
+
+    Parameters
+    ----------
+    attribute: :class:`str`
+        The name of the list attribute the value is derived from.
+    copy: :class:`callable`, optional
+        A function to copy the cached value before returning it, so the cache can't be modified by the caller.
+    """
+    def actual_decorator(func):
+        name = func.__name__
+
+        @functools.wraps(func)
+        def decorated(self):
+            values = getattr(self, attribute)
+            cache = self.__dict__.setdefault("_cached_views", {})
+            cached = cache.get(name)
+            if cached is None or cached[0] is not values or cached[1] != values.version or cached[2] != len(values):
+                cached = cache[name] = (values, values.version, len(values), func(self))
+            return copy(cached[3]) if copy else cached[3]
+        return decorated
+    return actual_decorator
+
+
 def parse_popup(popup_content):
     """Parses the information popups used through Tibia.com.
 
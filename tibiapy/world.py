@@ -1,3 +1,4 @@
+import datetime
 import re
 from collections import OrderedDict
 from typing import List
@@ -8,8 +9,8 @@ from tibiapy import abc
 from tibiapy.character import OnlineCharacter
 from tibiapy.enums import PvpType, TournamentWorldType, TransferType, WorldLocation
 from tibiapy.errors import InvalidContent
-from tibiapy.utils import get_tibia_url, parse_integer, parse_tibia_datetime, parse_tibia_full_date, \
-    parse_tibiacom_content, try_date, try_datetime, try_enum
+from tibiapy.utils import _cached_by_list, _TrackedListsMixin, get_tibia_url, parse_integer, parse_tibia_datetime, \
+    parse_tibia_full_date, parse_tibiacom_content, try_date, try_datetime, try_enum
 
 __all__ = (
     "ListedWorld",
@@ -64,6 +65,14 @@ class ListedWorld(abc.BaseWorld, abc.Serializable):
         "transfer_type"
     )
 
+    _serializable_types = {
+        "location": WorldLocation,
+        "pvp_type": PvpType,
+        "transfer_type": TransferType,
+        "battleye_date": datetime.date,
+        "tournament_world_type": TournamentWorldType,
+    }
+
     def __init__(self, name, location=None, pvp_type=None, **kwargs):
         self.name: str = name
         self.location = try_enum(WorldLocation, location)
@@ -190,6 +199,16 @@ class World(abc.BaseWorld, abc.Serializable):
         "online_players"
     )
 
+    _serializable_types = {
+        "record_date": datetime.datetime,
+        "location": WorldLocation,
+        "pvp_type": PvpType,
+        "transfer_type": TransferType,
+        "battleye_date": datetime.date,
+        "tournament_world_type": TournamentWorldType,
+        "online_players": [OnlineCharacter],
+    }
+
     def __init__(self, name, location=None, pvp_type=None, **kwargs):
         self.name: str = name
         self.location = try_enum(WorldLocation, location)
@@ -356,7 +375,7 @@ class World(abc.BaseWorld, abc.Serializable):
     # endregion
 
 
-class WorldOverview(abc.Serializable):
+class WorldOverview(_TrackedListsMixin, abc.Serializable):
     """Container class for the World Overview section.
 
     Attributes
@@ -374,8 +393,15 @@ class WorldOverview(abc.Serializable):
         "worlds",
     )
 
+    _serializable_types = {
+        "record_date": datetime.datetime,
+        "worlds": ["ListedWorld"],
+    }
+
     serializable_properties = ('total_online',)
 
+    _tracked_lists = ("worlds",)
+
     def __init__(self, **kwargs):
         self.record_count: int = kwargs.get("record_count", 0)
         self.record_date = try_datetime(kwargs.get("record_date"))
@@ -385,11 +411,13 @@ class WorldOverview(abc.Serializable):
         return f"<{self.__class__.__name__} total_online={self.total_online:d}>"
 
     @property
+    @_cached_by_list("worlds")
     def total_online(self):
         """:class:`int`: Total players online across all worlds."""
         return sum(w.online_count for w in self.worlds)
 
     @property
+    @_cached_by_list("worlds", copy=list)
     def tournament_worlds(self):
         """:class:`list` of :class:`GuildMember`: List of tournament worlds.
 
@@ -397,6 +425,7 @@ class WorldOverview(abc.Serializable):
         return [w for w in self.worlds if w.tournament_world_type is not None]
 
     @property
+    @_cached_by_list("worlds", copy=list)
     def regular_worlds(self):
         """:class:`list` of :class:`ListedWorld`: List of worlds that are not tournament worlds."""
         return [w for w in self.worlds if w.tournament_world_type is None]